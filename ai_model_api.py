@@ -1,12 +1,30 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, has_request_context, request, jsonify
 import pandas as pd
 import numpy as np
 import joblib
-import re
+import json
+import os
+import hmac
+import threading
+from functools import wraps
 from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.cluster import KMeans
 import logging
+from label_encoding import compile_encoders
+from job_matcher import JobMatcher
+from job_search import FILTER_FIELDS, JobSearchIndex
+from skill_graph import SkillGraph
+from skillset import SkillVocabulary
+from skill_index import (assign_skill_clusters, build_cluster_skill_index, load_skill_matrix,
+                         skill_matrix, skill_matrix_path, skill_vocabulary, split_skills)
+from model_bundle import (ENCODER_FILES, MANIFEST_FILE, MODEL_FILES, open_bundle,
+                          legacy_artifacts_hash, resolve_bundle_dir)
+from model_reloader import ModelReloader, file_stamp
+from compiled_forest import CompiledForest
+from response_cache import create_response_cache
+from micro_batcher import MicroBatcher
+from salary_parser import parse_salary, parse_salary_column
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -14,72 +32,434 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Code used for categories the encoders have never seen. Negative values
+# make unknown labels an error; a valid class code maps them onto that class.
+app.config['UNKNOWN_LABEL_CODE'] = -1
+# Directory of a versioned artifact bundle (see model_bundle.py), or an
+# artifacts directory whose LATEST file names one (see train_models.py).
+# When unset the legacy pickle files and CSV in the working directory are loaded.
+app.config['MODEL_BUNDLE'] = None
+app.config['BUNDLE_VERIFY'] = False
+# Preprocessed job dataset: the legacy CSV or the Parquet output of preprocess.py
+app.config['JOBS_DATA'] = 'preprocessed_it_jobs.csv'
+# Demand model inference engine: 'sklearn' or 'compiled' (see compiled_forest.py)
+app.config['INFERENCE_ENGINE'] = 'sklearn'
+# Response cache for the deterministic endpoints: 'memory', 'sqlite' or 'off'
+app.config['RESPONSE_CACHE'] = 'memory'
+app.config['RESPONSE_CACHE_SIZE'] = 1024
+app.config['RESPONSE_CACHE_TTL'] = 300
+app.config['RESPONSE_CACHE_PATH'] = 'response_cache.db'
+# Coalesce concurrent /predict_demand calls into one predict (0 disables)
+app.config['MICRO_BATCH_WINDOW_MS'] = 0
+app.config['MICRO_BATCH_MAX_ROWS'] = 64
+# A row not predicted by its batch within this long is predicted on its own
+app.config['MICRO_BATCH_TIMEOUT_MS'] = 1000
+# Default /recommend_skills method: 'cluster' (KMeans cluster frequency) or
+# 'graph' (skill co-occurrence, see skill_graph.py) weighted by 'pmi', 'lift' or 'count'
+app.config['SKILL_RECOMMENDER'] = 'cluster'
+app.config['SKILL_GRAPH_MEASURE'] = 'pmi'
+# Hot reload: token for POST /admin/reload (unset disables the endpoint),
+# seconds between artifact file checks (0 disables the watch), rows used to
+# warm a new model set up, and how long the old set's batcher stays open
+app.config['ADMIN_TOKEN'] = None
+app.config['MODEL_WATCH_INTERVAL'] = 0
+app.config['WARMUP_ROWS'] = 8
+app.config['RELOAD_DRAIN_SECONDS'] = 5
+app.config.from_prefixed_env()
+
 # Global variables to store models and encoders
-models = {}
-encoders = {}
+response_cache = None
+model_reloader = None
+
+# Batch scoring settings
+BATCH_CHUNK_SIZE = 5000
+REQUIRED_FIELDS = ['Job_Title', 'Location', 'Experience_Level', 'Salary_Range']
+CATEGORICAL_FIELDS = [
+    ('Job_Title', 'le_job'),
+    ('Location', 'le_location'),
+    ('Experience_Level', 'le_experience'),
+]
+RECOMMEND_METHODS = ('cluster', 'graph')
+# Indexes built from the job x skill matrix at load time
+SKILL_INDEXES = ('cluster_skills', 'skill_graph', 'job_matcher')
+MATCH_FIELDS = ['Job_ID', 'Job_Title', 'Location', 'Experience_Level', 'Salary_Range']
+SEARCH_MAX_RESULTS = 100
+JSONL_MIMETYPES = ('application/x-ndjson', 'application/jsonl', 'application/x-jsonlines')
+
+class ModelArtifacts:
+    """One complete set of models, encoders and derived lookup tables
+
+    A set is built and warmed up on its own and then published with a
+    single reference swap, so a request that took a snapshot keeps using
+    a consistent set even when a reload lands while it runs.
+    """
+    
+    def __init__(self, models=None, encoders=None, lookups=None, info=None):
+        self.models = models if models is not None else {}
+        self.encoders = encoders if encoders is not None else {}
+        self.lookups = lookups if lookups is not None else {}
+        self.info = info if info is not None else {}
+        self.batcher = None
+
+def active_artifacts():
+    """The artifact set pinned to the current request, or the latest published one"""
+    if has_request_context() and 'artifacts' in g:
+        return g.artifacts
+    return current
+
+# The published artifact set, plus module-level aliases of its parts
+current = ModelArtifacts()
+models, encoders, lookups, model_info = current.models, current.encoders, current.lookups, current.info
+demand_batcher = None
+
+def load_legacy_models(artifacts):
+    """Load the pickled models, encoders and CSV from the working directory"""
+    models, encoders = artifacts.models, artifacts.encoders
+    models['rf_model'] = joblib.load('job_forecasting_model.pkl')
+    models['kmeans'] = joblib.load('skill_clustering_model.pkl')
+    
+    encoders['le_job'] = joblib.load('job_encoder.pkl')
+    encoders['le_location'] = joblib.load('location_encoder.pkl')
+    encoders['le_experience'] = joblib.load('experience_encoder.pkl')
+    encoders['mlb'] = joblib.load('skills_binarizer.pkl')
+    encoders['le_demand'] = joblib.load('demand_encoder.pkl')
+    
+    # Load preprocessed data
+    data_file = app.config['JOBS_DATA']
+    if data_file.endswith('.parquet'):
+        models['df_it'] = pd.read_parquet(data_file)
+    else:
+        models['df_it'] = pd.read_csv(data_file)
+    
+    # Sparse job x skill matrix written next to the dataframe by preprocess.py
+    matrix_file = skill_matrix_path(data_file)
+    if os.path.exists(matrix_file):
+        models['skill_matrix'] = load_skill_matrix(matrix_file)
+    
+    artifacts.info['version'] = legacy_artifacts_hash(data_file=data_file)
+    artifacts.info['source'] = 'pickle'
+
+def build_artifacts():
+    """Load models and encoders and build every derived index, without publishing them"""
+    if app.config['MODEL_BUNDLE']:
+        # Bundle components are only read from disk on first use
+        bundle_dir = resolve_bundle_dir(app.config['MODEL_BUNDLE'])
+        models, encoders, manifest = open_bundle(bundle_dir, verify=app.config['BUNDLE_VERIFY'])
+        artifacts = ModelArtifacts(models, encoders,
+                                   info={'version': manifest['bundle_hash'], 'source': bundle_dir})
+    else:
+        artifacts = ModelArtifacts()
+        load_legacy_models(artifacts)
+    models, encoders, lookups = artifacts.models, artifacts.encoders, artifacts.lookups
+    
+    # Compile label lookup tables so requests never call LabelEncoder.transform
+    lookups.update(compile_encoders(encoders, app.config['UNKNOWN_LABEL_CODE']))
+    lookups['skills'] = skill_vocabulary(encoders['mlb'])
+    
+    engine = app.config['INFERENCE_ENGINE']
+    if engine == 'compiled':
+        models['rf_engine'] = CompiledForest.from_sklearn(models['rf_model'])
+    elif engine != 'sklearn':
+        raise ValueError(f"Unknown inference engine: {engine}")
+    
+    # Sparse job x skill matrix, unless a stored copy matches the data
+    # (bundles already carry the indexes built from it)
+    if any(name not in models for name in SKILL_INDEXES):
+        expected_shape = (len(models['df_it']), len(lookups['skills']))
+        if 'skill_matrix' not in models or models['skill_matrix'].shape != expected_shape:
+            models['skill_matrix'] = skill_matrix(
+                models['df_it']['Skills_Required'].map(split_skills), lookups['skills'])
+    
+    # Precompute the ranked skill frequency table of every cluster
+    if 'cluster_skills' not in models:
+        if 'Skill_Cluster' not in models['df_it']:
+            models['df_it']['Skill_Cluster'] = assign_skill_clusters(
+                models['skill_matrix'], models['kmeans'])
+        models['cluster_skills'] = build_cluster_skill_index(
+            models['skill_matrix'], models['df_it']['Skill_Cluster'], lookups['skills'])
+    
+    # Cluster rankings as interned skill IDs for bitset filtering
+    lookups['skillset'] = SkillVocabulary.from_mlb(encoders['mlb'])
+    lookups['cluster_skill_ids'] = {
+        cluster: lookups['skillset'].ids_of(ranked)
+        for cluster, ranked in models['cluster_skills'].items()}
+    
+    # Skill co-occurrence graph for method='graph' recommendations
+    if 'skill_graph' not in models:
+        models['skill_graph'] = SkillGraph(models['skill_matrix'], lookups['skills'],
+                                           measure=app.config['SKILL_GRAPH_MEASURE'])
+    
+    # MinHash-LSH index of job skill sets for /match_jobs
+    if 'job_matcher' not in models:
+        models['job_matcher'] = JobMatcher(models['skill_matrix'], lookups['skills'])
+    
+    # BM25 full-text index of titles, skills and education for /search_jobs
+    if 'job_search' not in models:
+        models['job_search'] = JobSearchIndex(models['df_it'])
+    
+    # Each set batches with its own model, so queued rows finish on the version they started on
+    if app.config['MICRO_BATCH_WINDOW_MS']:
+        artifacts.batcher = MicroBatcher(
+            lambda features: demand_model(artifacts).predict(features),
+            max_batch_size=app.config['MICRO_BATCH_MAX_ROWS'],
+            max_wait=app.config['MICRO_BATCH_WINDOW_MS'] / 1000)
+    
+    return artifacts
+
+def warm_up(artifacts, rows=None):
+    """Exercise every serving path of an unpublished artifact set
+
+    Pulls lazy bundle components into memory and runs a few predictions,
+    recommendations and matches, so the first real requests after a swap
+    pay no loading cost. Raises if any path fails.
+    """
+    rows = rows or app.config['WARMUP_ROWS']
+    for group in (artifacts.models, artifacts.encoders):
+        for name in list(group):
+            group[name]
+    
+    sample = artifacts.models['df_it'].head(rows)
+    records = sample[REQUIRED_FIELDS].to_dict('records')
+    results = score_records(records, artifacts=artifacts)
+    if records and not any(result['Status'] == 'Success' for result in results):
+        raise ValueError(f"Warm-up scoring failed: {results[0].get('error')}")
+    for record, result in zip(records, results):
+        if result['Status'] == 'Success':
+            codes = [artifacts.lookups[name].encode(record[field]) for field, name in CATEGORICAL_FIELDS]
+            demand_model(artifacts).predict([codes + [extract_salary_lower(record['Salary_Range']), 1]])
+    
+    for skills in sample['Skills_Required'].map(split_skills):
+        for method in RECOMMEND_METHODS:
+            recommend_skills(skills, method=method, artifacts=artifacts)
+        match_jobs(skills, artifacts=artifacts)
+    for title in sample['Job_Title']:
+        search_jobs(title, artifacts=artifacts)
+
+def publish(artifacts):
+    """Make an artifact set the one new requests use"""
+    global current, models, encoders, lookups, model_info, demand_batcher
+    previous = current
+    current = artifacts
+    # Module-level aliases for scripts and entry points that read them
+    models, encoders, lookups, model_info = (
+        artifacts.models, artifacts.encoders, artifacts.lookups, artifacts.info)
+    demand_batcher = artifacts.batcher
+    
+    # Requests still holding the old set may yet submit to its batcher;
+    # stop it once they have had time to finish
+    if previous.batcher is not None:
+        threading.Timer(app.config['RELOAD_DRAIN_SECONDS'], previous.batcher.close).start()
+    logger.info(f"Serving model version {artifacts.info['version'][:12]} from {artifacts.info['source']}")
+
+def reload_models():
+    """Build, warm up and publish a fresh artifact set (used by the reloader)"""
+    artifacts = build_artifacts()
+    warm_up(artifacts)
+    publish(artifacts)
+    return artifacts.info['version']
+
+def artifact_fingerprint():
+    """Cheap change marker of the artifact files the next reload would read"""
+    if app.config['MODEL_BUNDLE']:
+        bundle_dir = resolve_bundle_dir(app.config['MODEL_BUNDLE'])
+        paths = [os.path.join(bundle_dir, MANIFEST_FILE)]
+    else:
+        data_file = app.config['JOBS_DATA']
+        paths = ([*MODEL_FILES.values(), *ENCODER_FILES.values(), data_file,
+                  skill_matrix_path(data_file)])
+    return tuple(file_stamp(path) for path in paths)
 
 def load_models():
     """Load all trained models and encoders"""
+    global response_cache, model_reloader
     try:
-        models['rf_model'] = joblib.load('job_forecasting_model.pkl')
-        models['kmeans'] = joblib.load('skill_clustering_model.pkl')
+        if response_cache is None:
+            response_cache = create_response_cache(
+                app.config['RESPONSE_CACHE'],
+                max_entries=app.config['RESPONSE_CACHE_SIZE'],
+                ttl=app.config['RESPONSE_CACHE_TTL'],
+                path=app.config['RESPONSE_CACHE_PATH'])
         
-        encoders['le_job'] = joblib.load('job_encoder.pkl')
-        encoders['le_location'] = joblib.load('location_encoder.pkl')
-        encoders['le_experience'] = joblib.load('experience_encoder.pkl')
-        encoders['mlb'] = joblib.load('skills_binarizer.pkl')
-        encoders['le_demand'] = joblib.load('demand_encoder.pkl')
+        publish(build_artifacts())
         
-        # Load preprocessed data
-        models['df_it'] = pd.read_csv('preprocessed_it_jobs.csv')
+        if model_reloader is None:
+            model_reloader = ModelReloader(reload_models, artifact_fingerprint,
+                                           interval=app.config['MODEL_WATCH_INTERVAL'])
+        start_model_watcher()
         
-        logger.info("All models and encoders loaded successfully")
+        logger.info(f"All models and encoders loaded successfully (version {model_info['version'][:12]})")
         return True
     except Exception as e:
         logger.error(f"Error loading models: {str(e)}")
         return False
 
+def start_model_watcher():
+    """Start polling the artifact files, if MODEL_WATCH_INTERVAL is set
+
+    Threads do not survive fork, so pre-forking servers call this again
+    in every worker (see gunicorn.conf.py).
+    """
+    if model_reloader is not None and app.config['MODEL_WATCH_INTERVAL']:
+        model_reloader.start_watching()
+
+def demand_model(artifacts=None):
+    """Return the configured demand inference engine"""
+    models = (artifacts or active_artifacts()).models
+    return models['rf_engine'] if 'rf_engine' in models else models['rf_model']
+
 def extract_salary_lower(salary_range):
     """Extract lower bound of salary range"""
-    if isinstance(salary_range, str):
-        lower = re.match(r'(\d+)', salary_range)
-        return int(lower.group(1)) if lower else np.nan
-    return np.nan
+    return parse_salary(salary_range)['Salary_Lower']
+
+def extract_salary_lower_column(salary_ranges):
+    """Extract lower bound of salary range for a whole column"""
+    return parse_salary_column(salary_ranges)['Salary_Lower'].to_numpy()
+
+def score_records(records, chunk_size=BATCH_CHUNK_SIZE, artifacts=None):
+    """Predict job demand for a list of records, keeping input order"""
+    artifacts = artifacts or active_artifacts()
+    lookups = artifacts.lookups
+    results = [None] * len(records)
+    valid_index = []
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            results[i] = {'Index': i, 'Status': 'Error', 'error': 'Record must be a JSON object'}
+        elif not all(field in record for field in REQUIRED_FIELDS):
+            missing = [field for field in REQUIRED_FIELDS if field not in record]
+            results[i] = {'Index': i, 'Status': 'Error',
+                          'error': f"Missing required fields: {', '.join(missing)}"}
+        else:
+            valid_index.append(i)
+    
+    if not valid_index:
+        return results
+    
+    frame = pd.DataFrame([records[i] for i in valid_index], index=valid_index)
+    if 'Month' not in frame:
+        frame['Month'] = 1
+    
+    # Encode categorical columns as whole arrays
+    columns = [
+        (field, lookups[name].encode_many(frame[field]), lookups[name])
+        for field, name in CATEGORICAL_FIELDS
+    ]
+    salary_lower = extract_salary_lower_column(frame['Salary_Range'])
+    month = pd.to_numeric(frame['Month'].fillna(1), errors='coerce').to_numpy(dtype=float)
+    
+    bad = np.isnan(salary_lower) | np.isnan(month)
+    for _, codes, lookup in columns:
+        bad |= ~lookup.is_known_many(codes)
+    
+    # Per-row errors, only for the rows that failed
+    for position in np.flatnonzero(bad):
+        i = valid_index[position]
+        errors = [f"Unknown {field}: {frame.at[i, field]}"
+                  for field, codes, lookup in columns if not lookup.is_known(codes[position])]
+        if np.isnan(salary_lower[position]):
+            errors.append(f"Invalid Salary_Range: {frame.at[i, 'Salary_Range']}")
+        if np.isnan(month[position]):
+            errors.append(f"Invalid Month: {frame.at[i, 'Month']}")
+        results[i] = {'Index': i, 'Status': 'Error', 'error': '; '.join(errors)}
+    
+    ok = ~bad
+    
+    features = np.column_stack([codes for _, codes, _ in columns] + [salary_lower, month])[ok]
+    scored_index = np.asarray(valid_index)[ok]
+    rf_model = demand_model(artifacts)
+    
+    # One predict_proba call per chunk
+    for start in range(0, len(features), chunk_size):
+        chunk = features[start:start + chunk_size]
+        proba = rf_model.predict_proba(chunk)
+        predictions = rf_model.classes_[np.argmax(proba, axis=1)]
+        demand = lookups['le_demand'].decode_many(predictions)
+        for offset, i in enumerate(scored_index[start:start + chunk_size]):
+            results[i] = {
+                'Index': int(i),
+                'Demand_Level': demand[offset],
+                'Prediction_Score': float(predictions[offset]),
+                'Confidence': float(proba[offset].max()),
+                'Status': 'Success'
+            }
+    
+    return results
+
+def parse_batch_records():
+    """Read batch records from a JSON array or JSONL request body"""
+    if request.mimetype in JSONL_MIMETYPES:
+        records = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                records.append(None)
+        return records
+    
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('records')
+    return data if isinstance(data, list) else None
 
-def recommend_skills(user_skills, top_n=5):
+def recommend_skills(user_skills, top_n=5, method='cluster', artifacts=None):
     """Recommend skills based on user's current skills"""
     if not user_skills or not isinstance(user_skills, list):
         return []
     
+    artifacts = artifacts or active_artifacts()
+    models, lookups = artifacts.models, artifacts.lookups
     try:
-        # Transform user skills
-        user_skills_vector = encoders['mlb'].transform([user_skills])
+        if method == 'graph':
+            # Personalized: skills that co-occur most with the user's own
+            return models['skill_graph'].recommend(user_skills, top_n)
+        
+        # Transform user skills into a sparse 1 x vocabulary row
+        user_skills_vector = skill_matrix([user_skills], lookups['skills'])
         
         # Predict cluster
         cluster = models['kmeans'].predict(user_skills_vector)[0]
         
-        # Get jobs in the same cluster
-        cluster_jobs = models['df_it'][models['df_it']['Skill_Cluster'] == cluster]
-        
-        # Get common skills in this cluster
-        all_skills = []
-        for skills_str in cluster_jobs['Skills_Required']:
-            if isinstance(skills_str, str) and skills_str != 'Unknown':
-                skills_list = [s.strip() for s in skills_str.split(',')]
-                all_skills.extend(skills_list)
-        
-        # Count skill frequencies
-        skill_counts = pd.Series(all_skills).value_counts()
+        # Look up the precomputed skill ranking of this cluster
+        vocabulary = lookups['skillset']
+        ranked_ids = lookups['cluster_skill_ids'].get(int(cluster), np.empty(0, dtype=np.intp))
         
-        # Filter out skills user already has
-        recommended_skills = [skill for skill in skill_counts.index 
-                            if skill not in user_skills][:top_n]
+        # Filter out skills user already has with one bitset membership test
+        owned = vocabulary.pack(user_skills)
+        recommended_skills = vocabulary.names(ranked_ids[~owned.has_ids(ranked_ids)][:max(top_n, 0)])
         
         return recommended_skills
     except Exception as e:
         logger.error(f"Error recommending skills: {str(e)}")
         return []
 
+def match_jobs(user_skills, top_k=5, artifacts=None):
+    """Find the jobs closest to the user's skills, with the skills each one is missing"""
+    if not user_skills or not isinstance(user_skills, list):
+        return []
+    
+    models = (artifacts or active_artifacts()).models
+    results = models['job_matcher'].match(user_skills, top_k)
+    jobs = models['df_it']
+    fields = [field for field in MATCH_FIELDS if field in jobs]
+    # to_dict gives plain Python values that jsonify can serialize
+    matches = jobs[fields].iloc[[row for row, _, _ in results]].to_dict('records')
+    for match, (_, similarity, missing_skills) in zip(matches, results):
+        match['Similarity'] = round(similarity, 4)
+        match['Missing_Skills'] = missing_skills
+    return matches
+
+def search_jobs(query, limit=20, prefix=True, filters=None, artifacts=None):
+    """Full-text search of the jobs, best BM25 score first"""
+    models = (artifacts or active_artifacts()).models
+    results = models['job_search'].search(query, limit, prefix, filters)
+    jobs = models['df_it']
+    fields = [field for field in MATCH_FIELDS if field in jobs]
+    found = jobs[fields].iloc[[row for row, _ in results]].to_dict('records')
+    for job, (_, score) in zip(found, results):
+        job['Score'] = round(score, 4)
+    return found
+
 def get_industry_predictions(industry, years=2):
     """Get AI predictions for specific industry"""
     try:
@@ -164,8 +544,38 @@ def get_industry_predictions(industry, years=2):
         logger.error(f"Error getting industry predictions: {str(e)}")
         return []
 
+def cached_response(view):
+    """Serve a deterministic endpoint from the response cache
+
+    Keys combine the endpoint, the canonical request body and the model
+    version, so a new model never serves stale answers. Only successful
+    responses are stored.
+    """
+    @wraps(view)
+    def wrapper():
+        if response_cache is None:
+            return view()
+        
+        key = response_cache.make_key(request.path, request.get_json(silent=True),
+                                      active_artifacts().info.get('version'))
+        cached = response_cache.get(key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+        
+        response = view()
+        if isinstance(response, Response) and response.status_code == 200:
+            response_cache.set(key, response.get_data(as_text=True))
+        return response
+    return wrapper
+
+@app.before_request
+def pin_artifacts():
+    """Serve the whole request from the artifact set published when it arrived"""
+    g.artifacts = current
+
 # API Routes
 @app.route('/predict_demand', methods=['POST'])
+@cached_response
 def predict_demand():
     """Predict job demand based on input parameters"""
     try:
@@ -176,18 +586,33 @@ def predict_demand():
         if not all(field in data for field in required_fields):
             return jsonify({'error': 'Missing required fields'}), 400
         
-        # Prepare features
-        features = [[
-            encoders['le_job'].transform([data['Job_Title']])[0],
-            encoders['le_location'].transform([data['Location']])[0],
-            encoders['le_experience'].transform([data['Experience_Level']])[0],
-            extract_salary_lower(data['Salary_Range']),
-            data.get('Month', 1)
-        ]]
+        # Prepare features with precomputed lookup tables
+        artifacts = active_artifacts()
+        lookups = artifacts.lookups
+        codes = [lookups[name].encode(data[field]) for field, name in CATEGORICAL_FIELDS]
+        unknown = [f"{field}: {data[field]}" for (field, name), code in zip(CATEGORICAL_FIELDS, codes)
+                   if not lookups[name].is_known(code)]
+        if unknown:
+            return jsonify({'error': 'Unknown category', 'details': ', '.join(unknown)}), 400
+        
+        # Same checks as score_records, so both endpoints reject the same input
+        salary_lower = extract_salary_lower(data['Salary_Range'])
+        month = pd.to_numeric(pd.Series([data.get('Month', 1)]).fillna(1), errors='coerce').iloc[0]
+        invalid = [f"{field}: {data.get(field)}" for field, value in
+                   (('Salary_Range', salary_lower), ('Month', month)) if np.isnan(value)]
+        if invalid:
+            return jsonify({'error': 'Invalid value', 'details': ', '.join(invalid)}), 400
         
-        # Make prediction
-        prediction = models['rf_model'].predict(features)[0]
-        demand = encoders['le_demand'].inverse_transform([prediction])[0]
+        features = [codes + [salary_lower, float(month)]]
+        
+        # Make prediction, sharing one predict call with concurrent requests
+        batcher = artifacts.batcher
+        if batcher is not None and not batcher.closed:
+            prediction = batcher.predict(features[0],
+                                         timeout=app.config['MICRO_BATCH_TIMEOUT_MS'] / 1000)
+        else:
+            prediction = demand_model(artifacts).predict(features)[0]
+        demand = lookups['le_demand'].decode(prediction)
         
         return jsonify({
             'Demand_Level': demand,
@@ -199,7 +624,30 @@ def predict_demand():
         logger.error(f"Error in predict_demand: {str(e)}")
         return jsonify({'error': 'Prediction failed', 'details': str(e)}), 500
 
+@app.route('/predict_demand/batch', methods=['POST'])
+def predict_demand_batch():
+    """Predict job demand for a batch of records (JSON array or JSONL)"""
+    try:
+        records = parse_batch_records()
+        if records is None:
+            return jsonify({'error': 'Request body must be a JSON array, {"records": [...]} or JSONL'}), 400
+        
+        results = score_records(records)
+        errors = sum(1 for result in results if result['Status'] != 'Success')
+        
+        return jsonify({
+            'Results': results,
+            'Count': len(results),
+            'Errors': errors,
+            'Status': 'Success'
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in predict_demand_batch: {str(e)}")
+        return jsonify({'error': 'Batch prediction failed', 'details': str(e)}), 500
+
 @app.route('/recommend_skills', methods=['POST'])
+@cached_response
 def recommend_skills_endpoint():
     """Recommend skills based on user's current skills"""
     try:
@@ -210,12 +658,17 @@ def recommend_skills_endpoint():
         
         user_skills = data['skills']
         top_n = data.get('top_n', 5)
+        method = data.get('method', app.config['SKILL_RECOMMENDER'])
+        if method not in RECOMMEND_METHODS:
+            return jsonify({'error': 'Unknown recommendation method',
+                            'details': f"method must be one of {list(RECOMMEND_METHODS)}"}), 400
         
-        recommended_skills = recommend_skills(user_skills, top_n)
+        recommended_skills = recommend_skills(user_skills, top_n, method)
         
         return jsonify({
             'Recommended_Skills': recommended_skills,
             'User_Skills': user_skills,
+            'Method': method,
             'Status': 'Success'
         })
     
@@ -223,7 +676,60 @@ def recommend_skills_endpoint():
         logger.error(f"Error in recommend_skills: {str(e)}")
         return jsonify({'error': 'Skill recommendation failed', 'details': str(e)}), 500
 
+@app.route('/match_jobs', methods=['POST'])
+@cached_response
+def match_jobs_endpoint():
+    """Match the user's skills against every job and report the skill gaps"""
+    try:
+        data = request.json
+        
+        if 'skills' not in data:
+            return jsonify({'error': 'Skills field is required'}), 400
+        
+        user_skills = data['skills']
+        top_k = data.get('top_k', 5)
+        
+        matches = match_jobs(user_skills, top_k)
+        
+        return jsonify({
+            'Matches': matches,
+            'User_Skills': user_skills,
+            'Status': 'Success'
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in match_jobs: {str(e)}")
+        return jsonify({'error': 'Job matching failed', 'details': str(e)}), 500
+
+@app.route('/search_jobs', methods=['POST'])
+@cached_response
+def search_jobs_endpoint():
+    """Search job titles, skills and education; prefix matching suits typeahead"""
+    try:
+        data = request.json
+        
+        query = data.get('query')
+        if not isinstance(query, str):
+            return jsonify({'error': 'Query field is required'}), 400
+        
+        limit = min(int(data.get('limit', 20)), SEARCH_MAX_RESULTS)
+        prefix = bool(data.get('prefix', True))
+        filters = {field: data[field] for field in FILTER_FIELDS if data.get(field) is not None}
+        
+        results = search_jobs(query, limit, prefix, filters)
+        
+        return jsonify({
+            'Results': results,
+            'Query': query,
+            'Status': 'Success'
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in search_jobs: {str(e)}")
+        return jsonify({'error': 'Job search failed', 'details': str(e)}), 500
+
 @app.route('/industry_predictions', methods=['POST'])
+@cached_response
 def industry_predictions():
     """Get AI predictions for specific industry"""
     try:
@@ -251,12 +757,42 @@ def industry_predictions():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
+    artifacts = active_artifacts()
     return jsonify({
         'status': 'healthy',
-        'models_loaded': len(models) > 0,
-        'encoders_loaded': len(encoders) > 0
+        'models_loaded': len(artifacts.models) > 0,
+        'encoders_loaded': len(artifacts.encoders) > 0,
+        'model_version': artifacts.info.get('version'),
+        'model_source': artifacts.info.get('source'),
+        'response_cache': response_cache.stats() if response_cache else None,
+        'micro_batching': artifacts.batcher.stats() if artifacts.batcher else None,
+        'model_reload': model_reloader.status() if model_reloader else None
     })
 
+@app.route('/admin/reload', methods=['GET', 'POST'])
+def admin_reload():
+    """Reload the model artifacts in the background (GET reports progress)"""
+    token = app.config['ADMIN_TOKEN']
+    given = request.headers.get('X-Admin-Token', '')
+    if not token or not hmac.compare_digest(given.encode(), str(token).encode()):
+        return jsonify({'error': 'Forbidden'}), 403
+    if model_reloader is None:
+        return jsonify({'error': 'Models are not loaded'}), 503
+    
+    if request.method == 'GET':
+        return jsonify(model_reloader.status())
+    
+    data = request.get_json(silent=True) or {}
+    wait = bool(data.get('wait', False))
+    if not model_reloader.reload(wait=wait):
+        return jsonify({'error': 'A reload is already in progress',
+                        'details': model_reloader.status()}), 409
+    
+    status = model_reloader.status()
+    if wait and status['state'] == 'failed':
+        return jsonify({'error': 'Reload failed', 'details': status}), 500
+    return jsonify(status), 200 if wait else 202
+
 @app.route('/', methods=['GET'])
 def home():
     """Home endpoint"""
@@ -265,9 +801,13 @@ def home():
         'version': '1.0.0',
         'endpoints': [
             '/predict_demand',
+            '/predict_demand/batch',
             '/recommend_skills',
+            '/match_jobs',
+            '/search_jobs',
             '/industry_predictions',
-            '/health'
+            '/health',
+            '/admin/reload'
         ]
     })
 
@@ -0,0 +1,161 @@
+"""ASGI entry point for the model API with bounded concurrency.
+
+Serves the same Flask routes, but every request runs on a bounded thread
+or process pool. When all workers are busy and the wait queue is full the
+server answers 429 straight away instead of queueing without limit, and
+every request gets a deadline (504 when it is exceeded).
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+Settings (environment variables, read through the Flask config):
+    FLASK_ASGI_EXECUTOR     'thread' (default) or 'process'
+    FLASK_ASGI_MAX_WORKERS  pool size, defaults to the CPU count
+    FLASK_ASGI_MAX_QUEUE    requests allowed to wait for a worker
+    FLASK_ASGI_TIMEOUT      per-request deadline in seconds
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+import ai_model_api
+
+logger = logging.getLogger(__name__)
+
+config = ai_model_api.app.config
+config.setdefault('ASGI_EXECUTOR', 'thread')
+config.setdefault('ASGI_MAX_WORKERS', os.cpu_count() or 1)
+config.setdefault('ASGI_MAX_QUEUE', 64)
+config.setdefault('ASGI_TIMEOUT', 5.0)
+
+
+def _init_process_worker():
+    """Load models in a pool process unless they were inherited through fork"""
+    if not ai_model_api.models and not ai_model_api.load_models():
+        raise RuntimeError("Failed to load models")
+
+
+def call_wsgi(method, path, query_string, headers, body):
+    """Run one request through the Flask app, returning (status, headers, body)"""
+    environ = EnvironBuilder(method=method, path=path, query_string=query_string,
+                             headers=headers, data=body).get_environ()
+    app_iter, status, response_headers = run_wsgi_app(ai_model_api.app, environ)
+    try:
+        data = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    return int(status.split(' ', 1)[0]), list(response_headers.items()), data
+
+
+class BoundedASGIApp:
+    """ASGI adapter that runs the WSGI app on a bounded worker pool"""
+
+    def __init__(self, executor='thread', max_workers=4, max_queue=64, timeout=5.0):
+        if executor == 'process':
+            self.executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_process_worker)
+        elif executor == 'thread':
+            self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                               thread_name_prefix='model-api')
+        else:
+            raise ValueError(f"Unknown ASGI executor: {executor}")
+        self.capacity = max_workers + max_queue
+        self.timeout = timeout
+        # Counts requests until their pool job actually finishes, so work
+        # abandoned after a deadline still holds its slot
+        self.in_flight = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            await self._send_json(send, 429, {'error': 'Server busy, retry later'},
+                                  [(b'retry-after', b'1')])
+            return
+
+        headers = [(name.decode('latin-1'), value.decode('latin-1'))
+                   for name, value in scope['headers']]
+        # ASGI hands over the raw query bytes; EnvironBuilder wants a str
+        query_string = scope.get('query_string', b'').decode('latin-1')
+        self.in_flight += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, call_wsgi, scope['method'], scope['path'],
+                                      query_string, headers, body)
+        future.add_done_callback(self._release)
+
+        try:
+            status, response_headers, data = await asyncio.wait_for(
+                asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            await self._send_json(send, 504, {'error': 'Request deadline exceeded',
+                                              'timeout_seconds': self.timeout})
+            return
+        except Exception as e:
+            logger.error(f"Error in ASGI request: {str(e)}")
+            await self._send_json(send, 500, {'error': 'Request failed', 'details': str(e)})
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                        for name, value in response_headers],
+        })
+        await send({'type': 'http.response.body', 'body': data})
+
+    def _release(self, future):
+        self.in_flight -= 1
+
+    @staticmethod
+    async def _send_json(send, status, payload, extra_headers=()):
+        data = json.dumps(payload).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'),
+                        (b'content-length', str(len(data)).encode())] + list(extra_headers),
+        })
+        await send({'type': 'http.response.body', 'body': data})
+
+
+if not ai_model_api.load_models():
+    raise RuntimeError("Failed to load models")
+
+app = BoundedASGIApp(
+    executor=config['ASGI_EXECUTOR'],
+    max_workers=int(config['ASGI_MAX_WORKERS']),
+    max_queue=int(config['ASGI_MAX_QUEUE']),
+    timeout=float(config['ASGI_TIMEOUT']),
+)
@@ -0,0 +1,68 @@
+"""Compare single-row latency of sklearn and the compiled forest engine.
+
+Also checks that both engines give identical probabilities on the
+preprocessed dataset and on random inputs.
+
+    python benchmarks/bench_forest_inference.py --rows 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from compiled_forest import CompiledForest  # noqa: E402
+
+
+def random_features(rf, df, n_rows, seed=0):
+    """Random feature rows spanning the ranges seen in the training data"""
+    rng = np.random.default_rng(seed)
+    columns = rf.feature_names_in_ if hasattr(rf, 'feature_names_in_') else df.columns[:rf.n_features_in_]
+    return np.column_stack([
+        rng.integers(int(df[column].min()), int(df[column].max()) + 1, n_rows)
+        for column in columns
+    ]).astype(float)
+
+
+def latency_ms(model, rows):
+    timings = np.empty(len(rows))
+    for i in range(len(rows)):
+        start = time.perf_counter()
+        model.predict(rows[i:i + 1])
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, [50, 99]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    args = parser.parse_args()
+
+    rf = joblib.load('job_forecasting_model.pkl')
+    df = pd.read_csv('preprocessed_it_jobs.csv')
+    start = time.perf_counter()
+    compiled = CompiledForest.from_sklearn(rf)
+    print(f"compiled {compiled.n_trees} trees, {len(compiled.feature)} nodes "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rows = random_features(rf, df, args.rows)
+    dataset = df[list(rf.feature_names_in_)].to_numpy(dtype=float)
+    for name, X in (('dataset', dataset), ('random', rows)):
+        identical = np.array_equal(rf.predict_proba(X), compiled.predict_proba(X))
+        print(f"{name:>8}: {len(X)} rows, identical probabilities: {identical}")
+
+    print(f"{'engine':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, model in (('sklearn', rf), ('compiled', compiled)):
+        p50, p99 = latency_ms(model, rows)
+        print(f"{name:>8} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Compare MinHash-LSH job matching with a brute-force Jaccard scan.
+
+Builds synthetic job catalogues of increasing size (jobs drawn from role
+templates, so skill sets overlap the way real postings do) and times
+top-k queries against both. Recall is the share of the exact top-k
+similarity mass that the LSH results recover. The matcher is built with
+exact_threshold=0 so even the smallest catalogue goes through LSH.
+
+    python benchmarks/bench_job_matching.py --sizes 1000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from job_matcher import JobMatcher  # noqa: E402
+
+
+def synthetic_jobs(n_jobs, vocabulary_size=2000, n_roles=400, seed=0):
+    """Job x skill CSR matrix where each job samples skills from a role"""
+    rng = np.random.default_rng(seed)
+    roles = [rng.choice(vocabulary_size, 8, replace=False) for _ in range(n_roles)]
+    role_of_job = rng.integers(0, n_roles, n_jobs)
+    rows, columns = [], []
+    for job, role in enumerate(role_of_job):
+        skills = rng.choice(roles[role], rng.integers(3, 7), replace=False)
+        extra = rng.integers(0, vocabulary_size, rng.integers(0, 2))
+        skills = np.union1d(skills, extra)
+        rows.append(np.full(len(skills), job))
+        columns.append(skills)
+    rows, columns = np.concatenate(rows), np.concatenate(columns)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, columns)),
+                             shape=(n_jobs, vocabulary_size)), roles
+
+
+def brute_force(matrix, sizes, columns, top_k):
+    """Exact Jaccard against every job row, the linear-scan baseline"""
+    query = np.zeros(matrix.shape[1])
+    query[columns] = 1.0
+    intersection = matrix @ query
+    similarity = intersection / (sizes + len(columns) - intersection)
+    top = np.argpartition(-similarity, top_k - 1)[:top_k]
+    return np.sort(similarity[top])[::-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--top-k', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>9} {'sets':>9} {'build s':>8} {'lsh ms':>8} {'brute ms':>9} "
+          f"{'candidates':>10} {'recall':>7}")
+    for n_jobs in args.sizes:
+        matrix, roles = synthetic_jobs(n_jobs)
+        vocabulary = pd.Index([f"skill{i}" for i in range(matrix.shape[1])])
+        start = time.perf_counter()
+        matcher = JobMatcher(matrix, vocabulary, exact_threshold=0)
+        build = time.perf_counter() - start
+        sizes = np.diff(matrix.indptr)
+
+        # Users hold part of a role's skills plus an unrelated one
+        rng = np.random.default_rng(1)
+        queries = [np.union1d(rng.choice(roles[rng.integers(len(roles))], 3, replace=False),
+                              rng.integers(0, matrix.shape[1], 1))
+                   for _ in range(args.queries)]
+
+        lsh_time = brute_time = 0.0
+        recall, candidates = [], []
+        for columns in queries:
+            skills = vocabulary[columns].tolist()
+            start = time.perf_counter()
+            found = matcher.match(skills, args.top_k)
+            lsh_time += time.perf_counter() - start
+            start = time.perf_counter()
+            exact = brute_force(matrix, sizes, columns, args.top_k)
+            brute_time += time.perf_counter() - start
+            candidates.append(len(matcher.candidates(matcher.skill_ids(skills))))
+            recall.append(sum(score for _, score, _ in found) / exact.sum() if exact.sum() else 1.0)
+
+        print(f"{n_jobs:>9,} {matcher.n_sets:>9,} {build:>8.2f} "
+              f"{lsh_time / len(queries) * 1000:>8.3f} {brute_time / len(queries) * 1000:>9.3f} "
+              f"{np.mean(candidates):>10.0f} {np.mean(recall):>7.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Time full-text job search over growing job catalogues.
+
+Catalogues are resampled from the preprocessed dataset, with a random
+extra skill on 30% of the postings so the searched text is not just
+copies of the original rows. Reports index build time, the number of
+distinct documents and the mean latency of typeahead-style queries, with
+and without a location filter.
+
+    python benchmarks/bench_job_search.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from job_search import JobSearchIndex  # noqa: E402
+from skill_index import split_skills  # noqa: E402
+
+QUERIES = ['data sci', 'pyth', 'py', 'machine learning', 'kubernetes', 'react devel',
+           'engineer', 'bachelor comp', 'cloud', 's']
+
+
+def synthetic_jobs(base, n_jobs, seed=0):
+    rng = np.random.default_rng(seed)
+    jobs = base.iloc[rng.integers(0, len(base), n_jobs)].reset_index(drop=True)
+    skills = sorted({skill for value in base['Skills_Required'] for skill in split_skills(value)})
+    extra = rng.choice(skills, n_jobs)
+    add = rng.random(n_jobs) < 0.3
+    jobs.loc[add, 'Skills_Required'] = jobs.loc[add, 'Skills_Required'] + ', ' + extra[add]
+    return jobs
+
+
+def mean_ms(index, queries, repeat, **kwargs):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            index.search(query, 10, **kwargs)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data', default=os.path.join(ROOT, 'preprocessed_it_jobs.csv'))
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    base = pd.read_csv(args.data)
+    location = base['Location'].mode()[0]
+    print(f"{'jobs':>9} {'docs':>7} {'build s':>8} {'query ms':>9} {'filtered ms':>12}")
+    for n_jobs in args.sizes:
+        jobs = synthetic_jobs(base, n_jobs)
+        start = time.perf_counter()
+        index = JobSearchIndex(jobs)
+        build = time.perf_counter() - start
+        plain = mean_ms(index, QUERIES, args.repeat)
+        filtered = mean_ms(index, QUERIES, args.repeat, filters={'Location': location})
+        print(f"{n_jobs:>9,} {index.n_docs:>7,} {build:>8.2f} {plain:>9.3f} {filtered:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Throughput and tail latency of /predict_demand with and without micro-batching.
+
+Fires bursts of concurrent single-row requests from a thread pool at the
+Flask app and reports requests/sec, p50/p99 latency and the mean batch
+size the coalescer achieved.
+
+    python benchmarks/bench_micro_batching.py --threads 32 --requests 4000
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import ai_model_api  # noqa: E402
+from micro_batcher import MicroBatcher  # noqa: E402
+
+
+def make_requests(n, seed=0):
+    rng = np.random.default_rng(seed)
+    titles = ['Software Engineer', 'Data Analyst', 'Data Scientist', 'DevOps Engineer', 'Web Developer']
+    locations = ['Colombo', 'Kandy', 'Galle', 'Jaffna', 'Matara']
+    levels = ['Entry-level', 'Mid-level', 'Senior-level']
+    return [{
+        'Job_Title': str(rng.choice(titles)),
+        'Location': str(rng.choice(locations)),
+        'Experience_Level': str(rng.choice(levels)),
+        'Salary_Range': f"{int(rng.integers(50, 300)) * 1000}-{int(rng.integers(300, 500)) * 1000}",
+    } for _ in range(n)]
+
+
+def run(bodies, threads):
+    client = ai_model_api.app.test_client()
+
+    def call(body):
+        start = time.perf_counter()
+        response = client.post('/predict_demand', json=body)
+        assert response.status_code == 200, response.json
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = np.fromiter(pool.map(call, bodies), dtype=float)
+    elapsed = time.perf_counter() - start
+    return len(bodies) / elapsed, np.percentile(latencies, [50, 99]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--window-ms', type=float, default=2.0)
+    parser.add_argument('--max-rows', type=int, default=64)
+    args = parser.parse_args()
+
+    # Measure the model, not the response cache
+    ai_model_api.app.config['RESPONSE_CACHE'] = 'off'
+    if not ai_model_api.load_models():
+        raise SystemExit("Failed to load models")
+    bodies = make_requests(args.requests)
+
+    print(f"{'mode':>10} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'batch':>6}")
+    ai_model_api.current.batcher = None
+    throughput, (p50, p99) = run(bodies, args.threads)
+    print(f"{'direct':>10} {throughput:>9.0f} {p50:>8.2f} {p99:>8.2f} {1:>6}")
+
+    batcher = MicroBatcher(lambda features: ai_model_api.demand_model().predict(features),
+                           max_batch_size=args.max_rows, max_wait=args.window_ms / 1000)
+    ai_model_api.current.batcher = batcher
+    throughput, (p50, p99) = run(bodies, args.threads)
+    print(f"{'batched':>10} {throughput:>9.0f} {p50:>8.2f} {p99:>8.2f} "
+          f"{batcher.stats()['mean_batch_size']:>6}")
+    batcher.close()
+
+
+if __name__ == '__main__':
+    main()
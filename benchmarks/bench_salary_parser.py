@@ -0,0 +1,42 @@
+"""Time the vectorized salary parser on a million-row column.
+
+    python benchmarks/bench_salary_parser.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from salary_parser import parse_salary_column  # noqa: E402
+
+FORMATS = ['150000-200000', 'LKR 350,000-800,000', '$70K-120K', '$70K - $120K',
+           'Rs. 50,000 to 80,000', '€40k – €60k', '1.2M', '90000 LKR', '70-120k']
+
+
+def timed(label, values):
+    start = time.perf_counter()
+    parsed = parse_salary_column(values)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {len(values):,} rows in {elapsed:.3f} s "
+          f"({parsed['Salary_Lower'].notna().mean():.1%} parsed)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    timed('mixed formats, repeated', rng.choice(FORMATS, args.rows))
+    lows = rng.integers(50, 900, args.rows) * 1000
+    timed('realistic (900 ranges)', [f"{low}-{low + 50000}" for low in lows])
+    timed('every value unique', [f"LKR {i:,}-{i + 50000:,}" for i in range(args.rows)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Report memory per API worker with and without preloading before fork.
+
+Forks N workers the way gunicorn does, has each one serve a few requests,
+then reads /proc/<pid>/smaps_rollup while all workers are alive so PSS
+(proportional set size) splits shared pages fairly between them.
+
+    python benchmarks/bench_worker_rss.py --workers 4
+    FLASK_MODEL_BUNDLE=artifacts/current python benchmarks/bench_worker_rss.py
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import ai_model_api  # noqa: E402
+
+SAMPLE_REQUEST = {
+    'Job_Title': 'Software Engineer',
+    'Location': 'Colombo',
+    'Experience_Level': 'Mid-level',
+    'Salary_Range': '150000-200000',
+}
+
+
+def memory_usage_mb(pid='self'):
+    """Read RSS/PSS/private/shared memory of a process in MB"""
+    usage = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                usage[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return {
+        'rss': usage.get('Rss', 0.0),
+        'pss': usage.get('Pss', 0.0),
+        'private': usage.get('Private_Clean', 0.0) + usage.get('Private_Dirty', 0.0),
+        'shared': usage.get('Shared_Clean', 0.0) + usage.get('Shared_Dirty', 0.0),
+    }
+
+
+def worker(preloaded, requests, ready, results, done):
+    if not preloaded and not ai_model_api.load_models():
+        raise SystemExit("Failed to load models")
+
+    client = ai_model_api.app.test_client()
+    for _ in range(requests):
+        client.post('/predict_demand', json=SAMPLE_REQUEST)
+        client.post('/recommend_skills', json={'skills': ['Python', 'SQL']})
+
+    ready.wait()
+    results.put((os.getpid(), memory_usage_mb()))
+    done.wait()
+
+
+def run(mode, workers, requests):
+    context = multiprocessing.get_context('fork')
+    preloaded = mode == 'preload'
+    if preloaded:
+        import wsgi  # noqa: F401  loads every model and calls gc.freeze()
+
+    ready = context.Barrier(workers)
+    done = context.Event()
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(preloaded, requests, ready, results, done))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    rows = [results.get() for _ in processes]
+    done.set()
+    for process in processes:
+        process.join()
+    return memory_usage_mb(), sorted(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--mode', choices=['preload', 'per-worker'], default=None,
+                        help='run one mode only (each mode needs a fresh interpreter)')
+    args = parser.parse_args()
+
+    if args.mode is None:
+        # Run every mode in its own interpreter so they do not share state
+        for mode in ('per-worker', 'preload'):
+            context = multiprocessing.get_context('spawn')
+            process = context.Process(target=report, args=(mode, args.workers, args.requests))
+            process.start()
+            process.join()
+    else:
+        report(args.mode, args.workers, args.requests)
+
+
+def report(mode, workers, requests):
+    parent, rows = run(mode, workers, requests)
+    print(f"\n== {mode}: {workers} workers (parent RSS {parent['rss']:.1f} MB)")
+    print(f"{'pid':>8} {'RSS MB':>9} {'PSS MB':>9} {'private MB':>11} {'shared MB':>10}")
+    for pid, usage in rows:
+        print(f"{pid:>8} {usage['rss']:>9.1f} {usage['pss']:>9.1f} "
+              f"{usage['private']:>11.1f} {usage['shared']:>10.1f}")
+    total_pss = sum(usage['pss'] for _, usage in rows)
+    total_private = sum(usage['private'] for _, usage in rows)
+    print(f"{'total':>8} {'':>9} {total_pss:>9.1f} {total_private:>11.1f}")
+    print(f"private memory added per worker: {total_private / workers:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
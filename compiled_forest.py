@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class CompiledForest:
+    """RandomForestClassifier flattened into contiguous numpy node arrays
+
+    All trees are stored back to back. Leaves point to themselves with an
+    infinite threshold, so every row can walk every tree for max_depth steps
+    without branching on leaves. Predictions match sklearn exactly: inputs
+    are rounded to float32 like sklearn does, leaf values are normalized per
+    tree and accumulated tree by tree in the same order. Missing values
+    (NaN) follow each split's missing_go_to_left, as in sklearn.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, classes,
+                 missing_left=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = (missing_left if missing_left is not None
+                             else np.zeros(len(feature), dtype=bool))
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = classes
+        self.n_features_in_ = None
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """Flatten a fitted single-output RandomForestClassifier"""
+        if getattr(forest, 'n_outputs_', 1) != 1:
+            raise ValueError("Only single-output forests can be compiled")
+
+        features, thresholds, lefts, rights, missing_lefts, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            node_ids = np.arange(n_nodes) + offset
+            is_leaf = tree.children_left == -1
+
+            feature = np.where(is_leaf, 0, tree.feature)
+            threshold = np.where(is_leaf, np.inf, tree.threshold)
+            left = np.where(is_leaf, node_ids, tree.children_left + offset)
+            right = np.where(is_leaf, node_ids, tree.children_right + offset)
+            missing_left = ~is_leaf & (tree.missing_go_to_left != 0)
+
+            # Same normalization as DecisionTreeClassifier.predict_proba
+            value = tree.value[:, 0, :forest.n_classes_].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+
+            features.append(feature)
+            thresholds.append(threshold)
+            lefts.append(left)
+            rights.append(right)
+            missing_lefts.append(missing_left)
+            values.append(value / normalizer)
+            roots.append(offset)
+            offset += n_nodes
+
+        compiled = cls(
+            feature=np.ascontiguousarray(np.concatenate(features), dtype=np.intp),
+            threshold=np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64),
+            left=np.ascontiguousarray(np.concatenate(lefts), dtype=np.intp),
+            right=np.ascontiguousarray(np.concatenate(rights), dtype=np.intp),
+            missing_left=np.ascontiguousarray(np.concatenate(missing_lefts), dtype=bool),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=max(e.tree_.max_depth for e in forest.estimators_),
+            classes=forest.classes_,
+        )
+        compiled.n_features_in_ = forest.n_features_in_
+        return compiled
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """Leaf node index of every row in every tree, shape (n_rows, n_trees)"""
+        # sklearn compares float32 inputs against float64 thresholds
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.repeat(self.roots[None, :], len(X), axis=0)
+        has_missing = np.isnan(X).any()
+        for _ in range(self.max_depth):
+            values = X[rows, self.feature[nodes]]
+            go_left = values <= self.threshold[nodes]
+            if has_missing:
+                # NaN compares False; route it the way the split learned
+                go_left = np.where(np.isnan(values), self.missing_left[nodes], go_left)
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        leaf_values = self.value[self.apply(X)]
+        # Reduce over the tree axis; a strided reduction adds the trees one
+        # after another, the same order sklearn accumulates them in
+        return np.add.reduce(leaf_values, axis=1) / self.n_trees
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
@@ -3,6 +3,7 @@ import streamlit as st
 from pages import home, industries, about, login, signup
 import sqlite3
 import hashlib
+import db
 
 # Page configuration
 st.set_page_config(
@@ -13,13 +14,14 @@ st.set_page_config(
 )
 
 # Database setup
+DB_PATH = 'career_nexus.db'
+
 def init_database():
     """Initialize the database with required tables"""
-    conn = sqlite3.connect('career_nexus.db')
-    cursor = conn.cursor()
-    
-    # Users table with username column
-    cursor.execute('''
+    # Created once per process; every later call is a no-op
+    db.get_pool(DB_PATH).ensure_schema(
+        # Users table with username column
+        '''
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username VARCHAR(255) UNIQUE NOT NULL,
@@ -29,10 +31,9 @@ def init_database():
             last_name VARCHAR(100),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-    
-    # Industries table
-    cursor.execute('''
+    ''',
+        # Industries table
+        '''
         CREATE TABLE IF NOT EXISTS industries (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name VARCHAR(255) NOT NULL,
@@ -42,10 +43,9 @@ def init_database():
             job_count INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-    
-    # Jobs table
-    cursor.execute('''
+    ''',
+        # Jobs table
+        '''
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title VARCHAR(255) NOT NULL,
@@ -59,10 +59,9 @@ def init_database():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (industry_id) REFERENCES industries(id)
         )
-    ''')
-    
-    # User preferences table
-    cursor.execute('''
+    ''',
+        # User preferences table
+        '''
         CREATE TABLE IF NOT EXISTS user_preferences (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id INTEGER,
@@ -74,9 +73,6 @@ def init_database():
             FOREIGN KEY (user_id) REFERENCES users(id)
         )
     ''')
-    
-    conn.commit()
-    conn.close()
 
 # Initialize session state
 def init_session_state():
@@ -99,37 +95,22 @@ def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 def verify_user(username, password):
-    conn = sqlite3.connect('career_nexus.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    result = db.get_pool(DB_PATH).query_one('''
         SELECT id, username, password_hash FROM users 
         WHERE username = ? OR email = ?
     ''', (username, username))
     
-    result = cursor.fetchone()
-    conn.close()
-    
     if result and result[2] == hash_password(password):
         return {'id': result[0], 'username': result[1]}
     return None
 
 def create_user(username, email, password, first_name, last_name):
-    conn = sqlite3.connect('career_nexus.db')
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('''
+        return db.get_pool(DB_PATH).execute('''
             INSERT INTO users (username, email, password_hash, first_name, last_name)
             VALUES (?, ?, ?, ?, ?)
         ''', (username, email, hash_password(password), first_name, last_name))
-        
-        conn.commit()
-        user_id = cursor.lastrowid
-        conn.close()
-        return user_id
     except sqlite3.IntegrityError:
-        conn.close()
         return None
 
 # Custom CSS
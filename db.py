@@ -0,0 +1,151 @@
+"""Pooled SQLite access for the Streamlit apps.
+
+Every database file gets one ConnectionPool per process (get_pool), so
+Streamlit reruns and concurrent sessions reuse open connections instead
+of reconnecting on every call. Connections are opened in WAL mode, so
+readers never block the writer or each other. Each connection keeps its
+own cache of prepared statements keyed by SQL text, so callers should
+pass the same SQL string every time with the values as parameters.
+
+Writes run in BEGIN IMMEDIATE transactions: the write lock is taken up
+front and waits out busy_timeout, instead of failing with "database is
+locked" when a read transaction tries to upgrade mid-way.
+"""
+import hashlib
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# cache_size is negative KiB, i.e. a 16 MB page cache per connection
+PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """Thread-safe pool of up to `size` connections to one SQLite file"""
+
+    def __init__(self, path, size=8, timeout=5.0, cached_statements=256, pragmas=None):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.pragmas = {**PRAGMAS, **(pragmas or {})}
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._schemas = set()
+
+    def _connect(self):
+        # Autocommit mode: transactions are begun explicitly in transaction()
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                               check_same_thread=False, cached_statements=self.cached_statements)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name}={value}')
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"No free connection to {self.path} after {self.timeout} s") from None
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; it goes back to the pool on exit"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection inside a write transaction, committed on success"""
+        with self.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def query(self, sql, params=()):
+        """All rows of a read query"""
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql, params=()):
+        """First row of a read query, or None"""
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def execute(self, sql, params=()):
+        """Run one write statement in its own transaction; returns lastrowid"""
+        with self.transaction() as conn:
+            return conn.execute(sql, params).lastrowid
+
+    def ensure_schema(self, *statements):
+        """Run CREATE ... IF NOT EXISTS statements once per pool"""
+        key = hashlib.sha256('\0'.join(statements).encode()).hexdigest()
+        if key in self._schemas:
+            return
+        with self.transaction() as conn:
+            for statement in statements:
+                conn.execute(statement)
+        self._schemas.add(key)
+
+    def close(self):
+        """Close the idle connections"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+    def stats(self):
+        return {'path': self.path, 'size': self.size, 'open': self._opened,
+                'idle': self._idle.qsize()}
+
+
+def get_pool(path, **kwargs):
+    """The process-wide pool for a database file, created on first use"""
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = ConnectionPool(path, **kwargs)
+        return pool
+
+
+def close_all():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
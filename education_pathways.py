@@ -0,0 +1,105 @@
+"""Education pathway lookup by skill keyword.
+
+Pathways are keyed by category and then by keyword. A pathway applies to
+a skill when its keyword occurs anywhere in the skill name, ignoring case:
+"Cloud" matches "Cloud Computing" and "AWS" matches "AWS Lambda".
+Checking every keyword against every skill costs skills x keywords
+substring tests. PathwayIndex builds one Aho-Corasick automaton over all
+the keywords instead, so each skill name is scanned once, character by
+character, no matter how large the pathway catalog grows:
+
+    index = PathwayIndex(EDUCATION_PATHWAYS)
+    index.resolve(['Python', 'AWS'])
+    # {'Degree Programs': [('BSc in Computer Science', 'Python')], ...}
+"""
+from collections import deque
+
+EDUCATION_PATHWAYS = {
+    'Degree Programs': {
+        'Python': 'BSc in Computer Science',
+        'Java': 'BSc in Software Engineering',
+        'Machine Learning': 'BSc in Data Science',
+        'SQL': 'BSc in Information Technology',
+        'Cloud': 'BSc in Cloud Computing'
+    },
+    'Professional Certifications': {
+        'AWS': 'AWS Certified Solutions Architect',
+        'Azure': 'Microsoft Azure Fundamentals',
+        'Python': 'Python Professional Certification',
+        'Java': 'Oracle Certified Professional',
+        'Security': 'CompTIA Security+'
+    },
+    'Short Courses': {
+        'Web Development': 'Full Stack Development Bootcamp',
+        'Data Science': 'Data Science Specialization',
+        'DevOps': 'DevOps Engineering Course',
+        'UI/UX': 'UI/UX Design Bootcamp',
+        'Agile': 'Agile Project Management'
+    }
+}
+
+
+class PathwayIndex:
+    """Aho-Corasick automaton over the keywords of a pathway catalog"""
+
+    def __init__(self, pathways=None):
+        pathways = EDUCATION_PATHWAYS if pathways is None else pathways
+        self.categories = list(pathways)
+        # Every (category, keyword) in catalog order; a keyword shared by
+        # several categories is one pattern with several entries
+        self.entries = []
+        self._goto = [{}]
+        self._outputs = [[]]
+        for category, keywords in pathways.items():
+            for keyword, pathway in keywords.items():
+                state = 0
+                for char in keyword.lower():
+                    if char not in self._goto[state]:
+                        self._goto.append({})
+                        self._outputs.append([])
+                        self._goto[state][char] = len(self._goto) - 1
+                    state = self._goto[state][char]
+                self._outputs[state].append(len(self.entries))
+                self.entries.append((category, keyword, pathway))
+
+        # Failure links, breadth first so a state's link is final before
+        # its children use it; outputs inherit those of the link
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                link = self._fail[state]
+                while link and char not in self._goto[link]:
+                    link = self._fail[link]
+                self._fail[child] = self._goto[link].get(char, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+                queue.append(child)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def match(self, skill):
+        """Indices into entries of every keyword occurring in skill, in catalog order"""
+        found = set()
+        state = 0
+        for char in skill.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._outputs[state])
+        return sorted(found)
+
+    def resolve(self, skills):
+        """Matching pathways of a skill set, grouped by category
+
+        Returns {category: [(pathway, skill), ...]} with every category
+        present, skills in the order given and, per skill, pathways in
+        catalog order. Repeated skills are resolved once.
+        """
+        resolved = {category: [] for category in self.categories}
+        for skill in dict.fromkeys(skills):
+            for entry in self.match(skill):
+                category, _, pathway = self.entries[entry]
+                resolved[category].append((pathway, skill))
+        return resolved
@@ -0,0 +1,17 @@
+# Gunicorn settings for the model API: gunicorn -c gunicorn.conf.py wsgi:app
+import multiprocessing
+import os
+
+bind = os.environ.get('API_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('API_WORKERS', multiprocessing.cpu_count()))
+
+# Import wsgi.py (and load the models) once in the master, then fork
+preload_app = True
+
+
+def post_fork(server, worker):
+    # The artifact file watch thread (MODEL_WATCH_INTERVAL) does not survive
+    # fork; every worker polls and hot-reloads its own copy. The micro-batcher
+    # starts its own thread on first use in each worker.
+    import ai_model_api
+    ai_model_api.start_model_watcher()
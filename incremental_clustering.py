@@ -0,0 +1,233 @@
+"""Incremental refits of the skill clusterer with mini-batch KMeans.
+
+skill_clustering_model.pkl is a full-batch KMeans, and refitting it means
+holding the whole binarized job x skill matrix in memory. This module
+streams a preprocessed dataset in chunks instead: every chunk is turned
+into a sparse skill matrix and fed to MiniBatchKMeans.partial_fit in
+mini-batches, starting from the current model's centers. A second pass
+predicts Skill_Cluster for every row and writes the dataset back out
+chunk by chunk, so memory is bounded by the chunk size, not the corpus:
+
+    python incremental_clustering.py --data preprocessed_it_jobs.parquet \\
+        --model skill_clustering_model.pkl --out preprocessed_it_jobs_clustered.parquet \\
+        --model-out skill_clustering_model.pkl --compare 50000
+
+--compare fits a full KMeans on a uniform sample of the stream and reports
+inertia, silhouette and the adjusted Rand index between the two labelings,
+so the mini-batch model can be checked before it replaces the full one.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from scipy import sparse
+from sklearn import config_context
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import adjusted_rand_score, silhouette_score
+
+from skill_index import skill_matrix, skill_vocabulary, split_skills
+
+logger = logging.getLogger(__name__)
+
+SKILLS_COLUMN = 'Skills_Required'
+CLUSTER_COLUMN = 'Skill_Cluster'
+
+
+def read_chunks(data_file, chunk_size=50000, columns=None):
+    """Yield dataframe chunks of a preprocessed CSV or parquet file"""
+    if data_file.endswith('.parquet'):
+        for batch in pq.ParquetFile(data_file).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(data_file, chunksize=chunk_size, usecols=columns)
+
+
+def skill_chunks(data_file, vocabulary, chunk_size=50000):
+    """Yield the job x skill matrix of a dataset one chunk of rows at a time"""
+    for frame in read_chunks(data_file, chunk_size, columns=[SKILLS_COLUMN]):
+        yield skill_matrix(frame[SKILLS_COLUMN].map(split_skills), vocabulary)
+
+
+class RowSample:
+    """Uniform random sample of rows from a stream of sparse chunks
+
+    Every row gets a random key and the n_rows smallest keys are kept, so
+    the sample never holds more than n_rows plus one chunk.
+    """
+
+    def __init__(self, n_rows, seed=42):
+        self.n_rows = n_rows
+        self.matrix = None
+        self._keys = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, matrix):
+        if not self.n_rows:
+            return
+        keys = np.concatenate([self._keys, self._rng.random(matrix.shape[0])])
+        merged = matrix if self.matrix is None else sparse.vstack([self.matrix, matrix]).tocsr()
+        keep = np.sort(np.argsort(keys, kind='stable')[:self.n_rows])
+        self.matrix, self._keys = merged[keep], keys[keep]
+
+
+def minibatch_model(kmeans=None, n_clusters=8, batch_size=4096, seed=42):
+    """MiniBatchKMeans that continues from a fitted model's centers
+
+    Without a model the centers come from k-means++ on the first batch.
+    """
+    if kmeans is not None:
+        return MiniBatchKMeans(n_clusters=kmeans.n_clusters, init=kmeans.cluster_centers_,
+                               n_init=1, batch_size=batch_size, random_state=seed)
+    return MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, random_state=seed)
+
+
+def partial_fit_chunks(model, chunks, batch_size=4096, sample=None, seed=42):
+    """Update a MiniBatchKMeans with every chunk, one mini-batch at a time
+
+    Rows are shuffled inside each chunk so sorted datasets still give
+    representative batches. Returns the number of rows seen.
+    """
+    rng = np.random.default_rng(seed)
+    rows = 0
+    for matrix in chunks:
+        if sample is not None:
+            sample.add(matrix)
+        matrix = matrix[rng.permutation(matrix.shape[0])]
+        for start in range(0, matrix.shape[0], batch_size):
+            batch = matrix[start:start + batch_size]
+            # The first call initializes the centers and needs k rows
+            if getattr(model, 'cluster_centers_', None) is None and batch.shape[0] < model.n_clusters:
+                continue
+            model.partial_fit(batch)
+        rows += matrix.shape[0]
+    return rows
+
+
+def assign_chunks(model, data_file, vocabulary, out_file, chunk_size=50000):
+    """Write data_file to out_file with Skill_Cluster predicted by model
+
+    Returns the number of rows in every cluster.
+    """
+    counts = np.zeros(model.n_clusters, dtype=np.int64)
+    writer = None
+    try:
+        for i, frame in enumerate(read_chunks(data_file, chunk_size)):
+            matrix = skill_matrix(frame[SKILLS_COLUMN].map(split_skills), vocabulary)
+            labels = model.predict(matrix) if len(frame) else np.empty(0, dtype=np.int32)
+            frame[CLUSTER_COLUMN] = labels
+            counts += np.bincount(labels, minlength=model.n_clusters)
+            if out_file.endswith('.parquet'):
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(out_file, table.schema)
+                writer.write_table(table.cast(writer.schema))
+            else:
+                frame.to_csv(out_file, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return counts
+
+
+def compare_with_kmeans(model, matrix, seed=42, silhouette_rows=10000):
+    """Quality of a mini-batch model against a full KMeans fit on the same rows
+
+    Both models are scored on matrix (a sample of the corpus). Positive
+    inertia_delta means the mini-batch clusters are that much looser.
+    """
+    start = time.perf_counter()
+    full = KMeans(n_clusters=model.n_clusters, random_state=seed, n_init='auto').fit(matrix)
+    full_seconds = time.perf_counter() - start
+
+    full_labels = full.labels_
+    labels = model.predict(matrix)
+    # score() is the negated inertia of the rows it is given
+    full_inertia = -full.score(matrix)
+    inertia = -model.score(matrix)
+    silhouette_rows = min(silhouette_rows, matrix.shape[0])
+    # Silhouette distances are computed in blocks; keep the blocks small
+    with config_context(working_memory=64):
+        full_silhouette = silhouette_score(matrix, full_labels, sample_size=silhouette_rows,
+                                           random_state=seed)
+        silhouette = silhouette_score(matrix, labels, sample_size=silhouette_rows,
+                                      random_state=seed)
+    return {
+        'rows': matrix.shape[0],
+        'kmeans_seconds': round(full_seconds, 3),
+        'kmeans_inertia': round(float(full_inertia), 4),
+        'minibatch_inertia': round(float(inertia), 4),
+        'inertia_delta': round(float((inertia - full_inertia) / full_inertia), 4) if full_inertia else 0.0,
+        'kmeans_silhouette': round(float(full_silhouette), 4),
+        'minibatch_silhouette': round(float(silhouette), 4),
+        'adjusted_rand': round(float(adjusted_rand_score(full_labels, labels)), 4),
+    }
+
+
+def refit(data_file, vocabulary, kmeans=None, n_clusters=8, out_file=None, chunk_size=50000,
+          batch_size=4096, epochs=1, compare_rows=0, seed=42):
+    """Stream data_file through a mini-batch refit of the skill clusterer
+
+    Returns (model, metrics). With out_file the dataset is also written out
+    with refreshed Skill_Cluster assignments.
+    """
+    model = minibatch_model(kmeans, n_clusters, batch_size, seed)
+    sample = RowSample(compare_rows, seed)
+    metrics = {'data_file': os.path.abspath(data_file), 'chunk_size': chunk_size,
+               'batch_size': batch_size, 'epochs': epochs, 'warm_start': kmeans is not None}
+
+    start = time.perf_counter()
+    for epoch in range(epochs):
+        metrics['rows'] = partial_fit_chunks(model, skill_chunks(data_file, vocabulary, chunk_size),
+                                             batch_size, sample if epoch == 0 else None,
+                                             seed + epoch)
+    metrics['fit_seconds'] = round(time.perf_counter() - start, 3)
+    if getattr(model, 'cluster_centers_', None) is None:
+        raise ValueError(f"Need at least {model.n_clusters} rows to fit {model.n_clusters} clusters")
+
+    if out_file:
+        start = time.perf_counter()
+        counts = assign_chunks(model, data_file, vocabulary, out_file, chunk_size)
+        metrics['assign_seconds'] = round(time.perf_counter() - start, 3)
+        metrics['cluster_sizes'] = counts.tolist()
+
+    if sample.matrix is not None:
+        metrics['comparison'] = compare_with_kmeans(model, sample.matrix, seed)
+    logger.info(f"Incremental clustering: {json.dumps(metrics)}")
+    return model, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Refit the skill clusterer with mini-batch KMeans')
+    parser.add_argument('--data', default='preprocessed_it_jobs.csv', help='preprocessed dataset')
+    parser.add_argument('--binarizer', default='skills_binarizer.pkl')
+    parser.add_argument('--model', help='fitted KMeans to continue from (default: fresh k-means++)')
+    parser.add_argument('--clusters', type=int, default=8, help='cluster count without --model')
+    parser.add_argument('--out', help='write the dataset with refreshed Skill_Cluster here')
+    parser.add_argument('--model-out', help='where to save the refit model')
+    parser.add_argument('--chunk-size', type=int, default=50000)
+    parser.add_argument('--batch-size', type=int, default=4096)
+    parser.add_argument('--epochs', type=int, default=1)
+    parser.add_argument('--compare', type=int, default=0, metavar='ROWS',
+                        help='compare with full KMeans on a sample of this many rows')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    vocabulary = skill_vocabulary(joblib.load(args.binarizer))
+    kmeans = joblib.load(args.model) if args.model else None
+    model, metrics = refit(args.data, vocabulary, kmeans, args.clusters, args.out,
+                           args.chunk_size, args.batch_size, args.epochs, args.compare, args.seed)
+    if args.model_out:
+        joblib.dump(model, args.model_out)
+    print(json.dumps(metrics, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,406 @@
+"""Normalized SQLite job catalog with a bulk loader.
+
+The preprocessed dataset is loaded into three tables:
+
+    jobs        one row per posting (id = Job_ID)
+    skills      one row per distinct skill name
+    job_skills  (skill_id, job_id) pairs, clustered by skill
+
+Each of industry, location, experience_level and demand_level leads its
+own covering index that also holds the other filter columns, the title
+and the lower salary bound. A filtered listing is therefore answered from
+one index without touching the jobs table. A skill filter is a range scan
+of the job_skills primary key. For example, "high-demand jobs in Colombo
+requiring Python" is:
+
+    find_jobs(location='Colombo', demand='High', skills=['Python'])
+
+Loading runs executemany chunk by chunk. Appends commit every chunk; a
+full reload runs in one transaction, so readers keep the old catalog
+until it commits. It drops the tables and builds the indexes once at the
+end, which is much cheaper than keeping them up to date row by row:
+
+    python job_catalog.py load --data preprocessed_it_jobs.csv
+    python job_catalog.py find --location Colombo --demand High --skill Python
+
+Dashboard numbers come from two rollup tables: industry_summary (job,
+high-demand and salary totals per industry and location) and
+skill_frequency (jobs per skill, industry and location). Triggers on jobs
+and job_skills keep them current through appends, so reading them costs
+the same however large the catalog grows; a full reload aggregates once
+with GROUP BY and then installs the triggers. The industry dashboard in
+ui.py reads them through industry_summary() and top_skills():
+
+    python job_catalog.py summary --industry IT
+"""
+import argparse
+import json
+import logging
+import time
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+import db
+from salary_parser import parse_salary_column
+from skill_index import split_skills
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DB = 'job_catalog.db'
+
+TABLES = [
+    '''CREATE TABLE IF NOT EXISTS jobs
+       (id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        industry TEXT,
+        location TEXT,
+        experience_level TEXT,
+        education_required TEXT,
+        salary_range TEXT,
+        salary_lower REAL,
+        salary_upper REAL,
+        demand_level TEXT)''',
+    '''CREATE TABLE IF NOT EXISTS skills
+       (id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL)''',
+    '''CREATE TABLE IF NOT EXISTS job_skills
+       (skill_id INTEGER NOT NULL REFERENCES skills (id),
+        job_id INTEGER NOT NULL REFERENCES jobs (id),
+        PRIMARY KEY (skill_id, job_id)) WITHOUT ROWID''',
+]
+
+# Every index carries all the columns find_jobs returns, so any of them
+# can answer a listing on its own (the rowid id is implicit)
+INDEXES = [
+    '''CREATE INDEX IF NOT EXISTS idx_jobs_industry ON jobs
+       (industry, demand_level, location, experience_level, title, salary_lower)''',
+    '''CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs
+       (location, demand_level, experience_level, industry, title, salary_lower)''',
+    '''CREATE INDEX IF NOT EXISTS idx_jobs_experience ON jobs
+       (experience_level, demand_level, location, industry, title, salary_lower)''',
+    '''CREATE INDEX IF NOT EXISTS idx_jobs_demand ON jobs
+       (demand_level, location, experience_level, industry, title, salary_lower)''',
+    '''CREATE INDEX IF NOT EXISTS idx_job_skills_job ON job_skills (job_id, skill_id)''',
+]
+
+# Materialized rollups for dashboards. Triggers keep them current as jobs
+# and job_skills rows come and go; NULL industries and locations are
+# stored as '' so they still get a row, and a NULL demand level is
+# compared with IS so it counts as not high rather than as NULL.
+AGGREGATE_TABLES = [
+    '''CREATE TABLE IF NOT EXISTS industry_summary
+       (industry TEXT NOT NULL,
+        location TEXT NOT NULL,
+        jobs INTEGER NOT NULL,
+        high_demand_jobs INTEGER NOT NULL,
+        salary_jobs INTEGER NOT NULL,
+        salary_total REAL NOT NULL,
+        PRIMARY KEY (industry, location)) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS skill_frequency
+       (industry TEXT NOT NULL,
+        location TEXT NOT NULL,
+        skill_id INTEGER NOT NULL,
+        jobs INTEGER NOT NULL,
+        PRIMARY KEY (industry, location, skill_id)) WITHOUT ROWID''',
+]
+
+AGGREGATE_TRIGGER_NAMES = ('jobs_summary_insert', 'jobs_summary_delete',
+                           'job_skills_frequency_insert', 'job_skills_frequency_delete')
+
+AGGREGATE_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS jobs_summary_insert AFTER INSERT ON jobs BEGIN
+           INSERT INTO industry_summary VALUES
+               (coalesce(NEW.industry, ''), coalesce(NEW.location, ''), 1,
+                NEW.demand_level IS 'High', NEW.salary_lower IS NOT NULL,
+                coalesce(NEW.salary_lower, 0))
+           ON CONFLICT (industry, location) DO UPDATE SET
+               jobs = jobs + 1,
+               high_demand_jobs = high_demand_jobs + excluded.high_demand_jobs,
+               salary_jobs = salary_jobs + excluded.salary_jobs,
+               salary_total = salary_total + excluded.salary_total;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS jobs_summary_delete AFTER DELETE ON jobs BEGIN
+           UPDATE industry_summary SET
+               jobs = jobs - 1,
+               high_demand_jobs = high_demand_jobs - (OLD.demand_level IS 'High'),
+               salary_jobs = salary_jobs - (OLD.salary_lower IS NOT NULL),
+               salary_total = salary_total - coalesce(OLD.salary_lower, 0)
+           WHERE industry = coalesce(OLD.industry, '') AND location = coalesce(OLD.location, '');
+           DELETE FROM industry_summary WHERE jobs <= 0;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS job_skills_frequency_insert AFTER INSERT ON job_skills BEGIN
+           INSERT INTO skill_frequency
+               SELECT coalesce(industry, ''), coalesce(location, ''), NEW.skill_id, 1
+               FROM jobs WHERE id = NEW.job_id
+           ON CONFLICT (industry, location, skill_id) DO UPDATE SET jobs = jobs + 1;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS job_skills_frequency_delete AFTER DELETE ON job_skills BEGIN
+           UPDATE skill_frequency SET jobs = jobs - 1
+           WHERE skill_id = OLD.skill_id
+             AND (industry, location) = (SELECT coalesce(industry, ''), coalesce(location, '')
+                                         FROM jobs WHERE id = OLD.job_id);
+           DELETE FROM skill_frequency WHERE jobs <= 0;
+       END''',
+]
+
+# Full recomputation, used after a bulk rebuild instead of firing the
+# triggers once per row
+REFRESH_AGGREGATES = [
+    'DELETE FROM industry_summary',
+    '''INSERT INTO industry_summary
+       SELECT coalesce(industry, ''), coalesce(location, ''), COUNT(*),
+              SUM(demand_level IS 'High'), COUNT(salary_lower), coalesce(SUM(salary_lower), 0)
+       FROM jobs GROUP BY 1, 2''',
+    'DELETE FROM skill_frequency',
+    '''INSERT INTO skill_frequency
+       SELECT coalesce(j.industry, ''), coalesce(j.location, ''), js.skill_id, COUNT(*)
+       FROM job_skills js JOIN jobs j ON j.id = js.job_id
+       GROUP BY 1, 2, 3''',
+]
+
+JOB_COLUMNS = {
+    'Job_ID': 'id',
+    'Job_Title': 'title',
+    'Industry': 'industry',
+    'Location': 'location',
+    'Experience_Level': 'experience_level',
+    'Education_Required': 'education_required',
+    'Salary_Range': 'salary_range',
+    'Salary_Lower': 'salary_lower',
+    'Salary_Upper': 'salary_upper',
+    'Demand_Level': 'demand_level',
+}
+
+FIND_COLUMNS = ['id', 'title', 'industry', 'location', 'experience_level', 'demand_level',
+                'salary_lower']
+
+# find_jobs keyword -> jobs column
+FILTERS = {
+    'industry': 'industry',
+    'location': 'location',
+    'experience': 'experience_level',
+    'demand': 'demand_level',
+}
+
+INSERT_JOB = f'''INSERT OR REPLACE INTO jobs ({', '.join(JOB_COLUMNS.values())})
+                 VALUES ({', '.join('?' * len(JOB_COLUMNS))})'''
+INSERT_SKILL = 'INSERT INTO skills (id, name) VALUES (?, ?)'
+INSERT_JOB_SKILL = 'INSERT OR IGNORE INTO job_skills (skill_id, job_id) VALUES (?, ?)'
+DELETE_JOB_SKILLS = 'DELETE FROM job_skills WHERE job_id = ?'
+DELETE_JOB = 'DELETE FROM jobs WHERE id = ?'
+JOBS_WITH_SKILL = '''id IN (SELECT job_id FROM job_skills
+                           WHERE skill_id = (SELECT id FROM skills WHERE name = ?))'''
+
+
+def read_chunks(data_file, chunk_size=50000):
+    """Yield dataframe chunks of a preprocessed CSV or parquet file"""
+    if data_file.endswith('.parquet'):
+        for batch in pq.ParquetFile(data_file).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(data_file, chunksize=chunk_size)
+
+
+def job_rows(frame):
+    """jobs table rows of a dataset chunk, NaN as NULL"""
+    if 'Salary_Upper' not in frame:
+        salaries = parse_salary_column(frame['Salary_Range'])
+        frame = frame.assign(Salary_Lower=frame.get('Salary_Lower', salaries['Salary_Lower']),
+                             Salary_Upper=salaries['Salary_Upper'])
+    columns = frame[list(JOB_COLUMNS)].astype(object)
+    columns['Job_ID'] = frame['Job_ID'].astype(np.int64).astype(object)
+    return list(columns.where(columns.notna(), None).itertuples(index=False, name=None))
+
+
+def load_catalog(data_file, db_path=CATALOG_DB, chunk_size=50000, replace=True):
+    """Bulk load a preprocessed dataset into the catalog
+
+    With replace=True the catalog is rebuilt from scratch in a single
+    transaction, so readers keep seeing the previous catalog until it
+    commits and a failed load leaves it untouched. Otherwise jobs are
+    upserted by Job_ID and their skill lists replaced, one transaction per
+    chunk. An upsert is a delete plus an insert, so the aggregate triggers
+    see both sides. Returns a summary.
+    """
+    start = time.perf_counter()
+    pool = db.get_pool(db_path)
+    if replace:
+        with pool.transaction() as conn:
+            summary = _write_catalog(lambda: nullcontext(conn), data_file, chunk_size, replace)
+    else:
+        summary = _write_catalog(pool.transaction, data_file, chunk_size, replace)
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    logger.info(f"Loaded job catalog {db_path}: {summary}")
+    return summary
+
+
+def _write_catalog(transaction, data_file, chunk_size, replace):
+    """load_catalog's statements, each chunk inside transaction()"""
+    with transaction() as conn:
+        if replace:
+            for table in ('job_skills', 'skills', 'jobs', 'industry_summary', 'skill_frequency'):
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+        has_aggregates = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'industry_summary'").fetchone() is not None
+        for statement in TABLES + AGGREGATE_TABLES:
+            conn.execute(statement)
+        if not replace:
+            # Recreate the triggers so catalogs built by older versions get
+            # the current definitions
+            for name in AGGREGATE_TRIGGER_NAMES:
+                conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+            for statement in INDEXES + AGGREGATE_TRIGGERS:
+                conn.execute(statement)
+            # Catalogs loaded before the rollups existed need one full pass
+            if not has_aggregates:
+                for statement in REFRESH_AGGREGATES:
+                    conn.execute(statement)
+        skill_ids = dict(conn.execute('SELECT name, id FROM skills'))
+
+    jobs = links = 0
+    loaded = set()
+    for frame in read_chunks(data_file, chunk_size):
+        frame = frame.drop_duplicates('Job_ID', keep='last')
+        rows = job_rows(frame)
+        job_ids = [row[0] for row in rows]
+        skill_lists = frame['Skills_Required'].map(split_skills)
+        new_skills = [skill for skills in skill_lists for skill in skills if skill not in skill_ids]
+        new_skills = list(dict.fromkeys(new_skills))
+        first_id = max(skill_ids.values(), default=0) + 1
+        skill_ids.update(zip(new_skills, range(first_id, first_id + len(new_skills))))
+        pairs = [(skill_ids[skill], job_id)
+                 for job_id, skills in zip(job_ids, skill_lists) for skill in skills]
+        # A rebuild only has to clear jobs an earlier chunk already loaded
+        replaced = job_ids if not replace else [job_id for job_id in job_ids if job_id in loaded]
+
+        with transaction() as conn:
+            conn.executemany(INSERT_SKILL, zip(range(first_id, first_id + len(new_skills)),
+                                               new_skills))
+            conn.executemany(DELETE_JOB_SKILLS, ((job_id,) for job_id in replaced))
+            conn.executemany(DELETE_JOB, ((job_id,) for job_id in replaced))
+            conn.executemany(INSERT_JOB, rows)
+            conn.executemany(INSERT_JOB_SKILL, pairs)
+        if replace:
+            loaded.update(job_ids)
+        jobs += len(rows)
+        links += len(pairs)
+
+    with transaction() as conn:
+        for statement in INDEXES:
+            conn.execute(statement)
+        if replace:
+            # Aggregate the rebuilt tables once, then keep them current row by row
+            for statement in REFRESH_AGGREGATES + AGGREGATE_TRIGGERS:
+                conn.execute(statement)
+        # Planner statistics, so the most selective index wins
+        conn.execute('ANALYZE')
+
+    return {'jobs': jobs, 'skills': len(skill_ids), 'job_skills': links}
+
+
+def find_jobs(industry=None, location=None, experience=None, demand=None, skills=(), limit=50,
+              db_path=CATALOG_DB):
+    """Jobs matching every given filter and requiring all of `skills`
+
+    Up to `limit` jobs in index order. The SQL text only depends on which
+    filters are set, so repeated searches reuse a prepared statement.
+    """
+    values = {'industry': industry, 'location': location, 'experience': experience,
+              'demand': demand}
+    clauses, params = [], []
+    for name, column in FILTERS.items():
+        if values[name] is not None:
+            clauses.append(f'{column} = ?')
+            params.append(values[name])
+    # One membership test per skill, each a range of the job_skills key
+    for skill in dict.fromkeys(skills):
+        clauses.append(JOBS_WITH_SKILL)
+        params.append(skill)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    # No ORDER BY: sorting would make SQLite read every match before LIMIT
+    rows = db.get_pool(db_path).query(
+        f"SELECT {', '.join(FIND_COLUMNS)} FROM jobs {where} LIMIT ?", params + [limit])
+    return [dict(zip(FIND_COLUMNS, row)) for row in rows]
+
+
+def industry_summary(industry=None, location=None, db_path=CATALOG_DB):
+    """Job count, high-demand count and mean lower salary, read from the rollup"""
+    clauses, params = [], []
+    for column, value in (('industry', industry), ('location', location)):
+        if value is not None:
+            clauses.append(f'{column} = ?')
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    jobs, high_demand, salary_jobs, salary_total = db.get_pool(db_path).query_one(
+        f"""SELECT coalesce(SUM(jobs), 0), coalesce(SUM(high_demand_jobs), 0),
+                   coalesce(SUM(salary_jobs), 0), coalesce(SUM(salary_total), 0)
+            FROM industry_summary {where}""", params)
+    return {
+        'jobs': jobs,
+        'high_demand_jobs': high_demand,
+        'average_salary': salary_total / salary_jobs if salary_jobs else None,
+    }
+
+
+def top_skills(industry=None, location=None, limit=20, db_path=CATALOG_DB):
+    """Most required skills as (skill, job count) pairs, read from the rollup"""
+    clauses, params = [], []
+    for column, value in (('f.industry', industry), ('f.location', location)):
+        if value is not None:
+            clauses.append(f'{column} = ?')
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    return db.get_pool(db_path).query(
+        f"""SELECT s.name, SUM(f.jobs) AS jobs FROM skill_frequency f
+            JOIN skills s ON s.id = f.skill_id {where}
+            GROUP BY f.skill_id ORDER BY jobs DESC, s.name LIMIT ?""", params + [limit])
+
+
+def job_skills(job_id, db_path=CATALOG_DB):
+    """Skill names of one job"""
+    rows = db.get_pool(db_path).query(
+        '''SELECT s.name FROM job_skills js JOIN skills s ON s.id = js.skill_id
+           WHERE js.job_id = ? ORDER BY s.name''', (job_id,))
+    return [name for name, in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load or query the SQLite job catalog')
+    parser.add_argument('--db', default=CATALOG_DB)
+    commands = parser.add_subparsers(dest='command', required=True)
+    load = commands.add_parser('load', help='bulk load a preprocessed dataset')
+    load.add_argument('--data', default='preprocessed_it_jobs.csv')
+    load.add_argument('--chunk-size', type=int, default=50000)
+    load.add_argument('--append', action='store_true', help='upsert instead of rebuilding')
+    find = commands.add_parser('find', help='search the catalog')
+    find.add_argument('--industry')
+    find.add_argument('--location')
+    find.add_argument('--experience')
+    find.add_argument('--demand')
+    find.add_argument('--skill', action='append', default=[])
+    find.add_argument('--limit', type=int, default=20)
+    summary = commands.add_parser('summary', help='show the dashboard rollups')
+    summary.add_argument('--industry')
+    summary.add_argument('--location')
+    summary.add_argument('--limit', type=int, default=10, help='number of top skills')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'load':
+        print(json.dumps(load_catalog(args.data, args.db, args.chunk_size, not args.append)))
+    elif args.command == 'summary':
+        print(json.dumps({
+            **industry_summary(args.industry, args.location, args.db),
+            'top_skills': top_skills(args.industry, args.location, args.limit, args.db),
+        }, indent=2))
+    else:
+        for job in find_jobs(args.industry, args.location, args.experience, args.demand,
+                             args.skill, args.limit, args.db):
+            print(json.dumps(job))
+
+
+if __name__ == '__main__':
+    main()
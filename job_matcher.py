@@ -0,0 +1,168 @@
+"""Approximate nearest-neighbour job matching over skill sets.
+
+Every job is indexed by the set of skill columns in its row of the sparse
+job x skill matrix. Jobs requiring the same skills share one entry, and
+each distinct skill set gets a MinHash signature that is split into LSH
+bands. A query only looks at the sets that collide with it in at least one
+band, then reranks them by exact Jaccard similarity over packed bitsets
+(see skillset.py). Query time therefore
+grows with the number of candidates, not with the number of jobs.
+
+With the default 32 bands of 2 rows, a set with Jaccard similarity s is
+a candidate with probability 1 - (1 - s^2)^32. That is about 0.5 at
+s = 0.15 and above 0.99 from s = 0.4 on. Catalogues with few distinct
+skill sets (exact_threshold) are simply scanned, which is both exact and
+faster at that size.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from skillset import SkillSet, SkillVocabulary, pack_ids
+
+_PRIME = (1 << 31) - 1
+_EMPTY = np.uint64(_PRIME)
+
+
+class JobMatcher:
+    """MinHash-LSH index of job skill sets with exact Jaccard reranking"""
+
+    def __init__(self, matrix, vocabulary, bands=32, rows_per_band=2, seed=0,
+                 exact_threshold=2000):
+        matrix = sparse.csr_matrix(matrix)
+        matrix.sort_indices()
+        self.vocabulary = vocabulary
+        self.skills = SkillVocabulary(vocabulary)
+        self.n_jobs = matrix.shape[0]
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+        self.exact_threshold = exact_threshold
+
+        rng = np.random.default_rng(seed)
+        num_perm = bands * rows_per_band
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+        self._band_mix = rng.integers(1, 1 << 63, rows_per_band, dtype=np.uint64) | np.uint64(1)
+
+        # One entry per distinct skill set; jobs are grouped behind it
+        keys = [matrix.indices[start:end].tobytes()
+                for start, end in zip(matrix.indptr[:-1], matrix.indptr[1:])]
+        set_of_job, _ = pd.factorize(pd.Series(keys))
+        order = np.argsort(set_of_job, kind='stable')
+        self._set_jobs = np.split(order, np.flatnonzero(np.diff(set_of_job[order])) + 1)
+        representatives = np.array([jobs[0] for jobs in self._set_jobs], dtype=np.intp)
+        self.sets = matrix[representatives]
+        self.set_bits = self.skills.pack_matrix(self.sets)
+        self.set_sizes = self.set_bits.count()
+
+        signatures = self._signatures(self.sets)
+        self._band_keys, self._band_order = [], []
+        for band_keys in self._band_hashes(signatures).T:
+            band_order = np.argsort(band_keys, kind='stable')
+            self._band_keys.append(band_keys[band_order])
+            self._band_order.append(band_order)
+
+    def __len__(self):
+        return self.n_jobs
+
+    @property
+    def n_sets(self):
+        return self.sets.shape[0]
+
+    def _signatures(self, sets, block_rows=20000):
+        """MinHash signatures (n_sets x num_perm) of the rows of a CSR matrix"""
+        signatures = np.full((sets.shape[0], len(self._a)), _EMPTY, dtype=np.uint64)
+        # Hash in row blocks so the nnz x num_perm intermediate stays small
+        for first in range(0, sets.shape[0], block_rows):
+            block = sets[first:first + block_rows]
+            non_empty = np.flatnonzero(np.diff(block.indptr))
+            if not len(non_empty):
+                continue
+            hashed = (np.outer(block.indices.astype(np.uint64), self._a) + self._b) % _PRIME
+            signatures[first + non_empty] = np.minimum.reduceat(
+                hashed, block.indptr[non_empty], axis=0)
+        return signatures
+
+    def _band_hashes(self, signatures):
+        """One 64-bit bucket key per band (n_sets x bands)"""
+        rows = signatures.reshape(len(signatures), self.bands, self.rows_per_band)
+        # uint64 arithmetic wraps, which is what a multiplicative hash wants
+        return (rows * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    def skill_ids(self, skills):
+        """Sorted vocabulary columns of a list of skills (unknown skills dropped)"""
+        return np.unique(self.skills.ids_of(skills))
+
+    def candidates(self, columns):
+        """Distinct skill sets sharing at least one LSH bucket with a query"""
+        query = sparse.csr_matrix((np.ones(len(columns)), columns, [0, len(columns)]),
+                                  shape=(1, len(self.vocabulary)))
+        keys = self._band_hashes(self._signatures(query))[0]
+        found = []
+        for key, band_keys, band_order in zip(keys, self._band_keys, self._band_order):
+            start = np.searchsorted(band_keys, key, side='left')
+            end = np.searchsorted(band_keys, key, side='right')
+            if end > start:
+                found.append(band_order[start:end])
+        return np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+    def jaccard(self, set_ids, columns):
+        """Exact Jaccard similarity between some indexed sets and a query"""
+        # Set sizes are known, so the union needs no second popcount
+        intersection = self.set_bits[set_ids].overlap(self._query(columns))
+        union = self.set_sizes[set_ids] + len(columns) - intersection
+        return np.divide(intersection, union, out=np.zeros(len(union)), where=union > 0)
+
+    def _query(self, columns):
+        return SkillSet(pack_ids(columns, len(self.skills)), self.skills)
+
+    def match(self, skills, top_k=5, min_similarity=0.0):
+        """Closest jobs to a list of skills
+
+        Returns up to top_k (job row, Jaccard similarity, missing skills)
+        tuples, most similar first; jobs with the same skill set come out in
+        dataset order.
+        """
+        if self.n_sets <= self.exact_threshold:
+            return self.match_exact(skills, top_k)
+        columns = self.skill_ids(skills)
+        if top_k <= 0 or not len(columns):
+            return []
+        set_ids = self.candidates(columns)
+        if not len(set_ids):
+            return []
+        similarity = self.jaccard(set_ids, columns)
+        keep = similarity > min_similarity
+        set_ids, similarity = set_ids[keep], similarity[keep]
+
+        return self._top_jobs(set_ids, similarity, columns, top_k)
+
+    def match_exact(self, skills, top_k=5):
+        """Brute-force reference for match: exact Jaccard against every set"""
+        columns = self.skill_ids(skills)
+        if top_k <= 0 or not len(columns):
+            return []
+        set_ids = np.arange(self.n_sets)
+        similarity = self.jaccard(set_ids, columns)
+        keep = similarity > 0
+        return self._top_jobs(set_ids[keep], similarity[keep], columns, top_k)
+
+    def _top_jobs(self, set_ids, similarity, columns, top_k):
+        # Every set holds at least one job, so top_k sets always cover top_k
+        # jobs; sets tied with the k-th are kept so ties resolve in set order
+        if len(set_ids) > top_k:
+            kth = np.partition(similarity, len(similarity) - top_k)[len(similarity) - top_k]
+            top = similarity >= kth
+            set_ids, similarity = set_ids[top], similarity[top]
+        ranked = np.lexsort((set_ids, -similarity))
+        set_ids, similarity = set_ids[ranked], similarity[ranked]
+
+        # Skill gaps of all the chosen sets in one bitset difference
+        missing_skills = (self.set_bits[set_ids] - self._query(columns)).to_lists()
+        matches = []
+        for set_id, score, missing in zip(set_ids, similarity, missing_skills):
+            for job in self._set_jobs[set_id]:
+                matches.append((int(job), float(score), missing))
+                if len(matches) == top_k:
+                    return matches
+        return matches
@@ -0,0 +1,180 @@
+"""In-process full-text job search with BM25 ranking.
+
+The searched columns (title, skills, education and, when a dataset has
+one, description) repeat heavily across postings, so the index is built
+over the distinct combinations of them and every job points at its
+combination. That keeps the inverted index a few percent of the size of
+the catalog. The postings are a sparse term x document matrix holding
+precomputed BM25 weights: per-field BM25 summed with field weights, with
+document frequencies and average lengths counted over jobs, so scores are
+the same as indexing every posting separately.
+
+A query requires every word (AND). By default each word is a prefix,
+which is what typeahead boxes send: "data sci" finds "Data Scientist".
+A prefix covers a range of the sorted vocabulary, and a document scores
+its best-matching term in that range.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Searched columns and their weights; a title hit counts most
+SEARCH_FIELDS = {
+    'Job_Title': 3.0,
+    'Skills_Required': 1.5,
+    'Education_Required': 1.0,
+    'Description': 1.0,
+}
+FILTER_FIELDS = ('Industry', 'Location', 'Experience_Level', 'Demand_Level')
+# Documents checked one by one before a filtered search scans all jobs
+FILTER_WALK_DOCS = 64
+
+
+def tokenize(text):
+    """Lowercase word tokens of a text (nothing for missing values)"""
+    return TOKEN_PATTERN.findall(text.lower()) if isinstance(text, str) else []
+
+
+class JobSearchIndex:
+    """BM25 inverted index over the searchable text of a jobs dataframe"""
+
+    def __init__(self, jobs, fields=None, k1=1.2, b=0.75):
+        fields = {field: weight for field, weight in (fields or SEARCH_FIELDS).items()
+                  if field in jobs}
+        self.n_jobs = len(jobs)
+
+        # One document per distinct combination of field texts
+        doc_of_job = jobs.groupby(list(fields), dropna=False, sort=False).ngroup().to_numpy()
+        self._doc_of_job = doc_of_job
+        self._job_order = np.argsort(doc_of_job, kind='stable')
+        _, representatives, doc_sizes = np.unique(doc_of_job, return_index=True,
+                                                  return_counts=True)
+        self._doc_starts = np.concatenate([[0], np.cumsum(doc_sizes)])
+        n_docs = len(representatives)
+
+        vocabulary = {}
+        field_tokens = []
+        for field in fields:
+            term_ids, doc_ids = [], []
+            for doc, text in enumerate(jobs[field].to_numpy()[representatives]):
+                tokens = tokenize(text)
+                term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+                doc_ids.extend([doc] * len(tokens))
+            field_tokens.append((fields[field], np.array(term_ids, dtype=np.intp),
+                                 np.array(doc_ids, dtype=np.intp)))
+
+        shape = (len(vocabulary), n_docs)
+        weights = sparse.csr_matrix(shape)
+        for weight, term_ids, doc_ids in field_tokens:
+            # Term frequencies; lengths and their average are per job
+            tf = sparse.csr_matrix((np.ones(len(term_ids)), (term_ids, doc_ids)), shape=shape)
+            lengths = np.bincount(doc_ids, minlength=n_docs)
+            average = max((lengths * doc_sizes).sum() / max(self.n_jobs, 1), 1e-9)
+            norm = k1 * (1 - b + b * lengths[tf.indices] / average)
+            tf.data = weight * tf.data * (k1 + 1) / (tf.data + norm)
+            weights = weights + tf
+
+        present = weights.copy()
+        present.data[:] = 1.0
+        job_frequency = present @ doc_sizes
+        idf = np.log1p((self.n_jobs - job_frequency + 0.5) / (job_frequency + 0.5))
+        weights = sparse.diags(idf) @ weights
+
+        # Rows in sorted term order so a prefix is a contiguous row range
+        terms = np.array(list(vocabulary), dtype=str)
+        order = np.argsort(terms)
+        self.terms = terms[order]
+        self.weights = weights.tocsr()[order]
+        self.weights.sort_indices()
+
+        self._filters = {field: pd.factorize(jobs[field]) for field in FILTER_FIELDS
+                         if field in jobs}
+
+    def __len__(self):
+        return self.n_jobs
+
+    @property
+    def n_docs(self):
+        return self.weights.shape[1]
+
+    def term_range(self, term, prefix=True):
+        """Rows of the vocabulary matching a term, as (start, end)"""
+        start = np.searchsorted(self.terms, term, side='left')
+        if prefix:
+            end = np.searchsorted(self.terms, term + '\U0010ffff', side='left')
+        else:
+            end = start + int(start < len(self.terms) and self.terms[start] == term)
+        return start, end
+
+    def _term_scores(self, term, prefix):
+        """(documents, scores) of one query word, documents sorted"""
+        start, end = self.term_range(term, prefix)
+        rows = self.weights[start:end]
+        if end - start <= 1:
+            return rows.indices, rows.data
+        # A document matching several completions of a prefix scores its best one
+        docs, inverse = np.unique(rows.indices, return_inverse=True)
+        scores = np.zeros(len(docs))
+        np.maximum.at(scores, inverse, rows.data)
+        return docs, scores
+
+    def search(self, query, limit=20, prefix=True, filters=None):
+        """Best-matching jobs for free text
+
+        Returns up to `limit` (job row, score) pairs, highest score first;
+        jobs sharing a document come out in dataset order. filters maps
+        FILTER_FIELDS columns to the value a job must have.
+        """
+        codes = []
+        for field, value in (filters or {}).items():
+            job_codes, uniques = self._filters[field]
+            if value not in uniques:
+                return []
+            codes.append((job_codes, uniques.get_loc(value)))
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        docs, scores = self._term_scores(terms[0], prefix)
+        for term in terms[1:]:
+            term_docs, term_scores = self._term_scores(term, prefix)
+            docs, left, right = np.intersect1d(docs, term_docs, assume_unique=True,
+                                               return_indices=True)
+            scores = scores[left] + term_scores[right]
+
+        ranked = np.lexsort((docs, -scores))
+        docs, scores = docs[ranked], scores[ranked]
+        # Walk the best documents first; with filters, stop after a few and
+        # fall back to one pass over all jobs if they did not fill the page
+        walk = len(docs) if not codes else FILTER_WALK_DOCS
+        results = []
+        for doc, score in zip(docs[:walk], scores[:walk]):
+            rows = self._job_order[self._doc_starts[doc]:self._doc_starts[doc + 1]]
+            for job_codes, code in codes:
+                rows = rows[job_codes[rows] == code]
+            results.extend((int(row), float(score)) for row in rows[:limit - len(results)])
+            if len(results) == limit:
+                return results
+        if len(docs) <= walk:
+            return results
+        return self._filtered_jobs(docs, scores, codes, limit)
+
+    def _filtered_jobs(self, docs, scores, codes, limit):
+        """Top jobs of ranked documents that pass every filter, in one pass"""
+        doc_rank = np.full(self.n_docs, -1)
+        doc_rank[docs] = np.arange(len(docs))
+        job_rank = doc_rank[self._doc_of_job]
+        keep = job_rank >= 0
+        for job_codes, code in codes:
+            keep &= job_codes == code
+        rows = np.flatnonzero(keep)
+        if len(rows) > limit:
+            # Only the jobs of the best documents need sorting
+            kth = np.partition(job_rank[rows], limit - 1)[limit - 1]
+            rows = rows[job_rank[rows] <= kth]
+        rows = rows[np.argsort(job_rank[rows], kind='stable')[:limit]]
+        return [(int(row), float(scores[job_rank[row]])) for row in rows]
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+
+class CompiledLabelEncoder:
+    """Precomputed label -> code lookup table built from a fitted LabelEncoder"""
+
+    def __init__(self, classes, unknown_code=-1):
+        self.classes_ = np.asarray(classes)
+        self.unknown_code = int(unknown_code)
+        self._codes = {label: code for code, label in enumerate(self.classes_.tolist())}
+        self._categories = pd.Index(self.classes_.tolist())
+
+    @classmethod
+    def from_encoder(cls, encoder, unknown_code=-1):
+        """Compile a fitted sklearn LabelEncoder"""
+        return cls(encoder.classes_, unknown_code=unknown_code)
+
+    def __len__(self):
+        return len(self.classes_)
+
+    def encode(self, label):
+        """Encode a single label with a dict lookup"""
+        try:
+            return self._codes.get(label, self.unknown_code)
+        except TypeError:
+            # Unhashable input (e.g. a list) can never be a known label
+            return self.unknown_code
+
+    def encode_many(self, labels):
+        """Encode a column of labels through a categorical lookup"""
+        values = pd.Series(list(labels), dtype=object)
+        if pd.api.types.infer_dtype(values, skipna=False) != 'string':
+            # Only strings can be labels; anything else (numbers, None, or
+            # unhashable lists and dicts the lookup would choke on) is unknown
+            values = values.where(values.map(lambda value: isinstance(value, str)))
+        codes = pd.Categorical(values, categories=self._categories).codes.astype(np.int64)
+        if self.unknown_code != -1:
+            codes[codes == -1] = self.unknown_code
+        return codes
+
+    def is_known(self, code):
+        """True if the code refers to a real class rather than the fallback"""
+        return 0 <= code < len(self.classes_)
+
+    def is_known_many(self, codes):
+        codes = np.asarray(codes)
+        return (codes >= 0) & (codes < len(self.classes_))
+
+    def decode(self, code):
+        """Map a code back to its label"""
+        return self.classes_[code]
+
+    def decode_many(self, codes):
+        return self.classes_[np.asarray(codes)]
+
+
+def compile_encoders(encoders, unknown_code=-1):
+    """Compile every fitted LabelEncoder in a dict of encoders"""
+    return {
+        name: CompiledLabelEncoder.from_encoder(encoders[name], unknown_code=unknown_code)
+        for name in encoders
+        if name.startswith('le_')
+    }
@@ -0,0 +1,153 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Guards the lazy thread start. A forked child gets a fresh one, since a
+# copy held by some other thread at fork time would never be released.
+_start_lock = threading.Lock()
+
+
+def _reset_start_lock():
+    global _start_lock
+    _start_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_start_lock)
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row predictions into one vectorized call
+
+    The first row to arrive opens a window of max_wait seconds; the batch
+    is flushed when the window closes or max_batch_size rows are waiting,
+    whichever comes first. A request therefore never waits longer than the
+    window for its batch to start, even when traffic is quiet.
+
+    The batching thread starts on first use in each process. Threads do not
+    survive fork, so a batcher built before a pre-forking server forks its
+    workers (gunicorn preload_app) starts a fresh thread in every worker.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=64, max_wait=0.002):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.rows = 0
+        self.fallbacks = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+    def _ensure_running(self):
+        if self._pid == os.getpid():
+            return
+        with _start_lock:
+            if self._pid != os.getpid():
+                # Rows queued in the parent went with its thread; start clean
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                                name='micro-batcher', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def submit(self, row):
+        """Queue one feature row, returning a Future for its prediction"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        self._ensure_running()
+        future = Future()
+        self._queue.put((row, future, time.monotonic()))
+        return future
+
+    def predict(self, row, timeout=None):
+        """Predict one row through the shared batch
+
+        If no batch has picked the row up within timeout seconds it is
+        withdrawn and predicted on its own, so a stalled batching thread
+        slows requests down instead of hanging them.
+        """
+        future = self.submit(row)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            # A batch already predicting the row finishes it
+            if not future.cancel():
+                return future.result()
+        self.fallbacks += 1
+        logger.warning(f"Micro-batch result not ready after {timeout} s; predicting directly")
+        return self.predict_fn(np.asarray([row], dtype=float))[0]
+
+    def close(self):
+        """Stop the batching thread once queued rows are served"""
+        self._closed = True
+        if self._pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join()
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'mean_batch_size': round(self.rows / self.batches, 2) if self.batches else 0.0,
+            'fallbacks': self.fallbacks,
+        }
+
+    def _run(self, rows):
+        while True:
+            item = rows.get()
+            if item is None:
+                return
+            batch = [item]
+            # The window is measured from the arrival of the oldest row
+            deadline = item[2] + self.max_wait
+            while len(batch) < self.max_batch_size:
+                # Rows already queued join the batch even once the window
+                # has closed; only waiting for new rows is bounded by it
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = rows.get(timeout=remaining)
+                    else:
+                        item = rows.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._flush(batch)
+                    return
+                batch.append(item)
+            self._flush(batch)
+
+    def _flush(self, batch):
+        # Rows whose caller gave up waiting were already predicted directly
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        rows = [row for row, _, _ in batch]
+        futures = [future for _, future, _ in batch]
+        self.batches += 1
+        self.rows += len(rows)
+        try:
+            results = self.predict_fn(np.asarray(rows, dtype=float))
+        except Exception:
+            # One bad row must not fail its neighbours; retry row by row
+            for row, future in zip(rows, futures):
+                try:
+                    future.set_result(self.predict_fn(np.asarray([row], dtype=float))[0])
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            future.set_result(result)
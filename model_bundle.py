@@ -0,0 +1,255 @@
+"""Versioned model artifact bundle with lazy, memory-mapped loading.
+
+A bundle is a directory holding every artifact the API needs:
+
+    manifest.json          format version, per-file sha256 and the bundle hash
+    rf_model.joblib        uncompressed joblib dumps, loadable with mmap_mode
+    ...
+    df_it.parquet          the preprocessed job dataframe
+    skill_matrix.npz       sparse job x skill matrix
+
+Build one from the legacy pickle files with:
+
+    python model_bundle.py build artifacts/<version>
+
+An artifacts directory holding several bundles names the current one in
+its LATEST file; open_bundle accepts either a bundle or such a directory.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+
+import joblib
+import pandas as pd
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+LATEST_FILE = 'LATEST'
+
+# Legacy artifact files loaded by ai_model_api.load_models
+MODEL_FILES = {
+    'rf_model': 'job_forecasting_model.pkl',
+    'kmeans': 'skill_clustering_model.pkl',
+}
+ENCODER_FILES = {
+    'le_job': 'job_encoder.pkl',
+    'le_location': 'location_encoder.pkl',
+    'le_experience': 'experience_encoder.pkl',
+    'mlb': 'skills_binarizer.pkl',
+    'le_demand': 'demand_encoder.pkl',
+}
+DATA_FILE = 'preprocessed_it_jobs.csv'
+# Components derived from others at load time according to the serving
+# config (e.g. the compiled forest of INFERENCE_ENGINE=compiled); they are
+# never written to a bundle and are ignored if an older bundle has them
+DERIVED_COMPONENTS = ('rf_engine',)
+
+
+def file_sha256(path, block_size=1 << 20):
+    """Hash a file in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(hashes):
+    """Combine a dict of name -> sha256 into one stable hash"""
+    payload = json.dumps(hashes, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def legacy_artifacts_hash(base_dir='.', data_file=DATA_FILE):
+    """Fingerprint the legacy pickle/CSV artifact set"""
+    files = list(MODEL_FILES.values()) + list(ENCODER_FILES.values()) + [data_file]
+    return fingerprint({name: file_sha256(os.path.join(base_dir, name)) for name in files})
+
+
+def _component_kind(obj):
+    if isinstance(obj, pd.DataFrame):
+        return 'parquet'
+    if sparse.issparse(obj):
+        return 'npz'
+    return 'joblib'
+
+
+def _dump_component(obj, path):
+    if isinstance(obj, pd.DataFrame):
+        obj.to_parquet(path, index=False)
+    elif sparse.issparse(obj):
+        sparse.save_npz(path, obj.tocsr())
+    else:
+        # No compression, so numpy arrays can be memory-mapped on load
+        joblib.dump(obj, path)
+
+
+def build_bundle(bundle_dir, models, encoders, metadata=None):
+    """Write models and encoders to a versioned bundle directory
+
+    Returns the manifest that was written.
+    """
+    os.makedirs(bundle_dir, exist_ok=True)
+
+    components = {}
+    for group, artifacts in (('models', models), ('encoders', encoders)):
+        for name, obj in artifacts.items():
+            if name in DERIVED_COMPONENTS:
+                continue
+            kind = _component_kind(obj)
+            file_name = f"{name}.{kind}"
+            path = os.path.join(bundle_dir, file_name)
+            _dump_component(obj, path)
+            components[name] = {
+                'group': group,
+                'kind': kind,
+                'file': file_name,
+                'sha256': file_sha256(path),
+            }
+
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'components': components,
+        'bundle_hash': fingerprint({name: c['sha256'] for name, c in components.items()}),
+        'metadata': metadata or {},
+    }
+    with open(os.path.join(bundle_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    logger.info(f"Wrote bundle {manifest['bundle_hash'][:12]} to {bundle_dir}")
+    return manifest
+
+
+def read_manifest(bundle_dir):
+    """Read and sanity-check a bundle manifest"""
+    with open(os.path.join(bundle_dir, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format: {manifest.get('format_version')}")
+    return manifest
+
+
+def verify_bundle(bundle_dir, manifest=None):
+    """Check every component file against the hashes in the manifest"""
+    manifest = manifest or read_manifest(bundle_dir)
+    for name, component in manifest['components'].items():
+        actual = file_sha256(os.path.join(bundle_dir, component['file']))
+        if actual != component['sha256']:
+            raise ValueError(f"Bundle component {name} does not match its manifest hash")
+    return manifest
+
+
+def load_component(bundle_dir, component, mmap_mode='r'):
+    """Load a single bundle component"""
+    path = os.path.join(bundle_dir, component['file'])
+    if component['kind'] == 'parquet':
+        return pd.read_parquet(path, memory_map=True)
+    if component['kind'] == 'npz':
+        return sparse.load_npz(path).tocsr()
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+class LazyComponents(MutableMapping):
+    """Mapping that loads bundle components on first access"""
+
+    def __init__(self, bundle_dir, manifest, group, mmap_mode='r'):
+        self.bundle_dir = bundle_dir
+        self.mmap_mode = mmap_mode
+        self._components = {
+            name: component for name, component in manifest['components'].items()
+            if component['group'] == group and name not in DERIVED_COMPONENTS
+        }
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            if name not in self._components:
+                raise KeyError(name)
+            logger.info(f"Loading bundle component {name}")
+            self._loaded[name] = load_component(
+                self.bundle_dir, self._components[name], self.mmap_mode)
+        return self._loaded[name]
+
+    def __contains__(self, name):
+        # Mapping.__contains__ would go through __getitem__ and load the component
+        return name in self._loaded or name in self._components
+
+    def __setitem__(self, name, value):
+        self._loaded[name] = value
+
+    def __delitem__(self, name):
+        if name not in self._loaded and name not in self._components:
+            raise KeyError(name)
+        self._loaded.pop(name, None)
+        self._components.pop(name, None)
+
+    def __iter__(self):
+        yield from self._components
+        yield from (name for name in self._loaded if name not in self._components)
+
+    def __len__(self):
+        return len(set(self._components) | set(self._loaded))
+
+    def loaded(self):
+        """Names of components already pulled into memory"""
+        return sorted(self._loaded)
+
+
+def write_latest(artifacts_dir, version):
+    """Atomically point artifacts_dir/LATEST at one of its bundles"""
+    tmp_path = os.path.join(artifacts_dir, LATEST_FILE + '.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(version + '\n')
+    os.replace(tmp_path, os.path.join(artifacts_dir, LATEST_FILE))
+
+
+def resolve_bundle_dir(path):
+    """Bundle directory for a bundle path or an artifacts directory with LATEST"""
+    latest_path = os.path.join(path, LATEST_FILE)
+    if not os.path.exists(os.path.join(path, MANIFEST_FILE)) and os.path.exists(latest_path):
+        with open(latest_path) as f:
+            return os.path.join(path, f.read().strip())
+    return path
+
+
+def open_bundle(bundle_dir, verify=False, mmap_mode='r'):
+    """Open a bundle lazily, returning (models, encoders, manifest)"""
+    bundle_dir = resolve_bundle_dir(bundle_dir)
+    manifest = verify_bundle(bundle_dir) if verify else read_manifest(bundle_dir)
+    models = LazyComponents(bundle_dir, manifest, 'models', mmap_mode)
+    encoders = LazyComponents(bundle_dir, manifest, 'encoders', mmap_mode)
+    return models, encoders, manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect a model artifact bundle')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='Build a bundle from the legacy pickle files')
+    build.add_argument('bundle_dir')
+    inspect = subparsers.add_parser('verify', help='Verify a bundle against its manifest')
+    inspect.add_argument('bundle_dir')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'build':
+        import ai_model_api
+        if not ai_model_api.load_models():
+            raise SystemExit("Failed to load legacy artifacts")
+        manifest = build_bundle(args.bundle_dir, dict(ai_model_api.models),
+                                dict(ai_model_api.encoders),
+                                metadata={'source': 'legacy pickles'})
+    else:
+        manifest = verify_bundle(args.bundle_dir)
+    print(manifest['bundle_hash'])
+
+
+if __name__ == '__main__':
+    main()
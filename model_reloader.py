@@ -0,0 +1,108 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+def file_stamp(path):
+    """(path, mtime, size) of a file, or (path, None, None) when it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ModelReloader:
+    """Run model reloads in the background, one at a time
+
+    reload_fn builds, warms up and publishes a new artifact set and returns
+    its version; until it returns, requests keep being served by the old
+    set. With an interval, a polling thread also watches fingerprint_fn
+    (a cheap stamp of the artifact files) and reloads once a change has
+    held still for a full interval, so half-copied files are not loaded.
+    """
+
+    def __init__(self, reload_fn, fingerprint_fn, interval=0):
+        self.reload_fn = reload_fn
+        self.fingerprint_fn = fingerprint_fn
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._thread = None
+        self._state = {
+            'state': 'idle',
+            'reloads': 0,
+            'failures': 0,
+            'version': None,
+            'last_started': None,
+            'last_finished': None,
+            'last_seconds': None,
+            'last_error': None,
+            'watching': False,
+        }
+
+    def status(self):
+        status = dict(self._state)
+        status['watching'] = self._thread is not None and self._thread.is_alive()
+        return status
+
+    def reload(self, wait=False):
+        """Start a reload; False if one is already running"""
+        if not self._lock.acquire(blocking=False):
+            return False
+        if wait:
+            self._run()
+        else:
+            threading.Thread(target=self._run, name='model-reload', daemon=True).start()
+        return True
+
+    def _run(self):
+        start = time.perf_counter()
+        self._state.update(state='loading', last_started=_now(), last_error=None)
+        try:
+            version = self.reload_fn()
+        except Exception as e:
+            logger.error(f"Model reload failed, still serving the previous version: {str(e)}")
+            self._state.update(state='failed', last_error=str(e),
+                               failures=self._state['failures'] + 1)
+        else:
+            self._state.update(state='idle', version=version, reloads=self._state['reloads'] + 1)
+        finally:
+            self._state.update(last_finished=_now(),
+                               last_seconds=round(time.perf_counter() - start, 3))
+            self._lock.release()
+
+    def start_watching(self):
+        """Start the polling thread unless it is already running in this process"""
+        if self.interval and not (self._thread is not None and self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._watch, name='model-watch', daemon=True)
+            self._thread.start()
+
+    def _watch(self):
+        loaded = self.fingerprint_fn()
+        pending = None
+        while True:
+            time.sleep(self.interval)
+            try:
+                stamp = self.fingerprint_fn()
+            except Exception as e:
+                logger.warning(f"Could not check model artifacts: {str(e)}")
+                continue
+            if stamp == loaded:
+                pending = None
+            elif stamp != pending:
+                # Changed since the last check: wait for it to settle
+                pending = stamp
+            else:
+                logger.info("Model artifacts changed, reloading")
+                self.reload(wait=True)
+                if self._state['state'] == 'idle':
+                    loaded = stamp
+                pending = None
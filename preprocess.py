@@ -0,0 +1,272 @@
+"""Incremental preprocessing from the raw job CSV to the model dataset.
+
+Builds the derived columns the models use (Salary_Lower/Upper/Mid/Currency,
+*_Encoded, Skills_List) from "Research Project (1).csv" in chunks. Every raw row is
+fingerprinted; rows whose fingerprint is unchanged since the last run are
+reused as-is, so a daily delta only parses the new or edited postings.
+
+    python preprocess.py "Research Project (1).csv"
+    python preprocess.py new_postings.csv --delta
+    python preprocess.py "Research Project (1).csv" --legacy-csv
+
+Outputs (in --out-dir, ./preprocessed by default):
+    preprocess_state.parquet      every processed row with its fingerprint
+    preprocessed_it_jobs.parquet  typed dataset for --industry (lists stay lists)
+    preprocessed_it_jobs_skills.npz  sparse job x skill CSR matrix, one row per output row
+    *_encoder.pkl, skills_binarizer.pkl  written only when new labels appear
+
+Encoders are read from --out-dir when an earlier run left them there, and
+otherwise from --encoders (the shipped pickles in the working directory).
+Grown encoders no longer match the trained models, so they are never
+written over the ones they were read from unless --overwrite-encoders
+is given; train on the output with train_models.py --encoders <out-dir>.
+"""
+import argparse
+import logging
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+from salary_parser import parse_salary_column
+from skill_index import (save_skill_matrix, skill_matrix, skill_matrix_path, skill_vocabulary,
+                         split_skills)
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMN = 'Job_ID'
+RAW_COLUMNS = ['Job_ID', 'Job_Title', 'Industry', 'Skills_Required', 'Education_Required',
+               'Experience_Level', 'Location', 'Salary_Range', 'Demand_Level']
+
+# Raw column -> (encoded column, encoder file)
+LABEL_ENCODERS = {
+    'Job_Title': ('Job_Title_Encoded', 'job_encoder.pkl'),
+    'Industry': ('Industry_Encoded', 'industry_encoder.pkl'),
+    'Location': ('Location_Encoded', 'location_encoder.pkl'),
+    'Experience_Level': ('Experience_Level_Encoded', 'experience_encoder.pkl'),
+    'Demand_Level': ('Demand_Level_Encoded', 'demand_encoder.pkl'),
+}
+SKILLS_ENCODER_FILE = 'skills_binarizer.pkl'
+# Columns read as strings but typed in the output dataset
+TYPED_COLUMNS = {'Job_ID': 'int64'}
+
+STATE_FILE = 'preprocess_state.parquet'
+OUTPUT_FILE = 'preprocessed_it_jobs.parquet'
+LEGACY_CSV_FILE = 'preprocessed_it_jobs.csv'
+
+
+def read_raw_chunks(path, chunk_size):
+    """Yield cleaned chunks of the raw CSV as string columns"""
+    for frame in pd.read_csv(path, chunksize=chunk_size, dtype=str):
+        junk_columns = [c for c in frame.columns if c.startswith('Unnamed:')]
+        # Rows spilling into the unnamed columns are shifted, malformed records
+        malformed = frame[junk_columns].notna().any(axis=1) if junk_columns else False
+        # The export repeats its header row in the middle of the file
+        repeated_header = frame['Job_Title'] == 'Job_Title'
+        # Job IDs are integers; anything else cannot be keyed or typed
+        bad_key = pd.to_numeric(frame[KEY_COLUMN], errors='coerce').isna()
+        bad = malformed | repeated_header | bad_key
+        dropped = frame[bad]
+        if len(dropped):
+            logger.warning(f"Dropping {len(dropped)} malformed rows: {dropped[KEY_COLUMN].tolist()}")
+        yield frame.loc[~bad, RAW_COLUMNS].reset_index(drop=True)
+
+
+def fingerprint_rows(frame):
+    """64-bit content hash of every raw row"""
+    return pd.util.hash_pandas_object(frame[RAW_COLUMNS], index=False).to_numpy()
+
+
+def derive_columns(frame):
+    """Parse the non-encoded derived columns of new or changed rows"""
+    frame = pd.concat([frame, parse_salary_column(frame['Salary_Range'])], axis=1)
+    frame['Skills_List'] = frame['Skills_Required'].map(split_skills)
+    return frame
+
+
+def encoder_files():
+    """Column -> file name of every encoder the pipeline maintains"""
+    files = {column: file_name for column, (_, file_name) in LABEL_ENCODERS.items()}
+    files['Skills_List'] = SKILLS_ENCODER_FILE
+    return files
+
+
+def load_encoders(*encoder_dirs):
+    """Load the existing label encoders and skills binarizer, if any
+
+    Each encoder comes from the first directory that has it.
+    """
+    encoders = {}
+    for column, file_name in encoder_files().items():
+        for encoder_dir in encoder_dirs:
+            path = os.path.join(encoder_dir, file_name)
+            if os.path.exists(path):
+                encoders[column] = joblib.load(path)
+                break
+    return encoders
+
+
+def update_encoders(encoders, dataset):
+    """Grow encoder vocabularies with unseen labels
+
+    Existing classes are kept (including any the shipped encoders learned
+    from junk rows), so codes only move when a genuinely new label sorts in
+    between them. Returns the names of the encoders that changed.
+    """
+    changed = []
+    for column in LABEL_ENCODERS:
+        labels = set(dataset[column].dropna().unique())
+        encoder = encoders.get(column)
+        known = set(encoder.classes_) if encoder is not None else set()
+        if labels - known:
+            encoders[column] = LabelEncoder().fit(sorted(known | labels))
+            changed.append(column)
+
+    skills = set(dataset['Skills_List'].explode().dropna().unique())
+    mlb = encoders.get('Skills_List')
+    known = set(mlb.classes_) if mlb is not None else set()
+    if skills - known:
+        encoders['Skills_List'] = MultiLabelBinarizer(classes=sorted(known | skills)).fit([])
+        changed.append('Skills_List')
+    return changed
+
+
+def encode_columns(dataset, encoders):
+    """Vectorized label encoding of every categorical column"""
+    for column, (encoded_column, _) in LABEL_ENCODERS.items():
+        codes = pd.Categorical(dataset[column], categories=encoders[column].classes_).codes
+        dataset[encoded_column] = codes.astype(np.int64)
+    return dataset
+
+
+def save_encoders(encoders, changed, out_dir):
+    for column in changed:
+        joblib.dump(encoders[column], os.path.join(out_dir, encoder_files()[column]))
+
+
+def cast_columns(frame):
+    """Give the string-read columns their output types"""
+    return frame.astype({column: dtype for column, dtype in TYPED_COLUMNS.items()
+                         if column in frame})
+
+
+def same_directory(path, other):
+    """Whether two paths name one directory (a missing one only equals itself)"""
+    if os.path.exists(path) and os.path.exists(other):
+        return os.path.samefile(path, other)
+    return os.path.abspath(path) == os.path.abspath(other)
+
+
+def run_pipeline(raw_path, out_dir='preprocessed', chunk_size=50000, delta=False, industry='IT',
+                 legacy_csv=False, encoder_dir='.', overwrite_encoders=False):
+    """Bring the derived dataset up to date with raw_path
+
+    With delta=True the input only holds new or edited postings and every
+    previously processed row is kept; otherwise rows missing from the input
+    are treated as deleted. Raises ValueError, before writing anything, if
+    new labels would overwrite encoders in encoder_dir and
+    overwrite_encoders is not set.
+    """
+    start = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    state_path = os.path.join(out_dir, STATE_FILE)
+    state = pd.read_parquet(state_path) if os.path.exists(state_path) else None
+    previous = (pd.Series(state['Fingerprint'].to_numpy(), index=state[KEY_COLUMN])
+                if state is not None else pd.Series(dtype=np.uint64))
+    # States written before duplicate keys were collapsed may still repeat one
+    previous = previous[~previous.index.duplicated(keep='last')]
+
+    reused, fresh, seen = [], [], []
+    position = 0
+    for chunk in read_raw_chunks(raw_path, chunk_size):
+        # Rows are labelled by their position in the whole input
+        chunk.index = pd.RangeIndex(position, position + len(chunk))
+        position += len(chunk)
+        chunk['Fingerprint'] = fingerprint_rows(chunk)
+        unchanged = chunk['Fingerprint'].to_numpy() == previous.reindex(chunk[KEY_COLUMN]).to_numpy()
+        reused.append(chunk.loc[unchanged, KEY_COLUMN])
+        fresh.append(derive_columns(chunk[~unchanged]))
+        seen.append(chunk[KEY_COLUMN])
+
+    seen = pd.concat(seen) if seen else pd.Series(dtype=str)
+    # A Job_ID repeated in the input is its last occurrence, whether that
+    # one is unchanged or new
+    latest = ~seen.duplicated(keep='last')
+    reused = pd.concat(reused) if reused else pd.Series(dtype=str)
+    reused = reused[latest[reused.index].to_numpy()]
+    fresh = pd.concat(fresh) if fresh else pd.DataFrame(columns=RAW_COLUMNS)
+    fresh = fresh[latest[fresh.index].to_numpy()].reset_index(drop=True)
+
+    if state is None:
+        dataset = fresh
+    else:
+        keep = state[KEY_COLUMN].isin(reused)
+        if delta:
+            keep = ~state[KEY_COLUMN].isin(fresh[KEY_COLUMN])
+        dataset = pd.concat([state[keep], fresh], ignore_index=True)
+    removed = 0 if state is None or delta else int((~state[KEY_COLUMN].isin(seen)).sum())
+
+    encoders = load_encoders(out_dir, encoder_dir)
+    changed = update_encoders(encoders, dataset)
+    if changed and same_directory(out_dir, encoder_dir) and not overwrite_encoders:
+        raise ValueError(f"New labels for {changed} would overwrite the encoders in {encoder_dir}; "
+                         f"write to another --out-dir or pass --overwrite-encoders")
+    dataset = encode_columns(dataset, encoders)
+    if changed:
+        save_encoders(encoders, changed, out_dir)
+        logger.warning(f"Encoder vocabularies changed for {changed}; retrain the models "
+                       f"before serving them with the new encoders")
+
+    dataset = dataset.sort_values(KEY_COLUMN, key=lambda ids: pd.to_numeric(ids, errors='coerce'),
+                                  kind='stable').reset_index(drop=True)
+    dataset.to_parquet(state_path, index=False)
+
+    output = dataset[dataset['Industry'] == industry] if industry else dataset
+    output = cast_columns(output.drop(columns='Fingerprint'))
+    output_path = os.path.join(out_dir, OUTPUT_FILE)
+    output.to_parquet(output_path, index=False)
+    save_skill_matrix(skill_matrix_path(output_path),
+                      skill_matrix(output['Skills_List'], skill_vocabulary(encoders['Skills_List'])))
+    if legacy_csv:
+        legacy = output.assign(Skills_List=output['Skills_List'].map(lambda s: str(list(s))))
+        legacy.to_csv(os.path.join(out_dir, LEGACY_CSV_FILE), index=False)
+
+    summary = {
+        'rows': len(dataset),
+        'output_rows': len(output),
+        'new_or_changed': len(fresh),
+        'unchanged': len(dataset) - len(fresh),
+        'removed': removed,
+        'encoders_changed': changed,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+    logger.info(f"Preprocessing summary: {summary}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental preprocessing of the raw job CSV')
+    parser.add_argument('raw_csv')
+    parser.add_argument('--out-dir', default='preprocessed')
+    parser.add_argument('--encoders', default='.',
+                        help='directory of the current encoder pickles, used until --out-dir has its own')
+    parser.add_argument('--overwrite-encoders', action='store_true',
+                        help='allow --out-dir to be the --encoders directory when labels change')
+    parser.add_argument('--chunk-size', type=int, default=50000)
+    parser.add_argument('--delta', action='store_true',
+                        help='input only holds new or changed rows; keep all other rows')
+    parser.add_argument('--industry', default='IT', help="industry kept in the output ('' for all)")
+    parser.add_argument('--legacy-csv', action='store_true',
+                        help=f'also write {LEGACY_CSV_FILE} for older consumers')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run_pipeline(args.raw_csv, args.out_dir, args.chunk_size, args.delta, args.industry,
+                 args.legacy_csv, args.encoders, args.overwrite_encoders)
+
+
+if __name__ == '__main__':
+    main()
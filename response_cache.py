@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryBackend:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """LRU/TTL cache in a SQLite file, shared by every worker on a host
+
+    Stands in for a networked cache such as Redis: it has the same get/set
+    interface, survives worker restarts and is visible to all processes.
+    """
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._inherited = []
+        self._writes = 0
+        conn = self._connect()
+        conn.execute('''CREATE TABLE IF NOT EXISTS response_cache
+                        (key TEXT PRIMARY KEY,
+                         value TEXT NOT NULL,
+                         expires_at REAL NOT NULL,
+                         accessed_at REAL NOT NULL)''')
+        conn.execute('''CREATE INDEX IF NOT EXISTS idx_response_cache_accessed
+                        ON response_cache (accessed_at)''')
+        # Created before a pre-forking server forks, so hold no handle
+        conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None,
+                               check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            if conn is not None:
+                # A handle opened before fork belongs to the parent. SQLite
+                # must not use it here, and closing it could checkpoint or
+                # drop the parent's WAL, so it is only kept from being freed
+                self._inherited.append(conn)
+            conn = self._connect()
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute('SELECT value, expires_at FROM response_cache WHERE key = ?',
+                           (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < now:
+            conn.execute('DELETE FROM response_cache WHERE key = ?', (key,))
+            return None
+        conn.execute('UPDATE response_cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return value
+
+    def set(self, key, value, ttl):
+        conn = self._connection()
+        now = time.time()
+        conn.execute('INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?)',
+                     (key, value, now + ttl, now))
+        self._writes += 1
+        # Evict in batches rather than on every write
+        if self._writes % 100 == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries and the least recently used overflow"""
+        conn = self._connection()
+        conn.execute('DELETE FROM response_cache WHERE expires_at < ?', (time.time(),))
+        conn.execute('''DELETE FROM response_cache WHERE key IN
+                        (SELECT key FROM response_cache ORDER BY accessed_at DESC
+                         LIMIT -1 OFFSET ?)''', (self.max_entries,))
+
+    def clear(self):
+        self._connection().execute('DELETE FROM response_cache')
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM response_cache').fetchone()[0]
+
+
+class ResponseCache:
+    """Cache of serialized responses keyed by endpoint, request body and model version"""
+
+    def __init__(self, backend, ttl=300):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint, body, version):
+        """Hash the canonical JSON form of a request"""
+        canonical = json.dumps({'endpoint': endpoint, 'body': body, 'version': version},
+                               sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key):
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self.backend.set(key, value, self.ttl)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'entries': len(self.backend),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def create_response_cache(kind, max_entries=1024, ttl=300, path='response_cache.db'):
+    """Build a response cache from config values ('memory', 'sqlite' or 'off')"""
+    if kind in (None, '', 'off'):
+        return None
+    if kind == 'memory':
+        return ResponseCache(MemoryBackend(max_entries), ttl)
+    if kind == 'sqlite':
+        return ResponseCache(SQLiteBackend(path, max_entries), ttl)
+    raise ValueError(f"Unknown response cache backend: {kind}")
@@ -0,0 +1,222 @@
+"""Offline bulk demand scoring over CSV or JSONL job records.
+
+Streams the input in chunks, scores them on a process pool with the same
+model loading and feature logic as the API (ai_model_api.score_records)
+and writes results incrementally, so memory stays constant however large
+the input is. Each input record has the /predict_demand request fields
+(Job_Title, Location, Experience_Level, Salary_Range, optional Month).
+
+    python score_jobs.py "Research Project (1).csv" scores.jsonl
+    python score_jobs.py postings.jsonl scores_parquet --format parquet --workers 8
+    python score_jobs.py postings.jsonl scores.jsonl --resume
+
+JSONL output is one file; Parquet output is a directory with one part file
+per chunk. A checkpoint next to the output records the last completed
+chunk, and --resume continues from there.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import pandas as pd
+
+import ai_model_api
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_COLUMNS = ['Row', 'Demand_Level', 'Prediction_Score', 'Confidence', 'Status', 'error']
+OUTPUT_TYPES = {'Row': 'int64', 'Demand_Level': 'string', 'Prediction_Score': 'float64',
+                'Confidence': 'float64', 'Status': 'string', 'error': 'string'}
+
+
+def read_chunks(path, chunk_size):
+    """Yield lists of record dicts from a CSV or JSONL file"""
+    if path.endswith(('.jsonl', '.ndjson', '.json')):
+        with open(path) as f:
+            lines = (line for line in f if line.strip())
+            while True:
+                chunk = list(islice(lines, chunk_size))
+                if not chunk:
+                    return
+                records = []
+                for line in chunk:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        records.append(None)
+                yield records
+    else:
+        for frame in pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            frame = frame.replace('', None)
+            yield frame.to_dict('records')
+
+
+def _init_worker():
+    """Load models once per worker unless they were inherited through fork"""
+    if not ai_model_api.models and not ai_model_api.load_models():
+        raise RuntimeError("Failed to load models")
+
+
+def score_chunk(chunk_number, first_row, records, id_column):
+    """Score one chunk, numbering rows by their position in the whole input"""
+    results = ai_model_api.score_records(records)
+    for result, record in zip(results, records):
+        result['Row'] = first_row + result.pop('Index')
+        if id_column and isinstance(record, dict) and id_column in record:
+            result[id_column] = record[id_column]
+    return chunk_number, results
+
+
+class Checkpoint:
+    """Progress file recording the last completed chunk of a scoring run"""
+
+    def __init__(self, output):
+        self.path = output.rstrip('/') + '.checkpoint.json'
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, state):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+
+class JsonlWriter:
+    def __init__(self, path, resume_bytes=0):
+        mode = 'r+' if resume_bytes and os.path.exists(path) else 'w'
+        self._file = open(path, mode)
+        if mode == 'r+':
+            # Drop anything written after the last checkpoint
+            self._file.truncate(resume_bytes)
+            self._file.seek(resume_bytes)
+
+    def write(self, chunk_number, results):
+        for result in results:
+            self._file.write(json.dumps(result) + '\n')
+        self._file.flush()
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path, id_column=None):
+        self.path = path
+        self.columns = OUTPUT_COLUMNS + ([id_column] if id_column else [])
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, chunk_number, results):
+        # Fixed column types, so every part file shares one schema
+        frame = pd.DataFrame(results).reindex(columns=self.columns).astype(OUTPUT_TYPES)
+        frame.to_parquet(os.path.join(self.path, f"part-{chunk_number:06d}.parquet"), index=False)
+        return 0
+
+    def close(self):
+        pass
+
+
+def score_file(input_path, output_path, output_format='jsonl', chunk_size=10000,
+               workers=None, resume=False, id_column=None):
+    """Score every record of input_path, writing results to output_path"""
+    checkpoint = Checkpoint(output_path)
+    state = checkpoint.load() if resume else None
+    if state and (state['input'] != os.path.abspath(input_path) or state['chunk_size'] != chunk_size):
+        raise ValueError("Checkpoint was written for a different input or chunk size")
+    done_chunks = state['completed_chunks'] if state else 0
+    if state:
+        logger.info(f"Resuming after chunk {done_chunks} ({state['rows']} rows)")
+
+    if output_format == 'parquet':
+        writer = ParquetWriter(output_path, id_column)
+    else:
+        writer = JsonlWriter(output_path, state['output_bytes'] if state else 0)
+
+    rows = state['rows'] if state else 0
+    errors = state['errors'] if state else 0
+    start = time.perf_counter()
+    scored_rows = 0
+
+    chunks = enumerate(read_chunks(input_path, chunk_size))
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        max_pending = workers * 2
+        pending = []
+        first_row = 0
+
+        def submit_next():
+            nonlocal first_row
+            for chunk_number, records in chunks:
+                chunk_first_row = first_row
+                first_row += len(records)
+                if chunk_number < done_chunks:
+                    continue
+                pending.append(pool.submit(score_chunk, chunk_number, chunk_first_row,
+                                           records, id_column))
+                return True
+            return False
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        # Results are written in input order, so the checkpoint always
+        # describes a clean prefix of the output
+        while pending:
+            chunk_number, results = pending.pop(0).result()
+            submit_next()
+            output_bytes = writer.write(chunk_number, results)
+            rows += len(results)
+            scored_rows += len(results)
+            errors += sum(1 for result in results if result['Status'] != 'Success')
+            checkpoint.save({
+                'input': os.path.abspath(input_path),
+                'chunk_size': chunk_size,
+                'completed_chunks': chunk_number + 1,
+                'rows': rows,
+                'errors': errors,
+                'output_bytes': output_bytes,
+            })
+            elapsed = time.perf_counter() - start
+            logger.info(f"Chunk {chunk_number}: {rows} rows scored, "
+                        f"{scored_rows / elapsed:,.0f} rows/sec")
+
+    writer.close()
+    elapsed = time.perf_counter() - start
+    summary = {
+        'rows': rows,
+        'errors': errors,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(scored_rows / elapsed, 1) if elapsed else 0.0,
+    }
+    logger.info(f"Scored {rows} rows ({errors} errors), {summary['rows_per_sec']:,} rows/sec")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk job demand scoring over CSV or JSONL')
+    parser.add_argument('input', help='CSV or JSONL file of job records')
+    parser.add_argument('output', help='JSONL file, or directory for --format parquet')
+    parser.add_argument('--format', choices=['jsonl', 'parquet'], default='jsonl')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=None, help='defaults to the CPU count')
+    parser.add_argument('--id-column', default=None, help='input column copied to every result')
+    parser.add_argument('--resume', action='store_true', help='continue from the last checkpoint')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    summary = score_file(args.input, args.output, args.format, args.chunk_size,
+                         args.workers, args.resume, args.id_column)
+    print(json.dumps(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import numpy as np
+from scipy import sparse
+
+MEASURES = ('pmi', 'lift', 'count')
+
+
+class SkillGraph:
+    """Skill co-occurrence index for personalized skill recommendations
+
+    Built once from the sparse job x skill matrix: C = X.T @ X counts how
+    often two skills are required by the same job, and every edge is
+    weighted by its positive PMI (log of lift), its lift, or the raw count.
+    A user's recommendation scores are then the sparse vector-matrix
+    product u @ W over the skills they already have.
+    """
+
+    def __init__(self, matrix, vocabulary, measure='pmi', min_count=1):
+        if measure not in MEASURES:
+            raise ValueError(f"Unknown co-occurrence measure: {measure}")
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+        n_jobs = matrix.shape[0]
+        self.vocabulary = vocabulary
+        self._positions = {skill: i for i, skill in enumerate(vocabulary)}
+        self.measure = measure
+        self.frequency = np.asarray(matrix.sum(axis=0)).ravel()
+
+        cooccurrence = (matrix.T @ matrix).tocoo()
+        keep = (cooccurrence.row != cooccurrence.col) & (cooccurrence.data >= min_count)
+        rows, cols = cooccurrence.row[keep], cooccurrence.col[keep]
+        counts = cooccurrence.data[keep]
+        shape = (len(vocabulary), len(vocabulary))
+        self.cooccurrence = sparse.csr_matrix((counts, (rows, cols)), shape=shape)
+
+        lift = counts * n_jobs / (self.frequency[rows] * self.frequency[cols])
+        if measure == 'pmi':
+            # Pairs seen together less often than chance carry no signal
+            weights = np.maximum(np.log(lift), 0.0)
+        elif measure == 'lift':
+            weights = lift
+        else:
+            weights = counts
+        self.weights = sparse.csr_matrix((weights, (rows, cols)), shape=shape)
+        self.weights.eliminate_zeros()
+
+        # Fallback order for users whose skills have no known neighbours
+        self._popular = np.argsort(-self.frequency, kind='stable')
+
+    def scores(self, skills):
+        """Scores of every candidate skill for a list of owned skills
+
+        The product u @ W for a binary user vector u is the sum of the W
+        rows of the owned skills, so it is computed straight from the CSR
+        arrays; the work is proportional to the neighbours of those skills.
+        Returns (candidate columns, scores, owned columns).
+        """
+        owned = np.unique([self._positions[s] for s in skills
+                           if isinstance(s, str) and s in self._positions]).astype(np.intp)
+        indptr, indices, data = self.weights.indptr, self.weights.indices, self.weights.data
+        segments = [slice(indptr[column], indptr[column + 1]) for column in owned]
+        if not segments:
+            return np.empty(0, dtype=np.intp), np.empty(0), owned
+        columns, inverse = np.unique(np.concatenate([indices[s] for s in segments]),
+                                     return_inverse=True)
+        values = np.bincount(inverse, weights=np.concatenate([data[s] for s in segments]))
+        return columns, values, owned
+
+    def recommend(self, skills, top_n=5):
+        """Top-n skills that co-occur most strongly with the given skills"""
+        if top_n <= 0:
+            return []
+        candidates, values, owned = self.scores(skills)
+        mask = ~np.isin(candidates, owned) & (values > 0)
+        candidates, values = candidates[mask], values[mask]
+
+        # Partial selection of the top n, then sort only those (ties in
+        # vocabulary order)
+        if len(candidates) > top_n:
+            top = np.argpartition(-values, top_n - 1)[:top_n]
+            candidates, values = candidates[top], values[top]
+        ranked = candidates[np.lexsort((candidates, -values))].tolist()
+
+        if len(ranked) < top_n:
+            taken = set(ranked) | set(owned.tolist())
+            for column in self._popular:
+                if len(ranked) == top_n or self.frequency[column] == 0:
+                    break
+                if column not in taken:
+                    ranked.append(int(column))
+        return self.vocabulary[ranked].tolist()
+
+    def related(self, skill, top_n=10):
+        """Skills most strongly associated with a single skill"""
+        return self.recommend([skill], top_n)
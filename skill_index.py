@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def split_skills(skills_str):
+    """Split a Skills_Required string into a list of skills"""
+    if isinstance(skills_str, str) and skills_str != 'Unknown':
+        return [s.strip() for s in skills_str.split(',')]
+    return []
+
+
+def skill_vocabulary(mlb):
+    """Index of the binarizer's skill classes, for vectorized column lookups"""
+    return pd.Index(mlb.classes_)
+
+
+def skill_matrix(skill_lists, vocabulary):
+    """Binary job x skill CSR matrix in the binarizer's column order
+
+    Equivalent to mlb.transform(skill_lists) (skills outside the vocabulary
+    are ignored), but built directly from the nonzero entries so time and
+    memory scale with the number of skills listed, not with jobs x vocabulary.
+    """
+    skill_lists = pd.Series(list(skill_lists), dtype=object).reset_index(drop=True)
+    skills = skill_lists.explode().dropna()
+    columns = vocabulary.get_indexer(skills)
+    known = columns >= 0
+    matrix = sparse.csr_matrix(
+        (np.ones(known.sum()), (skills.index.to_numpy()[known], columns[known])),
+        shape=(len(skill_lists), len(vocabulary)))
+    # A skill listed twice in one job is still a single 1
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    return matrix
+
+
+def skill_matrix_path(data_file):
+    """Location of the skill matrix stored next to a jobs dataframe file"""
+    return os.path.splitext(data_file)[0] + '_skills.npz'
+
+
+def save_skill_matrix(path, matrix):
+    sparse.save_npz(path, sparse.csr_matrix(matrix), compressed=True)
+
+
+def load_skill_matrix(path):
+    return sparse.load_npz(path).tocsr()
+
+
+def assign_skill_clusters(matrix, kmeans):
+    """Predict the KMeans skill cluster of every row of a skill matrix"""
+    return kmeans.predict(matrix)
+
+
+def build_cluster_skill_index(matrix, clusters, vocabulary):
+    """Rank skills by frequency inside every skill cluster
+
+    Per-cluster counts come from one sparse product of a cluster indicator
+    matrix with the skill matrix. Returns a dict mapping cluster id -> list
+    of skills, most frequent first (ties in vocabulary order).
+    """
+    cluster_ids, rows = np.unique(np.asarray(clusters), return_inverse=True)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, np.arange(len(rows)))),
+        shape=(len(cluster_ids), len(rows)))
+    counts = (indicator @ matrix).toarray()
+
+    index = {}
+    for cluster, cluster_counts in zip(cluster_ids, counts):
+        present = np.flatnonzero(cluster_counts)
+        order = present[np.argsort(-cluster_counts[present], kind='stable')]
+        index[int(cluster)] = vocabulary[order].tolist()
+    return index
@@ -0,0 +1,158 @@
+"""Packed bitset skill sets.
+
+Skills are interned to integer IDs (the MultiLabelBinarizer column order,
+so ID i is column i of the skill matrix) and a set of skills is stored as
+ceil(n_skills / 64) uint64 words. A SkillSet may hold one set (1-D bits)
+or many (2-D bits, one row per set); union, intersection, difference and
+popcounts are single numpy operations either way, so comparing one user
+against thousands of jobs costs a handful of vectorized word operations.
+"""
+import numpy as np
+from scipy import sparse
+
+WORD_BITS = 64
+
+
+def n_words(n_skills):
+    return max(1, -(-n_skills // WORD_BITS))
+
+
+def pack_ids(ids, n_skills):
+    """Bitset words of one set of skill IDs"""
+    ids = np.asarray(ids, dtype=np.uint64)
+    bits = np.zeros(n_words(n_skills), dtype=np.uint64)
+    np.bitwise_or.at(bits, (ids >> np.uint64(6)).astype(np.intp),
+                     np.left_shift(np.uint64(1), ids & np.uint64(63)))
+    return bits
+
+
+def pack_matrix(matrix):
+    """Bitset rows of a binary sparse (or dense) job x skill matrix"""
+    matrix = sparse.csr_matrix(matrix)
+    rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    columns = matrix.indices.astype(np.uint64)
+    bits = np.zeros((matrix.shape[0], n_words(matrix.shape[1])), dtype=np.uint64)
+    np.bitwise_or.at(bits, (rows, (columns >> np.uint64(6)).astype(np.intp)),
+                     np.left_shift(np.uint64(1), columns & np.uint64(63)))
+    return bits
+
+
+def popcount(bits):
+    """Number of set bits in the last axis of an array of words"""
+    counts = np.bitwise_count(bits)
+    if counts.ndim == 1:
+        return int(counts.sum())
+    # Accumulating word columns beats a reduction along the short last axis
+    total = counts[..., 0].astype(np.int64)
+    for word in range(1, counts.shape[-1]):
+        total += counts[..., word]
+    return total
+
+
+def unpack_ids(bits):
+    """Sorted skill IDs set in one row of bitset words"""
+    flags = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), bitorder='little')
+    return np.flatnonzero(flags)
+
+
+class SkillVocabulary:
+    """Skill name <-> integer ID interning table"""
+
+    def __init__(self, skills):
+        self.skills = list(dict.fromkeys(skills))
+        self.ids = {skill: i for i, skill in enumerate(self.skills)}
+
+    @classmethod
+    def from_mlb(cls, mlb, extra_skills=()):
+        """Vocabulary in the binarizer's column order, plus any extra skills after it"""
+        return cls(list(mlb.classes_) + list(extra_skills))
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __contains__(self, skill):
+        return skill in self.ids
+
+    def ids_of(self, skills):
+        """IDs of the known skills in a list, in list order (unknown ones dropped)"""
+        return np.array([self.ids[s] for s in skills if isinstance(s, str) and s in self.ids],
+                        dtype=np.intp)
+
+    def names(self, ids):
+        return [self.skills[i] for i in ids]
+
+    def pack(self, skills):
+        """SkillSet of one list of skills"""
+        return SkillSet(pack_ids(self.ids_of(skills), len(self)), self)
+
+    def pack_many(self, skill_lists):
+        """SkillSet with one row per list of skills"""
+        bits = np.vstack([pack_ids(self.ids_of(skills), len(self)) for skills in skill_lists]
+                         or [np.zeros((0, n_words(len(self))), dtype=np.uint64)])
+        return SkillSet(bits, self)
+
+    def pack_matrix(self, matrix):
+        """SkillSet rows of a job x skill matrix whose columns are these IDs"""
+        return SkillSet(pack_matrix(matrix), self)
+
+
+class SkillSet:
+    """One (1-D bits) or many (2-D bits) skill sets over a shared vocabulary
+
+    Binary operators broadcast, so `jobs - user` gives every job's missing
+    skills and `(jobs & user).count()` every job's overlap with the user.
+    """
+
+    def __init__(self, bits, vocabulary):
+        self.bits = bits
+        self.vocabulary = vocabulary
+
+    def _bits_of(self, other):
+        return other.bits if isinstance(other, SkillSet) else self.vocabulary.pack(other).bits
+
+    def __or__(self, other):
+        return SkillSet(self.bits | self._bits_of(other), self.vocabulary)
+
+    def __and__(self, other):
+        return SkillSet(self.bits & self._bits_of(other), self.vocabulary)
+
+    def __sub__(self, other):
+        return SkillSet(self.bits & ~self._bits_of(other), self.vocabulary)
+
+    def __getitem__(self, rows):
+        return SkillSet(self.bits[rows], self.vocabulary)
+
+    def __contains__(self, skill):
+        skill_id = self.vocabulary.ids.get(skill)
+        return skill_id is not None and bool(self.has_ids([skill_id])[0])
+
+    def count(self):
+        """Number of skills in the set (an array of counts for many sets)"""
+        return popcount(self.bits)
+
+    def overlap(self, other):
+        """Size of the intersection with another set, per row"""
+        return popcount(self.bits & self._bits_of(other))
+
+    def jaccard(self, other):
+        """Jaccard similarity with another set, per row"""
+        other_bits = self._bits_of(other)
+        intersection = popcount(self.bits & other_bits)
+        union = popcount(self.bits | other_bits)
+        return np.divide(intersection, union, out=np.zeros(np.shape(union)), where=union > 0)
+
+    def has_ids(self, ids):
+        """Membership of each skill ID in a single set"""
+        ids = np.asarray(ids, dtype=np.uint64)
+        words = self.bits[(ids >> np.uint64(6)).astype(np.intp)]
+        return (words >> (ids & np.uint64(63))) & np.uint64(1) == 1
+
+    def ids(self):
+        return unpack_ids(self.bits)
+
+    def to_list(self):
+        """Skill names of a single set, in vocabulary order"""
+        return self.vocabulary.names(self.ids())
+
+    def to_lists(self):
+        return [self.vocabulary.names(unpack_ids(row)) for row in self.bits]
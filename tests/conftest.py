@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root, next to this directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def api():
+    """ai_model_api with the legacy artifacts in the repository root loaded"""
+    os.chdir(ROOT)
+    import ai_model_api
+    if not ai_model_api.models and not ai_model_api.load_models():
+        pytest.skip('model artifacts could not be loaded')
+    return ai_model_api
@@ -0,0 +1,49 @@
+import pytest
+
+
+@pytest.fixture
+def client(api):
+    return api.app.test_client()
+
+
+@pytest.fixture
+def records(api):
+    return api.models['df_it'][api.REQUIRED_FIELDS].head(3).to_dict('records')
+
+
+def test_batch_reports_bad_records_per_row(client, records):
+    bad = {'Job_Title': ['x'], 'Location': {'city': 'Colombo'}, 'Experience_Level': None,
+           'Salary_Range': ['150000-200000'], 'Month': [2]}
+    response = client.post('/predict_demand/batch', json=[records[0], bad, 'not a record', records[1]])
+    assert response.status_code == 200
+    results = response.get_json()['Results']
+    assert [result['Status'] for result in results] == ['Success', 'Error', 'Error', 'Success']
+    assert 'Invalid Salary_Range' in results[1]['error']
+    assert response.get_json()['Errors'] == 2
+
+
+def test_batch_matches_single_predictions(client, records):
+    batch = client.post('/predict_demand/batch', json=records).get_json()['Results']
+    for record, result in zip(records, batch):
+        single = client.post('/predict_demand', json=record).get_json()
+        assert single['Demand_Level'] == result['Demand_Level']
+
+
+@pytest.mark.parametrize('field,value', [
+    ('Salary_Range', 'Negotiable'), ('Salary_Range', None), ('Month', 'June'), ('Month', [2]),
+])
+def test_invalid_values_are_rejected_on_both_paths(client, records, field, value):
+    record = {**records[0], field: value}
+    single = client.post('/predict_demand', json=record)
+    assert single.status_code == 400
+    assert field in single.get_json()['details']
+    result = client.post('/predict_demand/batch', json=[record]).get_json()['Results'][0]
+    assert result['Status'] == 'Error' and f'Invalid {field}' in result['error']
+
+
+def test_missing_month_defaults_on_both_paths(client, records):
+    record = {**records[0], 'Month': None}
+    single = client.post('/predict_demand', json=record).get_json()
+    batch = client.post('/predict_demand/batch', json=[record]).get_json()['Results'][0]
+    assert single['Status'] == batch['Status'] == 'Success'
+    assert single['Demand_Level'] == batch['Demand_Level']
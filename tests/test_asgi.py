@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+
+def request(app, method, path, query_string=b'', body=b'', headers=()):
+    """Drive one HTTP request through an ASGI app, returning (status, headers, body)"""
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query_string,
+             'headers': [(b'content-type', b'application/json'), *headers]}
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, payload = sent
+    return start['status'], dict(start['headers']), payload['body']
+
+
+@pytest.fixture(scope='module')
+def asgi(api):
+    # Imported after the api fixture moved to the repository root
+    import asgi
+    return asgi
+
+
+@pytest.fixture
+def app(asgi):
+    return asgi.BoundedASGIApp(max_workers=2, max_queue=2, timeout=30)
+
+
+def test_health(app):
+    status, headers, body = request(app, 'GET', '/health')
+    assert status == 200
+    assert json.loads(body)['status'] == 'healthy'
+
+
+def test_query_string_reaches_the_wsgi_app(asgi, app, monkeypatch):
+    seen = {}
+    run_wsgi_app = asgi.run_wsgi_app
+
+    def capture(wsgi_app, environ):
+        seen['query'] = environ['QUERY_STRING']
+        return run_wsgi_app(wsgi_app, environ)
+
+    monkeypatch.setattr(asgi, 'run_wsgi_app', capture)
+    status, _, _ = request(app, 'GET', '/health', query_string=b'x=1&city=Colombo%20')
+    assert status == 200
+    assert seen['query'] == 'x=1&city=Colombo%20'
+
+
+def test_post_body(app):
+    body = json.dumps({'skills': ['Python', 'SQL']}).encode()
+    status, _, data = request(app, 'POST', '/match_jobs', body=body)
+    assert status == 200, data
+
+
+def test_full_queue_answers_429(app):
+    app.in_flight = app.capacity
+    status, headers, _ = request(app, 'GET', '/health')
+    assert status == 429
+    assert headers[b'retry-after'] == b'1'
+    assert app.rejected == 1
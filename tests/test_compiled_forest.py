@@ -0,0 +1,60 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from compiled_forest import CompiledForest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def assert_parity(forest, X):
+    compiled = CompiledForest.from_sklearn(forest)
+    np.testing.assert_array_equal(compiled.predict_proba(X), forest.predict_proba(X))
+    np.testing.assert_array_equal(compiled.predict(X), forest.predict(X))
+
+
+def sample(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 4))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int) + (X[:, 2] > 1)
+    return X, y
+
+
+def test_parity_without_missing_values():
+    X, y = sample(400)
+    forest = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+    assert_parity(forest, sample(300, seed=1)[0])
+
+
+def test_parity_with_missing_values_seen_in_training():
+    X, y = sample(400)
+    X[::7, 1] = np.nan
+    forest = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+    X_test = sample(300, seed=1)[0]
+    X_test[::3, 1] = np.nan
+    X_test[::5, 0] = np.nan
+    assert_parity(forest, X_test)
+
+
+def test_parity_with_missing_values_unseen_in_training():
+    X, y = sample(400)
+    forest = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+    X_test = sample(300, seed=1)[0]
+    X_test[::2, 3] = np.nan
+    X_test[1::4, 0] = np.nan
+    assert_parity(forest, X_test)
+
+
+@pytest.mark.skipif(not os.path.exists(os.path.join(ROOT, 'job_forecasting_model.pkl')),
+                    reason='demand model not available')
+def test_parity_with_demand_model():
+    forest = joblib.load(os.path.join(ROOT, 'job_forecasting_model.pkl'))
+    rng = np.random.default_rng(0)
+    # Encoded title, location, experience, lower salary and month
+    X = np.column_stack([rng.integers(0, 40, 500), rng.integers(0, 10, 500), rng.integers(0, 4, 500),
+                         rng.uniform(0, 500000, 500), rng.integers(1, 13, 500)]).astype(float)
+    X[::4, 3] = np.nan
+    assert_parity(forest, X)
@@ -0,0 +1,65 @@
+import sqlite3
+import threading
+
+import pytest
+
+import db
+
+SCHEMA = 'CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)'
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = db.ConnectionPool(str(tmp_path / 'test.db'), size=2, timeout=0.2)
+    pool.ensure_schema(SCHEMA)
+    yield pool
+    pool.close()
+
+
+def test_connections_use_wal_and_are_reused(pool):
+    assert pool.query_one('PRAGMA journal_mode')[0] == 'wal'
+    for _ in range(5):
+        pool.query('SELECT 1')
+    assert pool.stats()['open'] == 1 and pool.stats()['idle'] == 1
+
+
+def test_failed_transaction_rolls_back(pool):
+    assert pool.execute('INSERT INTO items (name) VALUES (?)', ('a',)) == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        with pool.transaction() as conn:
+            conn.execute('INSERT INTO items (name) VALUES (?)', ('b',))
+            conn.execute('INSERT INTO items (name) VALUES (?)', ('a',))
+    assert pool.query('SELECT name FROM items') == [('a',)]
+    # The connection went back to the pool outside any transaction
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+
+
+def test_exhausted_pool_times_out(pool):
+    with pool.connection(), pool.connection():
+        with pytest.raises(sqlite3.OperationalError):
+            pool.query('SELECT 1')
+    assert pool.stats()['open'] == 2
+
+
+def test_readers_do_not_block_a_writer(pool):
+    pool.execute('INSERT INTO items (name) VALUES (?)', ('a',))
+    with pool.connection() as reader:
+        reader.execute('BEGIN')
+        assert reader.execute('SELECT COUNT(*) FROM items').fetchone() == (1,)
+        writer = threading.Thread(target=pool.execute,
+                                  args=('INSERT INTO items (name) VALUES (?)', ('b',)))
+        writer.start()
+        writer.join(5)
+        # The open read transaction still sees its snapshot
+        assert reader.execute('SELECT COUNT(*) FROM items').fetchone() == (1,)
+    assert pool.query_one('SELECT COUNT(*) FROM items') == (2,)
+
+
+def test_get_pool_is_per_path(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    try:
+        assert db.get_pool(path) is db.get_pool(path)
+        assert db.get_pool(str(tmp_path / 'other.db')) is not db.get_pool(path)
+    finally:
+        db.close_all()
@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import education_pathways
+from education_pathways import EDUCATION_PATHWAYS, PathwayIndex
+from skill_index import split_skills
+
+ROOT = os.path.dirname(os.path.abspath(education_pathways.__file__))
+
+
+def naive_resolve(pathways, skills):
+    """The nested keyword-in-skill loops PathwayIndex replaces"""
+    skills = list(dict.fromkeys(skills))
+    return {category: [(pathway, skill) for skill in skills
+                       for keyword, pathway in keywords.items() if keyword.lower() in skill.lower()]
+            for category, keywords in pathways.items()}
+
+
+def test_catalog_matches_naive_loops_on_dataset_skills():
+    jobs = pd.read_csv(os.path.join(ROOT, 'preprocessed_it_jobs.csv'))
+    skills = sorted({skill for skills in jobs['Skills_Required'].map(split_skills) for skill in skills})
+    skills += ['Cloud Computing', 'AWS Lambda', 'javascript', 'Cyber Security', 'Agile/Scrum']
+    resolved = PathwayIndex().resolve(skills)
+    assert resolved == naive_resolve(EDUCATION_PATHWAYS, skills)
+    assert resolved['Professional Certifications']
+
+
+def test_overlapping_keywords_match_naive_loops():
+    # Keywords that are suffixes and prefixes of each other exercise the failure links
+    pathways = {
+        'A': {'he': 'p1', 'she': 'p2', 'his': 'p3', 'hers': 'p4'},
+        'B': {'HE': 'p5', 'ushers': 'p6', 'é': 'p7', 'aaa': 'p8'},
+    }
+    rng = np.random.default_rng(0)
+    skills = [''.join(rng.choice(list('heErsuiaé '), rng.integers(0, 12))) for _ in range(500)]
+    skills += ['ushers', 'Shepherd', 'aaaa', '']
+    index = PathwayIndex(pathways)
+    assert len(index) == 8
+    assert index.resolve(skills) == naive_resolve(pathways, skills)
+
+
+def test_repeated_skills_resolve_once():
+    resolved = PathwayIndex().resolve(['Python', 'Python', 'Go'])
+    assert resolved['Degree Programs'] == [('BSc in Computer Science', 'Python')]
+    assert resolved['Short Courses'] == []
@@ -0,0 +1,55 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+import incremental_clustering
+from incremental_clustering import CLUSTER_COLUMN, RowSample, read_chunks, refit
+from skill_index import skill_vocabulary
+
+ROOT = os.path.dirname(os.path.abspath(incremental_clustering.__file__))
+DATA_FILE = os.path.join(ROOT, 'preprocessed_it_jobs.csv')
+
+
+@pytest.fixture(scope='module')
+def vocabulary():
+    return skill_vocabulary(joblib.load(os.path.join(ROOT, 'skills_binarizer.pkl')))
+
+
+def test_row_sample_keeps_a_bounded_subset_in_stream_order():
+    sample = RowSample(10, seed=1)
+    for first in range(0, 100, 7):
+        rows = np.arange(first, min(first + 7, 100))
+        sample.add(sparse.csr_matrix(rows[:, None].astype(float)))
+    kept = sample.matrix.toarray().ravel()
+    assert len(kept) == 10 and len(set(kept)) == 10
+    assert (np.diff(kept) > 0).all()
+    assert RowSample(0).matrix is None
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.parquet'])
+def test_warm_started_refit_labels_every_row(tmp_path, vocabulary, extension):
+    kmeans = joblib.load(os.path.join(ROOT, 'skill_clustering_model.pkl'))
+    out_file = str(tmp_path / f'clustered{extension}')
+    model, metrics = refit(DATA_FILE, vocabulary, kmeans, out_file=out_file,
+                           chunk_size=100, batch_size=64, epochs=2, compare_rows=200)
+    assert model.n_clusters == kmeans.n_clusters and metrics['warm_start']
+
+    original = pd.read_csv(DATA_FILE)
+    clustered = pd.concat(read_chunks(out_file, chunk_size=100))
+    assert len(clustered) == len(original) == metrics['rows']
+    assert clustered['Job_ID'].tolist() == original['Job_ID'].tolist()
+    assert clustered[CLUSTER_COLUMN].between(0, model.n_clusters - 1).all()
+    assert sum(metrics['cluster_sizes']) == len(original)
+    assert metrics['comparison']['rows'] == 200
+    assert -1 <= metrics['comparison']['adjusted_rand'] <= 1
+
+
+def test_refit_needs_enough_rows(tmp_path, vocabulary):
+    data_file = str(tmp_path / 'tiny.csv')
+    pd.read_csv(DATA_FILE, nrows=3).to_csv(data_file, index=False)
+    with pytest.raises(ValueError):
+        refit(data_file, vocabulary, n_clusters=5)
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import db
+import job_catalog
+from job_catalog import find_jobs, industry_summary, job_skills, load_catalog, top_skills
+
+SKILLS = ['Python', 'SQL', 'AWS', 'Java', 'Docker', 'Excel']
+INDUSTRIES = ['IT', 'Finance', None]
+LOCATIONS = ['Colombo', 'Kandy', 'Galle']
+
+
+def make_jobs(n, seed=0, first_id=1):
+    rng = np.random.default_rng(seed)
+    low = rng.integers(50, 300, n) * 1000
+    return pd.DataFrame({
+        'Job_ID': np.arange(first_id, first_id + n),
+        'Job_Title': rng.choice(['Engineer', 'Analyst', 'Manager'], n),
+        'Industry': rng.choice(np.array(INDUSTRIES, dtype=object), n),
+        'Skills_Required': [', '.join(rng.choice(SKILLS, rng.integers(1, 4), replace=False))
+                            for _ in range(n)],
+        'Education_Required': 'Bachelor',
+        'Experience_Level': rng.choice(['Entry-level', 'Mid-level', 'Senior'], n),
+        'Location': rng.choice(LOCATIONS, n),
+        'Salary_Range': [f'{a}-{a + 50000}' if a % 3 else 'Negotiable' for a in low],
+        'Demand_Level': rng.choice(['High', 'Medium', 'Low'], n),
+    })
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    data_file = str(tmp_path / 'jobs.csv')
+    jobs = make_jobs(300)
+    jobs.to_csv(data_file, index=False)
+    db_path = str(tmp_path / 'catalog.db')
+    summary = load_catalog(data_file, db_path, chunk_size=64)
+    yield jobs, data_file, db_path, summary
+    db.close_all()
+
+
+def expected_ids(jobs, location=None, demand=None, skills=()):
+    mask = pd.Series(True, index=jobs.index)
+    if location is not None:
+        mask &= jobs['Location'] == location
+    if demand is not None:
+        mask &= jobs['Demand_Level'] == demand
+    for skill in skills:
+        mask &= jobs['Skills_Required'].str.split(', ').map(lambda names: skill in names)
+    return sorted(jobs.loc[mask, 'Job_ID'])
+
+
+def test_load_counts(catalog):
+    jobs, _, _, summary = catalog
+    assert summary['jobs'] == len(jobs)
+    assert summary['skills'] == len(SKILLS)
+    assert summary['job_skills'] == jobs['Skills_Required'].str.count(',').sum() + len(jobs)
+
+
+@pytest.mark.parametrize('filters', [
+    {'location': 'Colombo'},
+    {'location': 'Kandy', 'demand': 'High'},
+    {'demand': 'Low', 'skills': ['Python']},
+    {'skills': ['SQL', 'AWS']},
+    {'location': 'Galle', 'skills': ['Cobol']},
+])
+def test_find_jobs_matches_pandas(catalog, filters):
+    jobs, _, db_path, _ = catalog
+    found = find_jobs(**filters, limit=1000, db_path=db_path)
+    assert sorted(job['id'] for job in found) == expected_ids(jobs, **filters)
+
+
+def test_find_jobs_limit_and_columns(catalog):
+    jobs, _, db_path, _ = catalog
+    found = find_jobs(location='Colombo', limit=3, db_path=db_path)
+    assert len(found) == 3
+    row = jobs.set_index('Job_ID').loc[found[0]['id']]
+    assert found[0]['title'] == row['Job_Title']
+    assert found[0]['salary_lower'] == (float(row['Salary_Range'].split('-')[0])
+                                        if row['Salary_Range'] != 'Negotiable' else None)
+
+
+def test_append_upserts_jobs_and_their_skills(catalog, tmp_path):
+    jobs, _, db_path, _ = catalog
+    changed = jobs.iloc[:5].assign(Skills_Required='Rust', Location='Jaffna')
+    new = make_jobs(5, seed=1, first_id=1001)
+    delta_file = str(tmp_path / 'delta.csv')
+    pd.concat([changed, new]).to_csv(delta_file, index=False)
+    summary = load_catalog(delta_file, db_path, replace=False)
+    assert summary['jobs'] == 10 and summary['skills'] == len(SKILLS) + 1
+
+    assert job_skills(int(jobs['Job_ID'].iloc[0]), db_path) == ['Rust']
+    assert sorted(job['id'] for job in find_jobs(location='Jaffna', db_path=db_path)) == \
+        sorted(changed['Job_ID'])
+    assert len(find_jobs(limit=10000, db_path=db_path)) == len(jobs) + len(new)
+
+
+def grouped_rollups(db_path, industry=None, location=None):
+    """industry_summary and top_skills recomputed from the jobs table"""
+    rows = find_jobs(industry=industry, location=location, limit=100000, db_path=db_path)
+    salaries = [job['salary_lower'] for job in rows if job['salary_lower'] is not None]
+    skills = {}
+    for job in rows:
+        for skill in job_skills(job['id'], db_path):
+            skills[skill] = skills.get(skill, 0) + 1
+    summary = {'jobs': len(rows), 'high_demand_jobs': sum(job['demand_level'] == 'High' for job in rows),
+               'average_salary': sum(salaries) / len(salaries) if salaries else None}
+    return summary, sorted(skills.items(), key=lambda item: (-item[1], item[0]))
+
+
+def assert_rollups_current(db_path):
+    for industry, location in [(None, None), ('IT', None), ('Finance', 'Kandy'), (None, 'Galle'),
+                               ('Retail', None)]:
+        summary, skills = grouped_rollups(db_path, industry, location)
+        rollup = industry_summary(industry, location, db_path)
+        assert rollup['jobs'] == summary['jobs']
+        assert rollup['high_demand_jobs'] == summary['high_demand_jobs']
+        assert rollup['average_salary'] == pytest.approx(summary['average_salary'])
+        assert top_skills(industry, location, limit=100, db_path=db_path) == skills
+
+
+def test_rollups_follow_loads_and_appends(catalog, tmp_path):
+    jobs, _, db_path, _ = catalog
+    assert_rollups_current(db_path)
+
+    # Move some jobs to another industry and city, change their skills, add new ones
+    moved = jobs.iloc[:20].assign(Industry='Finance', Location='Kandy',
+                                  Skills_Required='Excel, Rust', Demand_Level='High')
+    delta_file = str(tmp_path / 'delta.csv')
+    pd.concat([moved, make_jobs(30, seed=2, first_id=2001)]).to_csv(delta_file, index=False)
+    load_catalog(delta_file, db_path, replace=False)
+    assert_rollups_current(db_path)
+    assert industry_summary('Retail', db_path=db_path) == {
+        'jobs': 0, 'high_demand_jobs': 0, 'average_salary': None}
+
+
+def test_rebuild_is_one_transaction(catalog, tmp_path, monkeypatch):
+    jobs, _, db_path, _ = catalog
+    new_file = str(tmp_path / 'new.csv')
+    make_jobs(100, seed=3, first_id=5001).to_csv(new_file, index=False)
+
+    # Between chunks, readers still see the complete previous catalog
+    views = []
+    chunks = job_catalog.read_chunks
+
+    def observed_chunks(data_file, chunk_size):
+        for frame in chunks(data_file, chunk_size):
+            yield frame
+            views.append(len(find_jobs(limit=100000, db_path=db_path)))
+
+    monkeypatch.setattr(job_catalog, 'read_chunks', observed_chunks)
+    load_catalog(new_file, db_path, chunk_size=30)
+    assert views == [len(jobs)] * 4
+    assert len(find_jobs(limit=100000, db_path=db_path)) == 100
+
+
+def test_failed_rebuild_keeps_the_previous_catalog(catalog, tmp_path):
+    jobs, _, db_path, _ = catalog
+    broken = make_jobs(100, seed=3, first_id=5001).astype({'Job_ID': object})
+    broken.loc[90, 'Job_ID'] = 'not a number'
+    broken_file = str(tmp_path / 'broken.csv')
+    broken.to_csv(broken_file, index=False)
+    with pytest.raises(ValueError):
+        load_catalog(broken_file, db_path, chunk_size=30)
+    assert len(find_jobs(limit=100000, db_path=db_path)) == len(jobs)
+    assert_rollups_current(db_path)
+
+
+def test_rebuild_keeps_only_the_last_skills_of_a_repeated_job(tmp_path):
+    first = make_jobs(10)
+    repeat = first.iloc[[0]].assign(Skills_Required='Rust', Industry='IT')
+    data_file = str(tmp_path / 'jobs.csv')
+    pd.concat([first, repeat]).to_csv(data_file, index=False)
+    db_path = str(tmp_path / 'catalog.db')
+    try:
+        load_catalog(data_file, db_path, chunk_size=5)
+        assert job_skills(1, db_path) == ['Rust']
+        assert len(find_jobs(limit=100, db_path=db_path)) == 10
+        assert_rollups_current(db_path)
+    finally:
+        db.close_all()
+
+
+def test_jobs_without_a_demand_level(catalog, tmp_path):
+    jobs, _, db_path, _ = catalog
+    # Appended to an existing group, then alone in a new one
+    unknown = make_jobs(2, seed=4, first_id=3001).assign(Demand_Level=None)
+    unknown.loc[1, ['Industry', 'Location']] = ['Retail', 'Jaffna']
+    delta_file = str(tmp_path / 'delta.csv')
+    unknown.to_csv(delta_file, index=False)
+    load_catalog(delta_file, db_path, replace=False)
+    assert_rollups_current(db_path)
+    assert industry_summary('Retail', db_path=db_path)['high_demand_jobs'] == 0
+
+    # A rebuild aggregates a group whose only job has no demand level
+    rebuild_file = str(tmp_path / 'rebuild.csv')
+    pd.concat([jobs, unknown]).to_csv(rebuild_file, index=False)
+    load_catalog(rebuild_file, db_path)
+    assert_rollups_current(db_path)
+    assert industry_summary('Retail', 'Jaffna', db_path)['jobs'] == 1
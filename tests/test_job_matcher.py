@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from job_matcher import JobMatcher
+
+VOCABULARY = np.array([f'skill{i:02d}' for i in range(40)])
+
+
+@pytest.fixture(scope='module')
+def jobs():
+    rng = np.random.default_rng(7)
+    rows = [rng.choice(len(VOCABULARY), rng.integers(1, 8), replace=False) for _ in range(300)]
+    rows += [rows[0], []]  # a duplicate skill set and a job without skills
+    matrix = sparse.lil_matrix((len(rows), len(VOCABULARY)))
+    for i, columns in enumerate(rows):
+        matrix[i, columns] = 1
+    return matrix.tocsr(), [set(VOCABULARY[columns]) for columns in rows]
+
+
+def brute_force(job_sets, skills):
+    query = set(skills) & set(VOCABULARY)
+    scores = [len(query & job) / len(query | job) for job in job_sets]
+    return [(job, score) for job, score in enumerate(scores) if score > 0]
+
+
+def test_match_exact_agrees_with_set_arithmetic(jobs):
+    matrix, job_sets = jobs
+    matcher = JobMatcher(matrix, VOCABULARY)
+    skills = ['skill01', 'skill05', 'skill09', 'unknown']
+    # Ties group jobs behind the first job with the same skill set
+    first = {}
+    for job, skill_set in enumerate(job_sets):
+        first.setdefault(frozenset(skill_set), job)
+    expected = sorted(brute_force(job_sets, skills),
+                      key=lambda match: (-match[1], first[frozenset(job_sets[match[0]])], match[0]))
+    matches = matcher.match(skills, top_k=10)
+    assert [job for job, _, _ in matches] == [job for job, _ in expected[:10]]
+    np.testing.assert_allclose([score for _, score, _ in matches],
+                               [score for _, score in expected[:10]])
+    for job, _, missing in matches:
+        assert set(missing) == job_sets[job] - set(skills)
+
+
+def test_duplicate_sets_share_an_entry(jobs):
+    matrix, job_sets = jobs
+    matcher = JobMatcher(matrix, VOCABULARY)
+    assert len(matcher) == matrix.shape[0]
+    assert matcher.n_sets < matrix.shape[0]
+    matches = matcher.match(sorted(job_sets[0]), top_k=2)
+    assert [(job, score, missing) for job, score, missing in matches] == [
+        (0, 1.0, []), (300, 1.0, [])]
+
+
+def test_lsh_finds_identical_and_close_sets(jobs):
+    matrix, job_sets = jobs
+    matcher = JobMatcher(matrix, VOCABULARY, exact_threshold=0)
+    for job in range(20):
+        skills = sorted(job_sets[job])
+        best = matcher.match(skills, top_k=1)
+        assert best[0][1] == 1.0
+        assert job_sets[best[0][0]] == job_sets[job]
+    # LSH can only miss candidates; whatever it returns is scored exactly
+    skills = sorted(job_sets[3])[:-1] + ['skill39']
+    approximate = matcher.match(skills, top_k=5)
+    exact = dict((job, score) for job, score, _ in matcher.match_exact(skills, top_k=len(job_sets)))
+    for job, score, _ in approximate:
+        assert exact[job] == pytest.approx(score)
+
+
+def test_empty_queries(jobs):
+    matcher = JobMatcher(jobs[0], VOCABULARY, exact_threshold=0)
+    assert matcher.match([], top_k=5) == []
+    assert matcher.match(['unknown'], top_k=5) == []
+    assert matcher.match(['skill01'], top_k=0) == []
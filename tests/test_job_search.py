@@ -0,0 +1,104 @@
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import job_search
+from job_search import SEARCH_FIELDS, JobSearchIndex, tokenize
+
+K1, B = 1.2, 0.75
+
+
+@pytest.fixture(scope='module')
+def jobs():
+    rng = np.random.default_rng(5)
+    n = 400
+    return pd.DataFrame({
+        'Job_Title': rng.choice(['Data Scientist', 'Data Engineer', 'Software Engineer',
+                                 'Senior Software Engineer', 'Database Administrator'], n),
+        'Skills_Required': rng.choice(['Python, SQL', 'Java, Spring', 'SQL, Oracle',
+                                       'Python, Machine Learning, Data Analysis', None], n),
+        'Education_Required': rng.choice(['BSc in Computer Science', 'Diploma in IT'], n),
+        'Location': rng.choice(['Colombo', 'Kandy', 'Galle'], n),
+        'Demand_Level': rng.choice(['High', 'Low'], n),
+    })
+
+
+def naive_scores(jobs, query, prefix):
+    """BM25 of every job on its own, straight from the definition"""
+    fields = [field for field in SEARCH_FIELDS if field in jobs]
+    tokens = {field: [tokenize(text) for text in jobs[field]] for field in fields}
+    averages = {field: sum(map(len, tokens[field])) / len(jobs) for field in fields}
+    vocabulary = {token for field in fields for row in tokens[field] for token in row}
+
+    def matches(word):
+        return [t for t in vocabulary if (t.startswith(word) if prefix else t == word)]
+
+    def term_score(job, term):
+        df = sum(any(term in tokens[field][j] for field in fields) for j in range(len(jobs)))
+        idf = math.log1p((len(jobs) - df + 0.5) / (df + 0.5))
+        score = 0.0
+        for field in fields:
+            tf = Counter(tokens[field][job])[term]
+            norm = K1 * (1 - B + B * len(tokens[field][job]) / averages[field])
+            score += SEARCH_FIELDS[field] * tf * (K1 + 1) / (tf + norm)
+        return idf * score
+
+    scores = {}
+    for job in range(len(jobs)):
+        total = 0.0
+        for word in dict.fromkeys(tokenize(query)):
+            best = [term_score(job, term) for term in matches(word)]
+            best = [score for score in best if score > 0]
+            if not best:
+                break
+            total += max(best)
+        else:
+            scores[job] = total
+    return scores
+
+
+@pytest.mark.parametrize('query,prefix', [
+    ('python', False), ('data sci', True), ('software engineer sql', False), ('eng', True),
+])
+def test_scores_match_per_job_bm25(jobs, query, prefix):
+    index = JobSearchIndex(jobs)
+    results = index.search(query, limit=len(jobs), prefix=prefix)
+    expected = naive_scores(jobs, query, prefix)
+    assert {job for job, _ in results} == set(expected)
+    for job, score in results:
+        assert score == pytest.approx(expected[job])
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.parametrize('walk', [64, 2])
+def test_filters_match_post_filtering(jobs, monkeypatch, walk):
+    # A short walk forces the one-pass scan over all jobs
+    monkeypatch.setattr(job_search, 'FILTER_WALK_DOCS', walk)
+    index = JobSearchIndex(jobs)
+    everything = index.search('engineer', limit=len(jobs))
+    filters = {'Location': 'Kandy', 'Demand_Level': 'High'}
+    keep = (jobs['Location'] == 'Kandy') & (jobs['Demand_Level'] == 'High')
+    expected = [(job, score) for job, score in everything if keep.iloc[job]]
+    for limit in (5, 50, len(jobs)):
+        assert index.search('engineer', limit=limit, filters=filters) == expected[:limit]
+    assert index.search('engineer', filters={'Location': 'Jaffna'}) == []
+
+
+def test_limit_keeps_the_ranking_prefix(jobs):
+    index = JobSearchIndex(jobs)
+    everything = index.search('data', limit=len(jobs))
+    assert index.search('data', limit=7) == everything[:7]
+    assert len(index) == len(jobs) and index.n_docs < len(jobs)
+
+
+def test_queries_without_matches():
+    index = JobSearchIndex(pd.DataFrame({'Job_Title': ['Nurse'], 'Skills_Required': [None]}))
+    assert index.search('') == []
+    assert index.search('nurse', limit=0) == []
+    assert index.search('nurse doctor') == []
+    assert index.search('nurs', prefix=False) == []
+    assert index.search('NURS') == [(0, pytest.approx(index.search('nurse')[0][1]))]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from label_encoding import CompiledLabelEncoder, compile_encoders
+
+
+def compiled(unknown_code=-1):
+    return CompiledLabelEncoder.from_encoder(
+        LabelEncoder().fit(['Colombo', 'Galle', 'Kandy']), unknown_code=unknown_code)
+
+
+def test_encode_matches_label_encoder():
+    encoder = LabelEncoder().fit(['Colombo', 'Galle', 'Kandy'])
+    lookup = CompiledLabelEncoder.from_encoder(encoder)
+    labels = ['Kandy', 'Colombo', 'Galle', 'Kandy']
+    assert lookup.encode_many(labels).tolist() == encoder.transform(labels).tolist()
+    assert [lookup.encode(label) for label in labels] == encoder.transform(labels).tolist()
+    assert lookup.decode_many(lookup.encode_many(labels)).tolist() == labels
+
+
+def test_unknown_labels_get_unknown_code():
+    assert compiled().encode('Jaffna') == -1
+    assert compiled().encode_many(['Jaffna', 'Galle']).tolist() == [-1, 1]
+    assert compiled(unknown_code=0).encode_many(['Jaffna', 'Galle']).tolist() == [0, 1]
+
+
+def test_non_string_labels_are_unknown():
+    lookup = compiled()
+    labels = [['Galle'], {'city': 'Galle'}, None, np.nan, 3, 'Kandy']
+    codes = lookup.encode_many(labels)
+    assert codes.tolist() == [-1, -1, -1, -1, -1, 2]
+    assert [lookup.encode(label) for label in labels] == codes.tolist()
+    assert lookup.is_known_many(codes).tolist() == [False] * 5 + [True]
+
+
+def test_encode_many_accepts_series_with_index():
+    codes = compiled().encode_many(pd.Series(['Galle', ['x']], index=[10, 20]))
+    assert codes.tolist() == [1, -1]
+
+
+def test_compile_encoders_only_compiles_label_encoders():
+    encoders = {'le_location': LabelEncoder().fit(['a', 'b']), 'mlb': object()}
+    assert list(compile_encoders(encoders)) == ['le_location']
@@ -0,0 +1,93 @@
+import multiprocessing
+import threading
+
+import numpy as np
+import pytest
+
+from micro_batcher import MicroBatcher
+
+
+def row_sums(rows):
+    return rows.sum(axis=1)
+
+
+@pytest.fixture
+def batcher():
+    batcher = MicroBatcher(row_sums, max_batch_size=16, max_wait=0.02)
+    yield batcher
+    if not batcher.closed:
+        batcher.close()
+
+
+def test_concurrent_rows_share_batches(batcher):
+    results = [None] * 32
+    barrier = threading.Barrier(len(results))
+
+    def call(i):
+        barrier.wait()
+        results[i] = batcher.predict([i, 1.0], timeout=5)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(results))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [i + 1.0 for i in range(len(results))]
+    assert batcher.stats()['rows'] == 32
+    assert batcher.stats()['batches'] < 32
+
+
+def test_bad_row_fails_alone():
+    def strict(rows):
+        if np.isnan(rows).any() and len(rows) == 1:
+            raise ValueError('bad row')
+        if np.isnan(rows).any():
+            raise ValueError('batch has a bad row')
+        return rows.sum(axis=1)
+
+    batcher = MicroBatcher(strict, max_wait=0.05)
+    good, bad = batcher.submit([1.0, 2.0]), batcher.submit([np.nan, 1.0])
+    assert good.result(5) == 3.0
+    with pytest.raises(ValueError, match='bad row'):
+        bad.result(5)
+    batcher.close()
+
+
+def test_timeout_falls_back_to_direct_prediction():
+    release = threading.Event()
+
+    def slow(rows):
+        if rows[0, 0] == 99:
+            release.wait(5)
+        return rows.sum(axis=1)
+
+    batcher = MicroBatcher(slow, max_batch_size=1, max_wait=0.001)
+    stuck = batcher.submit([99.0, 0.0])
+    # Queued behind the stuck batch: withdrawn and predicted directly
+    assert batcher.predict([1.0, 2.0], timeout=0.05) == 3.0
+    assert batcher.stats()['fallbacks'] == 1
+    release.set()
+    assert stuck.result(5) == 99.0
+    batcher.close()
+    # The withdrawn row was not predicted a second time by the batch
+    assert batcher.stats()['rows'] == 1
+
+
+def _predict_in_child(batcher, results):
+    results.put((batcher.predict([2.0, 3.0], timeout=2), batcher.stats()['fallbacks']))
+
+
+def test_batcher_works_after_fork(batcher):
+    # The parent's batching thread is running before the fork, as with gunicorn preload_app
+    assert batcher.predict([1.0, 1.0], timeout=5) == 2.0
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    child = context.Process(target=_predict_in_child, args=(batcher, results))
+    child.start()
+    child.join(10)
+    if child.is_alive():
+        child.kill()
+        pytest.fail('forked worker hung on the micro-batcher')
+    # Served by a batching thread started in the child, not by the fallback
+    assert results.get(timeout=1) == (5.0, 0)
+    assert batcher.predict([1.0, 2.0], timeout=5) == 3.0
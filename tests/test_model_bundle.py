@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from model_bundle import (LATEST_FILE, build_bundle, open_bundle, read_manifest, resolve_bundle_dir,
+                          verify_bundle, write_latest)
+
+
+@pytest.fixture
+def bundle_dir(tmp_path):
+    models = {
+        'rf_model': {'weights': np.arange(5.0)},
+        'rf_engine': {'derived': True},
+        'df_it': pd.DataFrame({'Job_ID': [1, 2], 'Job_Title': ['a', 'b']}),
+        'skill_matrix': sparse.identity(3, format='csr'),
+    }
+    encoders = {'le_job': ['a', 'b']}
+    path = str(tmp_path / 'v1')
+    build_bundle(path, models, encoders)
+    return path
+
+
+def test_round_trip_by_kind(bundle_dir):
+    models, encoders, manifest = open_bundle(bundle_dir, verify=True)
+    assert {c['kind'] for c in manifest['components'].values()} == {'joblib', 'parquet', 'npz'}
+    np.testing.assert_array_equal(models['rf_model']['weights'], np.arange(5.0))
+    assert models['df_it']['Job_ID'].tolist() == [1, 2]
+    assert models['skill_matrix'].nnz == 3
+    assert encoders['le_job'] == ['a', 'b']
+
+
+def test_derived_components_are_not_bundled(bundle_dir):
+    assert 'rf_engine' not in read_manifest(bundle_dir)['components']
+    models, _, _ = open_bundle(bundle_dir)
+    assert 'rf_engine' not in models
+
+
+def test_membership_does_not_load(bundle_dir):
+    models, _, _ = open_bundle(bundle_dir)
+    assert 'rf_model' in models and 'df_it' in models and 'missing' not in models
+    assert models.loaded() == []
+    models['df_it']
+    assert models.loaded() == ['df_it']
+
+
+def test_set_and_delete(bundle_dir):
+    models, _, _ = open_bundle(bundle_dir)
+    models['extra'] = 1
+    assert 'extra' in models and len(models) == 4
+    del models['rf_model']
+    assert 'rf_model' not in models
+    with pytest.raises(KeyError):
+        models['rf_model']
+
+
+def test_verify_detects_tampering(bundle_dir):
+    with open(os.path.join(bundle_dir, 'le_job.joblib'), 'ab') as f:
+        f.write(b'x')
+    with pytest.raises(ValueError):
+        verify_bundle(bundle_dir)
+
+
+def test_latest_pointer(bundle_dir):
+    artifacts_dir = os.path.dirname(bundle_dir)
+    write_latest(artifacts_dir, 'v1')
+    assert os.path.exists(os.path.join(artifacts_dir, LATEST_FILE))
+    assert resolve_bundle_dir(artifacts_dir) == bundle_dir
+    assert resolve_bundle_dir(bundle_dir) == bundle_dir
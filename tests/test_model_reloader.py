@@ -0,0 +1,73 @@
+import threading
+import time
+
+from model_reloader import ModelReloader, file_stamp
+
+
+def test_file_stamp(tmp_path):
+    path = tmp_path / 'model.pkl'
+    assert file_stamp(str(path)) == (str(path), None, None)
+    path.write_bytes(b'abc')
+    assert file_stamp(str(path))[2] == 3
+
+
+def test_failed_reload_keeps_previous_version():
+    versions = iter(['v1'])
+
+    def reload_fn():
+        return next(versions)
+
+    reloader = ModelReloader(reload_fn, lambda: None)
+    assert reloader.reload(wait=True)
+    assert reloader.reload(wait=True)
+    status = reloader.status()
+    assert status['state'] == 'failed' and status['version'] == 'v1'
+    assert (status['reloads'], status['failures']) == (1, 1)
+
+
+def test_one_reload_at_a_time():
+    release = threading.Event()
+    reloader = ModelReloader(lambda: release.wait(5) and 'v2', lambda: None)
+    assert reloader.reload()
+    assert not reloader.reload()
+    assert reloader.status()['state'] == 'loading'
+    release.set()
+    deadline = time.monotonic() + 5
+    while reloader.status()['state'] == 'loading' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reloader.status()['version'] == 'v2'
+    assert reloader.reload(wait=True)
+
+
+def test_watcher_reloads_once_a_change_settles():
+    stamp = ['a']
+    reloads = []
+    reloader = ModelReloader(lambda: reloads.append(stamp[0]) or stamp[0],
+                             lambda: stamp[0], interval=0.02)
+    reloader.start_watching()
+    assert reloader.status()['watching']
+    time.sleep(0.1)
+    assert reloads == []
+    stamp[0] = 'b'
+    deadline = time.monotonic() + 5
+    while not reloads and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert reloads == ['b']
+
+
+def test_admin_reload_endpoint(api, monkeypatch):
+    client = api.app.test_client()
+    assert client.post('/admin/reload').status_code == 403
+    monkeypatch.setitem(api.app.config, 'ADMIN_TOKEN', 'secret')
+    monkeypatch.setitem(api.app.config, 'RELOAD_DRAIN_SECONDS', 0)
+    headers = {'X-Admin-Token': 'secret'}
+    assert client.post('/admin/reload', headers={'X-Admin-Token': 'wrong'}).status_code == 403
+
+    previous = api.current
+    response = client.post('/admin/reload', json={'wait': True}, headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['state'] == 'idle'
+    assert api.current is not previous
+    assert client.get('/admin/reload', headers=headers).get_json()['reloads'] >= 1
+    assert client.get('/health').status_code == 200
@@ -0,0 +1,126 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import preprocess
+from skill_index import load_skill_matrix, skill_matrix_path, skill_vocabulary
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_CSV = os.path.join(ROOT, 'Research Project (1).csv')
+
+pytestmark = pytest.mark.skipif(not os.path.exists(RAW_CSV), reason='raw dataset not available')
+
+
+@pytest.fixture
+def raw(tmp_path):
+    frame = pd.read_csv(RAW_CSV, dtype=str).head(60)
+    path = tmp_path / 'raw.csv'
+    frame.to_csv(path, index=False)
+    return path, frame
+
+
+@pytest.fixture
+def encoder_dir(tmp_path):
+    path = tmp_path / 'encoders'
+    path.mkdir()
+    for file_name in preprocess.encoder_files().values():
+        if os.path.exists(os.path.join(ROOT, file_name)):
+            shutil.copy(os.path.join(ROOT, file_name), path)
+    return str(path)
+
+
+def run(raw_path, out_dir, encoder_dir, **kwargs):
+    return preprocess.run_pipeline(str(raw_path), str(out_dir), encoder_dir=encoder_dir,
+                                   industry='', **kwargs)
+
+
+def test_output_is_typed(raw, tmp_path, encoder_dir):
+    run(raw[0], tmp_path / 'out', encoder_dir)
+    output = pd.read_parquet(tmp_path / 'out' / preprocess.OUTPUT_FILE)
+    assert output['Job_ID'].dtype == 'int64'
+    assert output['Salary_Lower'].dtype == 'float64'
+    assert output['Job_Title_Encoded'].dtype == 'int64'
+    assert isinstance(output['Skills_List'].iloc[0][0], str)
+
+
+def test_unchanged_rows_are_reused(raw, tmp_path, encoder_dir):
+    path, frame = raw
+    out = tmp_path / 'out'
+    assert run(path, out, encoder_dir)['new_or_changed'] == len(frame)
+    frame.loc[3, 'Salary_Range'] = '1000-2000'
+    frame.drop(index=5).to_csv(path, index=False)
+    summary = run(path, out, encoder_dir)
+    assert summary['new_or_changed'] == 1
+    assert summary['removed'] == 1
+    output = pd.read_parquet(out / preprocess.OUTPUT_FILE).set_index('Job_ID')
+    assert output.loc[int(frame.loc[3, 'Job_ID']), 'Salary_Lower'] == 1000
+
+
+def test_delta_keeps_other_rows(raw, tmp_path, encoder_dir):
+    path, frame = raw
+    out = tmp_path / 'out'
+    run(path, out, encoder_dir)
+    delta = frame.head(2).copy()
+    delta['Salary_Range'] = '5000-6000'
+    delta.to_csv(path, index=False)
+    summary = run(path, out, encoder_dir, delta=True)
+    assert summary['rows'] == len(frame)
+    assert summary['new_or_changed'] == 2 and summary['removed'] == 0
+    output = pd.read_parquet(out / preprocess.OUTPUT_FILE)
+    assert (output['Salary_Lower'] == 5000).sum() == 2
+
+
+def test_new_labels_never_overwrite_the_source_encoders(raw, tmp_path, encoder_dir):
+    path, frame = raw
+    frame.loc[0, 'Location'] = 'Atlantis'
+    frame.to_csv(path, index=False)
+    before = os.path.getmtime(os.path.join(encoder_dir, 'location_encoder.pkl'))
+    with pytest.raises(ValueError, match='overwrite'):
+        run(path, encoder_dir, encoder_dir)
+    assert not os.path.exists(os.path.join(encoder_dir, preprocess.STATE_FILE))
+
+    out = tmp_path / 'out'
+    assert 'Location' in run(path, out, encoder_dir)['encoders_changed']
+    assert 'Atlantis' in preprocess.load_encoders(str(out))['Location'].classes_
+    assert os.path.getmtime(os.path.join(encoder_dir, 'location_encoder.pkl')) == before
+    # A later run reads the grown encoders from the output directory
+    assert run(path, out, encoder_dir)['encoders_changed'] == []
+
+    run(path, encoder_dir, encoder_dir, overwrite_encoders=True)
+    assert 'Atlantis' in preprocess.load_encoders(encoder_dir)['Location'].classes_
+
+
+@pytest.mark.parametrize('chunk_size', [50000, 7])
+def test_repeated_job_ids_keep_their_last_row(raw, tmp_path, encoder_dir, chunk_size):
+    path, frame = raw
+    frame = frame.head(20)
+    # The first row comes back at the end with other content
+    repeat = frame.iloc[[0]].assign(Salary_Range='7000-8000')
+    pd.concat([frame, repeat]).to_csv(path, index=False)
+    out = tmp_path / 'out'
+    for _ in range(3):
+        summary = run(path, out, encoder_dir, chunk_size=chunk_size)
+        assert summary['rows'] == 20
+    output = pd.read_parquet(out / preprocess.OUTPUT_FILE).set_index('Job_ID')
+    assert output.index.is_unique
+    assert output.loc[int(repeat['Job_ID'].iloc[0]), 'Salary_Lower'] == 7000
+    assert summary['new_or_changed'] == 0
+
+
+def test_missing_encoder_dir_starts_fresh_encoders(raw, tmp_path):
+    summary = run(raw[0], tmp_path / 'out', str(tmp_path / 'missing'))
+    assert 'Location' in summary['encoders_changed']
+
+
+def test_skill_matrix_is_written_row_aligned(raw, tmp_path, encoder_dir):
+    out = tmp_path / 'out'
+    run(raw[0], out, encoder_dir)
+    output_path = str(out / preprocess.OUTPUT_FILE)
+    output = pd.read_parquet(output_path)
+    matrix = load_skill_matrix(skill_matrix_path(output_path))
+    vocabulary = skill_vocabulary(preprocess.load_encoders(str(out), encoder_dir)['Skills_List'])
+    assert matrix.shape == (len(output), len(vocabulary))
+    for row, skills in zip(matrix, output['Skills_List']):
+        assert sorted(vocabulary[row.indices]) == sorted(set(skills))
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import response_cache
+from response_cache import MemoryBackend, ResponseCache, SQLiteBackend, create_response_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time for both backends"""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmp_path, clock):
+    if request.param == 'memory':
+        return MemoryBackend(max_entries=2)
+    return SQLiteBackend(str(tmp_path / 'cache.db'), max_entries=2)
+
+
+def test_get_set_and_expiry(backend, clock):
+    backend.set('a', '1', ttl=10)
+    assert backend.get('a') == '1'
+    clock[0] += 11
+    assert backend.get('a') is None
+    assert backend.get('missing') is None
+
+
+def test_least_recently_used_is_evicted(backend, clock):
+    for key in 'abc':
+        backend.set(key, key, ttl=60)
+        clock[0] += 1
+    if isinstance(backend, SQLiteBackend):
+        backend.evict()
+    assert backend.get('a') is None
+    assert backend.get('b') == 'b' and backend.get('c') == 'c'
+    backend.clear()
+    assert len(backend) == 0
+
+
+def test_keys_ignore_body_key_order_but_not_version():
+    key = ResponseCache.make_key('/predict_demand', {'a': 1, 'b': 2}, 'v1')
+    assert key == ResponseCache.make_key('/predict_demand', {'b': 2, 'a': 1}, 'v1')
+    assert key != ResponseCache.make_key('/predict_demand', {'a': 1, 'b': 2}, 'v2')
+    assert key != ResponseCache.make_key('/recommend_skills', {'a': 1, 'b': 2}, 'v1')
+
+
+def test_hit_rate_stats():
+    cache = create_response_cache('memory', max_entries=4, ttl=60)
+    cache.set('k', 'v')
+    assert cache.get('k') == 'v' and cache.get('other') is None
+    assert cache.stats()['hit_rate'] == 0.5
+    assert create_response_cache('off') is None
+    with pytest.raises(ValueError):
+        create_response_cache('redis')
+
+
+def test_sqlite_backend_reconnects_after_fork(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'))
+    backend.set('a', '1', ttl=60)
+    parent_conn = backend._connection()
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            ok = backend._connection() is not parent_conn and backend.get('a') == '1'
+            backend.set('b', '2', ttl=60)
+            os.write(write, b'1' if ok else b'0')
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b'1'
+    assert backend._connection() is parent_conn
+    assert backend.get('b') == '2'
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_parser import SALARY_COLUMNS, parse_salary, parse_salary_column
+
+CASES = {
+    '150000-200000': (150000, 200000, None),
+    'LKR 350,000-800,000': (350000, 800000, 'LKR'),
+    '$70K-120K': (70000, 120000, 'USD'),
+    '$70K - $120K': (70000, 120000, 'USD'),
+    'Rs. 50,000 to 80,000': (50000, 80000, 'LKR'),
+    '€40k – €60k': (40000, 60000, 'EUR'),
+    '1.2M': (1.2e6, 1.2e6, None),
+    '90000 LKR': (90000, 90000, 'LKR'),
+    ' 100k ': (100000, 100000, None),
+    # A suffix on one bound applies to both...
+    '70-120K': (70000, 120000, None),
+    '70K-120': (70000, 120000, None),
+    # ...unless that would put the lower bound above the upper one
+    '1,500-2M': (1500, 2e6, None),
+    # Only whole strings are salaries
+    '3 years': (np.nan, np.nan, None),
+    '10-20 per month': (np.nan, np.nan, None),
+    '': (np.nan, np.nan, None),
+}
+
+
+@pytest.mark.parametrize('text', list(CASES))
+def test_parse_salary(text):
+    lower, upper, currency = CASES[text]
+    parsed = parse_salary(text)
+    np.testing.assert_equal([parsed['Salary_Lower'], parsed['Salary_Upper']], [lower, upper])
+    assert parsed['Salary_Currency'] == currency
+    if not np.isnan(lower):
+        assert parsed['Salary_Lower'] <= parsed['Salary_Upper']
+        assert parsed['Salary_Mid'] == (lower + upper) / 2
+
+
+def test_column_matches_scalar_path():
+    values = list(CASES) * 3 + [None, np.nan, ['150000'], {'a': 1}, 5]
+    column = parse_salary_column(values)
+    assert list(column.columns) == SALARY_COLUMNS
+    for position, value in enumerate(values):
+        scalar = parse_salary(value)
+        for name in ['Salary_Lower', 'Salary_Upper', 'Salary_Mid']:
+            np.testing.assert_equal(column[name].iloc[position], scalar[name])
+        currency = column['Salary_Currency'].iloc[position]
+        assert (None if pd.isna(currency) else currency) == scalar['Salary_Currency']
+
+
+def test_column_keeps_index_and_default_currency():
+    values = pd.Series(['150000-200000', None, '$1K'], index=[5, 6, 7])
+    column = parse_salary_column(values, default_currency='LKR')
+    assert column.index.tolist() == [5, 6, 7]
+    assert column['Salary_Currency'].tolist() == ['LKR', 'LKR', 'USD']
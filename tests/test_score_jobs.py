@@ -0,0 +1,75 @@
+import json
+
+import pandas as pd
+import pytest
+
+import score_jobs
+
+RECORDS = [
+    {'Job_Title': 'Software Engineer', 'Location': 'Colombo', 'Experience_Level': 'Mid-level',
+     'Salary_Range': '150000-200000', 'id': 'a'},
+    {'Job_Title': 'Wizard', 'Location': 'Colombo', 'Experience_Level': 'Mid-level',
+     'Salary_Range': '150000-200000', 'id': 'b'},
+    {'Job_Title': 'Software Engineer', 'Location': 'Colombo', 'id': 'c'},
+]
+
+
+@pytest.fixture
+def jobs_jsonl(tmp_path, api):
+    path = tmp_path / 'jobs.jsonl'
+    lines = [json.dumps(record) for record in RECORDS * 3] + ['not json']
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_read_chunks_marks_bad_json(jobs_jsonl):
+    chunks = list(score_jobs.read_chunks(jobs_jsonl, 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert chunks[-1][-1] is None
+
+
+def test_read_chunks_csv_empty_cells_are_missing(tmp_path):
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame(RECORDS).to_csv(path, index=False)
+    records = next(score_jobs.read_chunks(str(path), 10))
+    assert records[2]['Experience_Level'] is None
+
+
+def test_score_file_jsonl(jobs_jsonl, tmp_path):
+    output = str(tmp_path / 'scores.jsonl')
+    summary = score_jobs.score_file(jobs_jsonl, output, chunk_size=4, workers=1, id_column='id')
+    results = read_jsonl(output)
+    assert summary['rows'] == len(results) == 10
+    assert [result['Row'] for result in results] == list(range(10))
+    assert [result['Status'] for result in results[:3]] == ['Success', 'Error', 'Error']
+    assert [result['id'] for result in results[:3]] == ['a', 'b', 'c']
+    assert summary['errors'] == 7
+
+
+def test_resume_continues_after_the_checkpoint(jobs_jsonl, tmp_path):
+    output = str(tmp_path / 'scores.jsonl')
+    score_jobs.score_file(jobs_jsonl, output, chunk_size=4, workers=1)
+    expected = read_jsonl(output)
+    # Pretend the run stopped after the first chunk, with a partial second chunk written
+    checkpoint = score_jobs.Checkpoint(output)
+    state = checkpoint.load()
+    with open(output) as f:
+        first_chunk_bytes = len(''.join(f.readlines()[:4]))
+    checkpoint.save({**state, 'completed_chunks': 1, 'rows': 4, 'errors': 2,
+                     'output_bytes': first_chunk_bytes})
+    summary = score_jobs.score_file(jobs_jsonl, output, chunk_size=4, workers=1, resume=True)
+    assert read_jsonl(output) == expected
+    assert summary['rows'] == 10
+
+
+def test_score_file_parquet(jobs_jsonl, tmp_path):
+    output = str(tmp_path / 'scores')
+    score_jobs.score_file(jobs_jsonl, output, output_format='parquet', chunk_size=4, workers=1)
+    frame = pd.read_parquet(output)
+    assert len(frame) == 10
+    assert list(frame.columns) == score_jobs.OUTPUT_COLUMNS
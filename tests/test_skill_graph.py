@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from skill_graph import SkillGraph
+
+VOCABULARY = np.array(['AWS', 'Docker', 'Java', 'Python', 'SQL', 'Scala'])
+JOBS = np.array([
+    [1, 1, 0, 1, 0, 0],
+    [0, 0, 0, 1, 1, 0],
+    [1, 0, 0, 1, 1, 0],
+    [0, 0, 1, 0, 1, 0],
+    [1, 1, 0, 0, 0, 0],
+    [0, 0, 0, 1, 1, 0],
+])
+
+
+def dense_weights(measure):
+    counts = JOBS.T @ JOBS
+    frequency = JOBS.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lift = counts * len(JOBS) / np.outer(frequency, frequency)
+        weights = {'pmi': np.maximum(np.log(lift), 0), 'lift': lift, 'count': counts}[measure]
+    weights = np.nan_to_num(weights, nan=0.0, posinf=0.0)
+    np.fill_diagonal(weights, 0)
+    return weights
+
+
+@pytest.mark.parametrize('measure', ['pmi', 'lift', 'count'])
+def test_scores_match_dense_product(measure):
+    graph = SkillGraph(sparse.csr_matrix(JOBS), VOCABULARY, measure=measure)
+    np.testing.assert_allclose(graph.weights.toarray(), dense_weights(measure))
+
+    owned = ['Python', 'SQL']
+    user = np.isin(VOCABULARY, owned).astype(float)
+    expected = user @ dense_weights(measure)
+    columns, values, owned_columns = graph.scores(owned)
+    scores = np.zeros(len(VOCABULARY))
+    scores[columns] = values
+    np.testing.assert_allclose(scores, expected)
+    assert owned_columns.tolist() == [3, 4]
+
+
+def test_recommend_excludes_owned_and_orders_by_score():
+    graph = SkillGraph(JOBS, VOCABULARY, measure='count')
+    # Python co-occurs with SQL three times and with AWS twice
+    assert graph.recommend(['Python'], top_n=2) == ['SQL', 'AWS']
+    assert 'Python' not in graph.related('Python')
+
+
+def test_recommend_falls_back_to_popular_skills():
+    graph = SkillGraph(JOBS, VOCABULARY)
+    # Unknown and non-string skills carry no signal; Scala never occurs
+    assert graph.recommend(['Cobol', None], top_n=3) == ['Python', 'SQL', 'AWS']
+    assert 'Scala' not in graph.recommend(['Java'], top_n=5)
+    assert graph.recommend(['Python'], top_n=0) == []
+
+
+def test_min_count_drops_rare_pairs():
+    graph = SkillGraph(JOBS, VOCABULARY, measure='count', min_count=2)
+    assert graph.cooccurrence[VOCABULARY.tolist().index('Java'), :].nnz == 0
+
+
+def test_unknown_measure():
+    with pytest.raises(ValueError):
+        SkillGraph(JOBS, VOCABULARY, measure='jaccard')
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.preprocessing import MultiLabelBinarizer
+
+from skill_index import (assign_skill_clusters, build_cluster_skill_index, load_skill_matrix,
+                         save_skill_matrix, skill_matrix, skill_matrix_path, skill_vocabulary,
+                         split_skills)
+
+SKILL_LISTS = [['Python', 'SQL'], ['SQL'], ['AWS', 'Python', 'Python'], [], ['Rust']]
+
+
+def binarizer():
+    return MultiLabelBinarizer().fit([['AWS', 'Python', 'SQL'], ['Docker']])
+
+
+def test_split_skills():
+    assert split_skills('Python, SQL ,AWS') == ['Python', 'SQL', 'AWS']
+    assert split_skills('Unknown') == []
+    assert split_skills(np.nan) == []
+
+
+def test_skill_matrix_matches_binarizer():
+    mlb = binarizer()
+    matrix = skill_matrix(SKILL_LISTS, skill_vocabulary(mlb))
+    # Rust is outside the vocabulary and the repeated Python is a single 1
+    expected = mlb.transform([[s for s in skills if s in mlb.classes_] for skills in SKILL_LISTS])
+    np.testing.assert_array_equal(matrix.toarray(), expected)
+
+
+def test_skill_matrix_round_trip(tmp_path):
+    matrix = skill_matrix(SKILL_LISTS, skill_vocabulary(binarizer()))
+    path = skill_matrix_path(str(tmp_path / 'jobs.csv'))
+    assert path.endswith('jobs_skills.npz')
+    save_skill_matrix(path, matrix)
+    np.testing.assert_array_equal(load_skill_matrix(path).toarray(), matrix.toarray())
+
+
+def test_cluster_skill_index_ranks_by_frequency():
+    vocabulary = skill_vocabulary(binarizer())
+    matrix = skill_matrix(SKILL_LISTS, vocabulary)
+    clusters = pd.Series([0, 0, 1, 1, 0])
+    index = build_cluster_skill_index(matrix, clusters, vocabulary)
+    assert index == {0: ['SQL', 'Python'], 1: ['AWS', 'Python']}
+
+
+def test_sparse_clusters_match_the_dense_binarizer(api):
+    mlb, kmeans = api.encoders['mlb'], api.models['kmeans']
+    skill_lists = api.models['df_it']['Skills_Required'].map(split_skills)
+    matrix = skill_matrix(skill_lists, skill_vocabulary(mlb))
+    known = [[skill for skill in skills if skill in mlb.classes_] for skills in skill_lists]
+    dense = mlb.transform(known)
+    np.testing.assert_array_equal(matrix.toarray(), dense)
+    np.testing.assert_array_equal(assign_skill_clusters(matrix, kmeans), kmeans.predict(dense))
+
+
+def test_api_serves_the_sparse_matrix(api):
+    models, lookups = api.models, api.current.lookups
+    assert sparse.issparse(models['skill_matrix'])
+    assert models['skill_matrix'].shape == (len(models['df_it']), len(lookups['skills']))
+
+    # A user's skills become one sparse row; KMeans sees the dense cluster
+    user_skills = ['Python', 'SQL', 'Not A Skill']
+    mlb = api.encoders['mlb']
+    dense = mlb.transform([[skill for skill in user_skills if skill in mlb.classes_]])
+    cluster = int(models['kmeans'].predict(dense)[0])
+    expected = [skill for skill in models['cluster_skills'][cluster] if skill not in user_skills][:3]
+    assert api.recommend_skills(user_skills, top_n=3) == expected
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.preprocessing import MultiLabelBinarizer
+
+from skillset import SkillVocabulary, pack_ids, popcount, unpack_ids
+
+# More than two words of bits, so every operation crosses word boundaries
+SKILLS = [f'skill{i:03d}' for i in range(150)]
+
+
+@pytest.fixture
+def sets():
+    rng = np.random.default_rng(3)
+    return [set(rng.choice(SKILLS, rng.integers(0, 40), replace=False)) for _ in range(25)]
+
+
+def test_pack_round_trip():
+    ids = [0, 63, 64, 127, 149]
+    bits = pack_ids(ids, len(SKILLS))
+    assert bits.shape == (3,)
+    assert unpack_ids(bits).tolist() == ids
+    assert popcount(bits) == len(ids)
+
+
+def test_set_operations_match_python_sets(sets):
+    vocabulary = SkillVocabulary(SKILLS)
+    jobs = vocabulary.pack_many(sets)
+    user = {'skill000', 'skill064', 'skill100', 'skill149'} | sets[0]
+    packed_user = vocabulary.pack(sorted(user))
+
+    assert (jobs | packed_user).to_lists() == [sorted(job | user) for job in sets]
+    assert (jobs & packed_user).to_lists() == [sorted(job & user) for job in sets]
+    assert (jobs - packed_user).to_lists() == [sorted(job - user) for job in sets]
+    np.testing.assert_array_equal(jobs.count(), [len(job) for job in sets])
+    np.testing.assert_array_equal(jobs.overlap(packed_user), [len(job & user) for job in sets])
+    expected = [len(job & user) / len(job | user) for job in sets]
+    np.testing.assert_allclose(jobs.jaccard(packed_user), expected)
+    assert packed_user.count() == len(user)
+    assert 'skill064' in packed_user and 'skill065' not in packed_user
+
+
+def test_pack_matrix_matches_pack_many(sets):
+    mlb = MultiLabelBinarizer(classes=SKILLS).fit(sets)
+    vocabulary = SkillVocabulary.from_mlb(mlb, extra_skills=['Rust'])
+    matrix = sparse.csr_matrix(mlb.transform(sets))
+    np.testing.assert_array_equal(vocabulary.pack_matrix(matrix).bits,
+                                  vocabulary.pack_many(sets).bits)
+    assert len(vocabulary) == len(SKILLS) + 1
+
+
+def test_unknown_and_empty_inputs():
+    vocabulary = SkillVocabulary(SKILLS + ['skill000'])
+    assert len(vocabulary) == len(SKILLS)
+    assert vocabulary.ids_of(['skill002', 'Cobol', None, ['skill001']]).tolist() == [2]
+    assert vocabulary.pack([]).count() == 0
+    assert vocabulary.pack_many([]).bits.shape == (0, 3)
+    # Plain lists are packed on the fly
+    assert (vocabulary.pack(['skill001', 'skill002']) - ['skill002']).to_list() == ['skill001']
+    assert 'Cobol' not in vocabulary.pack(['skill001'])
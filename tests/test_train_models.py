@@ -0,0 +1,65 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import train_models
+from model_bundle import open_bundle, resolve_bundle_dir
+from train_models import DEMAND_FEATURES, claim_bundle_dir, demand_features, parse_k_range, train
+
+ROOT = os.path.dirname(os.path.abspath(train_models.__file__))
+
+
+def test_parse_k_range():
+    assert list(parse_k_range('3-5')) == [3, 4, 5]
+    assert list(parse_k_range('4')) == [4]
+
+
+def test_demand_features_drop_incomplete_rows_and_default_month():
+    df = pd.DataFrame({'Job_Title_Encoded': [1, 2, np.nan], 'Location_Encoded': [0, 1, 1],
+                       'Experience_Level_Encoded': [2, 0, 1],
+                       'Salary_Lower': [100.0, 200.0, 300.0], 'Demand_Level_Encoded': [1, 2, 3]})
+    X, y = demand_features(df)
+    assert X.shape == (2, len(DEMAND_FEATURES))
+    assert X[:, -1].tolist() == [1.0, 1.0]
+    assert y.tolist() == [1, 2]
+
+
+def test_train_writes_a_loadable_bundle(tmp_path):
+    out_dir = str(tmp_path / 'artifacts')
+    bundle_dir = train(os.path.join(ROOT, 'preprocessed_it_jobs.csv'), out_dir, encoder_dir=ROOT,
+                       n_iter=2, cv=2, n_jobs=1, k_values=range(3, 5))
+    assert resolve_bundle_dir(out_dir) == bundle_dir
+
+    models, encoders, manifest = open_bundle(bundle_dir, verify=True)
+    X, y = demand_features(models['df_it'])
+    assert set(models['rf_model'].predict(X[:10])) <= set(y)
+    assert models['kmeans'].n_clusters in (3, 4)
+    assert models['df_it']['Skill_Cluster'].notna().all()
+    assert models['skill_matrix'].shape[0] == len(models['df_it'])
+    assert 'le_job' in encoders
+
+    with open(os.path.join(bundle_dir, 'metrics.json')) as f:
+        metrics = json.load(f)
+    assert metrics == manifest['metadata']['metrics']
+    assert set(metrics['skill_clusters']['silhouette_by_k']) == {'3', '4'}
+
+
+def test_bundle_dirs_are_never_shared(tmp_path, monkeypatch):
+    out_dir = str(tmp_path / 'artifacts')
+    first, _ = claim_bundle_dir(out_dir)
+    second, _ = claim_bundle_dir(out_dir)
+    assert first != second and len(first) == len('20260101T000000000000Z')
+
+    class FrozenClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 1, 1, tzinfo=tz)
+
+    monkeypatch.setattr(train_models, 'datetime', FrozenClock)
+    claim_bundle_dir(out_dir)
+    with pytest.raises(FileExistsError):
+        claim_bundle_dir(out_dir)
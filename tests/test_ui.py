@@ -0,0 +1,131 @@
+import os
+import shutil
+import time
+
+import joblib
+import pandas as pd
+import pytest
+
+import db
+import job_catalog
+from job_catalog import load_catalog, top_skills
+
+st = pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # ui.py keeps its databases and model files in the working directory;
+    # its caches live for the whole process, so every test starts clean
+    monkeypatch.chdir(tmp_path)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    yield tmp_path
+    db.close_all()
+
+
+def counting(monkeypatch, module, name):
+    """Patch module.name with a wrapper that records every call"""
+    calls = []
+    function = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+def analyze(industry, location):
+    app = AppTest.from_file(os.path.join(ROOT, 'ui.py'), default_timeout=60)
+    app.session_state.user = (1, 'tester')
+    app.session_state.page = 'industries'
+    app.run()
+    app.selectbox[0].set_value(industry)
+    app.text_input[0].set_value(location)
+    next(button for button in app.button if 'Analyze' in button.label).click()
+    app.run()
+    assert not app.exception
+    return app
+
+
+def metrics(app):
+    return {metric.label: metric.value for metric in app.metric}
+
+
+def test_dashboard_reads_the_catalog_rollups(workdir):
+    jobs = pd.read_csv(os.path.join(ROOT, 'preprocessed_it_jobs.csv'))
+    jobs.to_csv('jobs.csv', index=False)
+    load_catalog('jobs.csv', 'job_catalog.db')
+
+    colombo = jobs[jobs['Location'] == 'Colombo']
+    app = analyze('Technology', 'Colombo, Sri Lanka')
+    shown = metrics(app)
+    assert shown['Total Jobs Found'] == str(len(colombo))
+    assert shown['High Demand Jobs'] == str((colombo['Demand_Level'] == 'High').sum())
+    # Growth stays the model's; the catalog adds the salary as a fourth metric
+    assert list(shown) == ['Total Jobs Found', 'High Demand Jobs', 'Avg Growth Rate',
+                           'Avg Starting Salary']
+    assert shown['Avg Growth Rate'] == '+16%'
+    assert shown['Avg Starting Salary'] == f"{colombo['Salary_Lower'].mean():,.0f}"
+    assert not app.caption
+    top = top_skills('IT', 'Colombo', limit=15)
+    cards = [block.value for block in app.markdown if 'Required in' in block.value]
+    assert len(cards) == len(top)
+    assert f'{top[0][0]}</h4>' in cards[0] and f'Required in {top[0][1]} jobs' in cards[0]
+
+    # A city the catalog does not list falls back to the whole industry
+    app = analyze('Technology', 'Jaffna')
+    assert metrics(app)['Total Jobs Found'] == str(len(jobs))
+    assert 'showing all locations' in app.caption[0].value
+
+
+def test_dashboard_without_a_catalog_uses_the_sample_jobs(workdir):
+    app = analyze('Healthcare', 'Colombo')
+    shown = metrics(app)
+    assert shown == {'Total Jobs Found': '2', 'High Demand Jobs': '1', 'Avg Growth Rate': '+20%'}
+    assert not os.path.exists('job_catalog.db')
+
+
+def test_schema_is_created_once_per_process(workdir, monkeypatch):
+    schemas = counting(monkeypatch, db.ConnectionPool, 'ensure_schema')
+    for _ in range(3):
+        analyze('Technology', 'Colombo')
+    assert len(schemas) == 1
+    assert os.path.exists('career_platform.db')
+
+
+def test_model_is_rebuilt_when_its_files_change(workdir, monkeypatch):
+    shutil.copy(os.path.join(ROOT, 'skills_binarizer.pkl'), '.')
+    loads = counting(monkeypatch, joblib, 'load')
+    analyze('Technology', 'Colombo')
+    analyze('Technology', 'Colombo')
+    assert len(loads) == 1
+
+    # A newer binarizer is a new data version
+    stat = os.stat('skills_binarizer.pkl')
+    os.utime('skills_binarizer.pkl', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    analyze('Technology', 'Colombo')
+    assert len(loads) == 2
+
+
+def test_rollups_are_reread_when_the_catalog_changes(workdir, monkeypatch):
+    jobs = pd.read_csv(os.path.join(ROOT, 'preprocessed_it_jobs.csv'))
+    jobs.iloc[:100].to_csv('jobs.csv', index=False)
+    load_catalog('jobs.csv', 'job_catalog.db')
+    reads = counting(monkeypatch, job_catalog, 'industry_summary')
+    assert metrics(analyze('Technology', 'Kandy, Sri Lanka'))['Total Jobs Found'] == \
+        str((jobs.iloc[:100]['Location'] == 'Kandy').sum())
+    analyze('Technology', 'Kandy')
+    assert len(reads) == 1
+
+    time.sleep(0.01)
+    jobs.iloc[100:].to_csv('delta.csv', index=False)
+    load_catalog('delta.csv', 'job_catalog.db', replace=False)
+    assert metrics(analyze('Technology', 'Kandy'))['Total Jobs Found'] == \
+        str((jobs['Location'] == 'Kandy').sum())
+    assert len(reads) == 2
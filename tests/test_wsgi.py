@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importing wsgi preloads the models and freezes the GC, so it runs in its
+# own interpreter instead of leaking that state into the pytest process
+SERVE_FROM_FORKED_WORKER = textwrap.dedent('''
+    import gc
+    import multiprocessing
+
+    import ai_model_api
+    import wsgi
+
+    SAMPLE_REQUEST = {'Job_Title': 'Software Engineer', 'Location': 'Colombo',
+                      'Experience_Level': 'Mid-level', 'Salary_Range': '150000-200000'}
+
+    def serve(results):
+        client = wsgi.app.test_client()
+        results.put((client.get('/health').status_code,
+                     client.post('/predict_demand', json=SAMPLE_REQUEST).status_code))
+
+    assert ai_model_api.current.batcher is not None
+    assert gc.get_freeze_count() > 0
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    worker = context.Process(target=serve, args=(results,))
+    worker.start()
+    worker.join(30)
+    if worker.is_alive():
+        worker.kill()
+        raise SystemExit('forked worker hung')
+    print(results.get(timeout=1))
+''')
+
+
+def test_preloaded_app_serves_from_forked_workers():
+    # Batch in the master's batcher too, the setup that used to hang workers
+    env = {**os.environ, 'FLASK_MICRO_BATCH_WINDOW_MS': '2', 'FLASK_RESPONSE_CACHE': 'off',
+           'PYTHONPATH': ROOT}
+    completed = subprocess.run([sys.executable, '-W', 'ignore', '-c', SERVE_FROM_FORKED_WORKER],
+                               cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip().splitlines()[-1] == '(200, 200)'
@@ -0,0 +1,226 @@
+"""Offline training of the demand forest and the skill clusterer.
+
+Rebuilds job_forecasting_model.pkl's RandomForest and
+skill_clustering_model.pkl's KMeans from the preprocessed dataset and
+writes them, with the encoders and data they were trained on, as a new
+versioned bundle (see model_bundle.py):
+
+    python train_models.py --data preprocessed_it_jobs.parquet --out artifacts
+    FLASK_MODEL_BUNDLE=artifacts python ai_model_api.py
+
+Every run writes artifacts/<version>/ (manifest plus metrics.json) and then
+points artifacts/LATEST at it, so the API serves the newest bundle when
+MODEL_BUNDLE names the artifacts directory.
+
+The RandomForest hyperparameters come from a cross-validated randomized
+search and the KMeans cluster count from silhouette scores over a range
+of k. Both fan out over n_jobs processes.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.cluster import KMeans
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score, silhouette_score
+from sklearn.model_selection import RandomizedSearchCV, StratifiedKFold, train_test_split
+
+from model_bundle import ENCODER_FILES, build_bundle, write_latest
+from skill_index import (assign_skill_clusters, load_skill_matrix, skill_matrix, skill_matrix_path,
+                         skill_vocabulary, split_skills)
+
+logger = logging.getLogger(__name__)
+
+# Same layout as the rows ai_model_api builds for /predict_demand. The
+# shipped model used Demand_Level_Encoded as its fifth input, i.e. the
+# target itself; Month takes that slot (1 when the data has no month).
+DEMAND_FEATURES = ['Job_Title_Encoded', 'Location_Encoded', 'Experience_Level_Encoded',
+                   'Salary_Lower', 'Month']
+DEMAND_TARGET = 'Demand_Level_Encoded'
+
+RF_PARAM_DISTRIBUTIONS = {
+    'n_estimators': [50, 100, 200, 400],
+    'max_depth': [None, 8, 16, 32],
+    'min_samples_leaf': [1, 2, 4, 8],
+    'max_features': ['sqrt', 'log2', None],
+    'class_weight': [None, 'balanced'],
+}
+
+
+@contextmanager
+def timed(timings, stage):
+    """Record the wall time of a training stage"""
+    start = time.perf_counter()
+    yield
+    timings[stage] = round(time.perf_counter() - start, 3)
+    logger.info(f"{stage}: {timings[stage]:.2f} s")
+
+
+def load_training_data(data_file):
+    """Preprocessed dataset and its sparse job x skill matrix, if stored"""
+    df = pd.read_parquet(data_file) if data_file.endswith('.parquet') else pd.read_csv(data_file)
+    matrix_file = skill_matrix_path(data_file)
+    matrix = load_skill_matrix(matrix_file) if os.path.exists(matrix_file) else None
+    return df, matrix
+
+
+def demand_features(df):
+    """Feature matrix and target for the demand model
+
+    Plain arrays, like the rows the API predicts on, so the model carries
+    no feature names to check them against.
+    """
+    df = df.dropna(subset=DEMAND_FEATURES[:-1] + [DEMAND_TARGET])
+    if 'Month' not in df:
+        df = df.assign(Month=1)
+    return df[DEMAND_FEATURES].to_numpy(dtype=float), df[DEMAND_TARGET].to_numpy(dtype=int)
+
+
+def train_demand_model(X, y, n_iter=20, cv=5, n_jobs=-1, seed=42):
+    """Randomized search over RandomForest settings, scored by macro F1
+
+    Trees are fit one process each inside the search; the winning settings
+    are refit on all rows. Returns (model, metrics).
+    """
+    # Every class needs a member in each fold and in the holdout
+    cv = max(2, min(cv, int(np.unique(y, return_counts=True)[1].min())))
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, stratify=y, random_state=seed)
+
+    search = RandomizedSearchCV(
+        RandomForestClassifier(random_state=seed, n_jobs=1),
+        RF_PARAM_DISTRIBUTIONS, n_iter=n_iter, scoring='f1_macro',
+        cv=StratifiedKFold(cv, shuffle=True, random_state=seed),
+        n_jobs=n_jobs, random_state=seed, refit=True)
+    search.fit(X_train, y_train)
+
+    predicted = search.best_estimator_.predict(X_test)
+    metrics = {
+        'best_params': search.best_params_,
+        'cv_f1_macro': round(float(search.best_score_), 4),
+        'holdout_accuracy': round(float(accuracy_score(y_test, predicted)), 4),
+        'holdout_f1_macro': round(float(f1_score(y_test, predicted, average='macro')), 4),
+        'train_rows': len(X_train),
+        'holdout_rows': len(X_test),
+        'candidates': len(search.cv_results_['params']),
+        'cv_folds': cv,
+    }
+
+    # The API predicts one row at a time, where extra threads only add overhead
+    model = clone(search.best_estimator_).set_params(n_jobs=None).fit(X, y)
+    return model, metrics
+
+
+def _fit_kmeans(matrix, k, seed, sample_size):
+    kmeans = KMeans(n_clusters=k, random_state=seed, n_init='auto').fit(matrix)
+    score = silhouette_score(matrix, kmeans.labels_, sample_size=sample_size, random_state=seed)
+    return k, kmeans, float(score)
+
+
+def train_skill_clusters(matrix, k_values, n_jobs=-1, seed=42, sample_size=10000):
+    """Fit KMeans for every k in parallel and keep the best silhouette
+
+    Returns (model, metrics).
+    """
+    k_values = [k for k in k_values if 2 <= k < matrix.shape[0]]
+    sample_size = min(sample_size, matrix.shape[0])
+    fits = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_kmeans)(matrix, k, seed, sample_size) for k in k_values)
+    k, kmeans, score = max(fits, key=lambda fit: fit[2])
+    metrics = {
+        'n_clusters': k,
+        'silhouette': round(score, 4),
+        'inertia': round(float(kmeans.inertia_), 4),
+        'silhouette_by_k': {str(fit_k): round(fit_score, 4) for fit_k, _, fit_score in fits},
+    }
+    return kmeans, metrics
+
+
+def claim_bundle_dir(out_dir):
+    """Create the directory of a new bundle, versioned by UTC time to the microsecond
+
+    Raises FileExistsError instead of writing into another run's bundle.
+    """
+    version = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+    bundle_dir = os.path.join(out_dir, version)
+    os.makedirs(out_dir, exist_ok=True)
+    os.mkdir(bundle_dir)
+    return version, bundle_dir
+
+
+def train(data_file, out_dir='artifacts', encoder_dir='.', n_iter=20, cv=5, n_jobs=-1,
+          k_values=range(3, 11), seed=42):
+    """Train both models and write a new versioned bundle; returns its directory"""
+    timings = {}
+    with timed(timings, 'load'):
+        df, matrix = load_training_data(data_file)
+        encoders = {name: joblib.load(os.path.join(encoder_dir, file_name))
+                    for name, file_name in ENCODER_FILES.items()}
+        vocabulary = skill_vocabulary(encoders['mlb'])
+        if matrix is None or matrix.shape != (len(df), len(vocabulary)):
+            matrix = skill_matrix(df['Skills_Required'].map(split_skills), vocabulary)
+
+    with timed(timings, 'demand_search'):
+        X, y = demand_features(df)
+        rf_model, demand_metrics = train_demand_model(X, y, n_iter, cv, n_jobs, seed)
+
+    with timed(timings, 'skill_clustering'):
+        kmeans, cluster_metrics = train_skill_clusters(matrix, k_values, n_jobs, seed)
+        df = df.assign(Skill_Cluster=assign_skill_clusters(matrix, kmeans))
+
+    metrics = {
+        'data_file': os.path.abspath(data_file),
+        'rows': len(df),
+        'demand_model': demand_metrics,
+        'skill_clusters': cluster_metrics,
+        'timings': timings,
+    }
+    version, bundle_dir = claim_bundle_dir(out_dir)
+    with timed(timings, 'write_bundle'):
+        build_bundle(bundle_dir, {'rf_model': rf_model, 'kmeans': kmeans, 'df_it': df,
+                                  'skill_matrix': matrix},
+                     encoders, metadata={'source': 'train_models.py', 'version': version,
+                                         'features': DEMAND_FEATURES, 'metrics': metrics})
+        with open(os.path.join(bundle_dir, 'metrics.json'), 'w') as f:
+            json.dump(metrics, f, indent=2)
+        write_latest(out_dir, version)
+
+    logger.info(f"Trained bundle {version}: {json.dumps(metrics['timings'])}")
+    return bundle_dir
+
+
+def parse_k_range(value):
+    """'3-10' or '5' -> range of cluster counts"""
+    low, _, high = value.partition('-')
+    return range(int(low), int(high or low) + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the demand and skill cluster models')
+    parser.add_argument('--data', default='preprocessed_it_jobs.csv', help='preprocessed dataset')
+    parser.add_argument('--out', default='artifacts', help='artifacts directory')
+    parser.add_argument('--encoders', default='.', help='directory holding the encoder pickles')
+    parser.add_argument('--n-iter', type=int, default=20, help='random search candidates')
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--clusters', type=parse_k_range, default=range(3, 11),
+                        help="cluster counts to try, e.g. '3-10' or '5'")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(train(args.data, args.out, args.encoders, args.n_iter, args.cv, args.n_jobs,
+                args.clusters, args.seed))
+
+
+if __name__ == '__main__':
+    main()
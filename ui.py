@@ -11,6 +11,10 @@ import json
 from datetime import datetime
 import re
 import os
+from skillset import SkillVocabulary
+from education_pathways import PathwayIndex
+import db
+import job_catalog
 
 # Page configuration
 st.set_page_config(
@@ -232,6 +236,27 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Mock AI Model Class
+DEMAND_SCORES = {"High": 95, "Medium": 70, "Low": 40}
+
+def summarize_industry(jobs):
+    """Metrics, skill -> job titles map and chart data for one industry's jobs"""
+    skill_job_map = {}
+    for job in jobs:
+        for skill in job["skills"]:
+            skill_job_map.setdefault(skill, []).append(job["title"])
+    growth = [int(job["growth"].replace("+", "").replace("%", "")) for job in jobs]
+    job_data = pd.DataFrame(jobs)
+    if len(job_data):
+        job_data['Demand Score'] = job_data['demand'].map(DEMAND_SCORES)
+    return {
+        "total_jobs": len(jobs),
+        "high_demand_jobs": sum(job["demand"] == "High" for job in jobs),
+        "avg_growth": sum(growth) / len(growth) if growth else 0,
+        # Most frequent skills first
+        "skill_jobs": sorted(skill_job_map.items(), key=lambda x: len(x[1]), reverse=True),
+        "job_data": job_data,
+    }
+
 class MockAIModel:
     def __init__(self):
         self.industries = {
@@ -267,6 +292,22 @@ class MockAIModel:
             "JavaScript": ["Web Development Bootcamp", "Frontend Development Course", "CS Degree"],
             "AWS": ["AWS Certification", "Cloud Computing Course", "DevOps Training"]
         }
+        
+        # Intern job skills as bitsets, using the model's skill vocabulary when available
+        jobs = [job for industry_data in self.industries.values() for job in industry_data["jobs"]]
+        job_skills = [skill for job in jobs for skill in job["skills"]]
+        if os.path.exists('skills_binarizer.pkl'):
+            self.skill_vocabulary = SkillVocabulary.from_mlb(joblib.load('skills_binarizer.pkl'), job_skills)
+        else:
+            self.skill_vocabulary = SkillVocabulary(job_skills)
+        self.job_rows = {}
+        for row, job in enumerate(jobs):
+            self.job_rows.setdefault(job["title"], row)
+        self.job_skill_ids = [self.skill_vocabulary.ids_of(job["skills"]) for job in jobs]
+        
+        # Dashboard rollups, computed once instead of on every rerun
+        self.industry_summaries = {name: summarize_industry(data["jobs"])
+                                   for name, data in self.industries.items()}
     
     def get_job_details(self, industry, job_title):
         jobs = self.industries.get(industry, {}).get("jobs", [])
@@ -283,65 +324,52 @@ class MockAIModel:
         return list(set(recommendations))
     
     def get_skill_recommendations(self, current_skills, job_title):
-        for industry_data in self.industries.values():
-            for job in industry_data["jobs"]:
-                if job["title"] == job_title:
-                    required_skills = job["skills"]
-                    missing_skills = [skill for skill in required_skills if skill not in current_skills]
-                    return missing_skills
-        return []
+        row = self.job_rows.get(job_title)
+        if row is None:
+            return []
+        # Missing skills in the job's own listing order
+        required_ids = self.job_skill_ids[row]
+        owned = self.skill_vocabulary.pack(current_skills)
+        return self.skill_vocabulary.names(required_ids[~owned.has_ids(required_ids)])
 
 # Database functions
+DB_PATH = 'career_platform.db'
+
 def init_database():
-    conn = sqlite3.connect('career_platform.db')
-    c = conn.cursor()
-    
-    # Users table
-    c.execute('''CREATE TABLE IF NOT EXISTS users
-                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                  username TEXT UNIQUE NOT NULL,
-                  email TEXT UNIQUE NOT NULL,
-                  password_hash TEXT NOT NULL,
-                  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''')
-    
-    # User preferences table
-    c.execute('''CREATE TABLE IF NOT EXISTS user_preferences
-                 (user_id INTEGER,
-                  industry TEXT,
-                  experience_level TEXT,
-                  location TEXT,
-                  skills TEXT,
-                  FOREIGN KEY (user_id) REFERENCES users (id))''')
-    
-    conn.commit()
-    conn.close()
+    # Runs once per process; reruns reuse the pooled connections
+    db.get_pool(DB_PATH).ensure_schema(
+        '''CREATE TABLE IF NOT EXISTS users
+           (id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''',
+        '''CREATE TABLE IF NOT EXISTS user_preferences
+           (user_id INTEGER,
+            industry TEXT,
+            experience_level TEXT,
+            location TEXT,
+            skills TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (id))''')
 
 def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 def create_user(username, email, password):
-    conn = sqlite3.connect('career_platform.db')
-    c = conn.cursor()
     try:
         password_hash = hash_password(password)
-        c.execute("INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
-                 (username, email, password_hash))
-        conn.commit()
+        db.get_pool(DB_PATH).execute(
+            "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
+            (username, email, password_hash))
         return True
     except sqlite3.IntegrityError:
         return False
-    finally:
-        conn.close()
 
 def authenticate_user(username, password):
-    conn = sqlite3.connect('career_platform.db')
-    c = conn.cursor()
     password_hash = hash_password(password)
-    c.execute("SELECT id, username FROM users WHERE username = ? AND password_hash = ?",
-             (username, password_hash))
-    user = c.fetchone()
-    conn.close()
-    return user
+    return db.get_pool(DB_PATH).query_one(
+        "SELECT id, username FROM users WHERE username = ? AND password_hash = ?",
+        (username, password_hash))
 
 # Initialize session state
 if 'user' not in st.session_state:
@@ -351,14 +379,101 @@ if 'page' not in st.session_state:
 if 'selected_industry' not in st.session_state:
     st.session_state.selected_industry = None
 
-# Initialize database
-init_database()
+# Cached data layer. Widget clicks rerun the whole script, so everything
+# derived from the model is cached across reruns and sessions. Cache keys
+# are the function arguments plus the data version: when a file the model
+# is built from changes, the version changes and every entry built from
+# the old data is rebuilt on the next rerun. Entries also expire after
+# CACHE_TTL_SECONDS. Per-user queries (login) are never cached.
+CACHE_TTL_SECONDS = 3600
+MODEL_FILES = ('skills_binarizer.pkl',)
+# Catalog appends land in the write-ahead log before the database file
+CATALOG_FILES = (job_catalog.CATALOG_DB, job_catalog.CATALOG_DB + '-wal')
+# Dashboard industries whose catalog Industry value differs
+CATALOG_INDUSTRIES = {"Technology": "IT"}
+
+def data_version(paths=MODEL_FILES):
+    """Modification times of the files cached data is built from"""
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in paths)
 
 @st.cache_resource
-def load_ai_model():
+def load_database():
+    # Schema checks run once per process instead of once per rerun
+    init_database()
+    return DB_PATH
+
+@st.cache_resource(max_entries=1)
+def load_ai_model(version):
+    # max_entries=1 drops the model built from the previous data version
     return MockAIModel()
 
-ai_model = load_ai_model()
+# Figures are cached as shared resources rather than pickled copies;
+# st.plotly_chart only reads them
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=64)
+def demand_chart(industry, version):
+    summary = load_ai_model(version).industry_summaries[industry]
+    return px.bar(summary["job_data"], x='Demand Score', y='title', orientation='h',
+                  title='Job Demand Scores', color='Demand Score',
+                  color_continuous_scale='RdYlGn')
+
+def skill_count_chart(skill_counts):
+    """Bar chart of (skill, number of jobs) pairs"""
+    skill_freq = dict(skill_counts)
+    fig_skills = px.bar(
+        x=list(skill_freq.values()),
+        y=list(skill_freq.keys()),
+        orientation='h',
+        title='Most In-Demand Skills',
+        labels={'x': 'Number of Jobs', 'y': 'Skill'},
+        color=list(skill_freq.values()),
+        color_continuous_scale='viridis'
+    )
+    fig_skills.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig_skills
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=64)
+def skills_chart(industry, version):
+    summary = load_ai_model(version).industry_summaries[industry]
+    return skill_count_chart((skill, len(related_jobs)) for skill, related_jobs in summary["skill_jobs"])
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=64)
+def catalog_rollup(industry, location, version):
+    """Job counts and top skills of an industry from the job catalog rollups
+
+    None when there is no catalog or it lists no such jobs.
+    """
+    if version[0] is None:
+        return None
+    try:
+        summary = job_catalog.industry_summary(industry, location)
+        if not summary["jobs"]:
+            return None
+        return {**summary, "top_skills": job_catalog.top_skills(industry, location, limit=15)}
+    except sqlite3.OperationalError:
+        # Catalogs loaded before the rollups existed get them on their next load
+        return None
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=64)
+def catalog_skills_chart(industry, location, version):
+    return skill_count_chart(catalog_rollup(industry, location, version)["top_skills"])
+
+@st.cache_resource
+def load_pathway_index():
+    return PathwayIndex()
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=64)
+def education_recommendations(industry, version):
+    """(pathway, related skill) pairs per pathway category for an industry's skills"""
+    jobs = load_ai_model(version).industries[industry]["jobs"]
+    unique_skills = sorted({skill for job in jobs for skill in job.get("skills", [])})
+    return load_pathway_index().resolve(unique_skills)
+
+# Initialize database
+load_database()
+
+DATA_VERSION = data_version()
+CATALOG_VERSION = data_version(CATALOG_FILES)
+ai_model = load_ai_model(DATA_VERSION)
 
 def show_navigation():
     # Create a container for the navigation bar
@@ -504,6 +619,38 @@ def industries_page():
             else:
                 st.error("Please fill in all fields")
 
+def pathway_cards(matches, icon, duration):
+    """HTML for a list of (pathway, related skill) cards"""
+    return "".join(f"""
+    <div style='background: linear-gradient(135deg, #1e293b, #334155);
+              padding: 1.5rem;
+              border-radius: 15px;
+              border: 1px solid #3b82f6;
+              margin: 1rem 0;
+              color: white;'>
+        <h4 style='margin:0;color:#3b82f6;'>{icon} {value}</h4>
+        <p style='margin:8px 0;color:#94a3b8;'>Related Skill: {skill}</p>
+        <p style='margin:0;font-size:0.9em;color:#64748b;'>⏱️ Duration: {duration}</p>
+    </div>
+    """ for value, skill in matches)
+
+def skill_card(skill, job_count, related_jobs=()):
+    """HTML card for a skill and the number of jobs requiring it"""
+    titles = (f"<p style='margin:0;font-size:0.9em;color:#64748b;'>{', '.join(related_jobs)}</p>"
+              if related_jobs else "")
+    return f"""
+    <div style='background: linear-gradient(135deg, #1e293b, #334155);
+              padding: 1rem;
+              border-radius: 10px;
+              border: 1px solid #3b82f6;
+              margin: 0.5rem 0;
+              color: white;'>
+        <h4 style='margin:0;color:#3b82f6;'>🔹 {skill}</h4>
+        <p style='margin:5px 0;color:#94a3b8;'>Required in {job_count} jobs{':' if related_jobs else ''}</p>
+        {titles}
+    </div>
+    """
+
 def display_results(industry, location):
     """Display analysis results"""
     st.markdown("---")
@@ -511,17 +658,35 @@ def display_results(industry, location):
     
     industry_data = ai_model.industries[industry]
     jobs = industry_data["jobs"]
-    
-    # Key metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Jobs Found", len(jobs))
-    with col2:
-        high_demand_jobs = [job for job in jobs if job["demand"] == "High"]
-        st.metric("High Demand Jobs", len(high_demand_jobs))
-    with col3:
-        avg_growth = sum([int(job["growth"].replace("+", "").replace("%", "")) for job in jobs]) / len(jobs)
-        st.metric("Avg Growth Rate", f"+{avg_growth:.0f}%")
+    summary = ai_model.industry_summaries[industry]
+    
+    # Catalog rollups for the entered city, else for the whole industry;
+    # without a catalog the metrics come from the model's sample jobs
+    catalog_industry = CATALOG_INDUSTRIES.get(industry, industry)
+    city = location.split(",")[0].strip()
+    for rollup_location in (city, None):
+        rollup = catalog_rollup(catalog_industry, rollup_location, CATALOG_VERSION)
+        if rollup is not None:
+            break
+    
+    # Key metrics: job counts from the catalog when it has them; growth
+    # only exists in the model's sample jobs, so it always comes from there
+    counts = rollup if rollup is not None else {"jobs": summary["total_jobs"],
+                                                "high_demand_jobs": summary["high_demand_jobs"]}
+    average_salary = rollup["average_salary"] if rollup is not None else None
+    columns = st.columns(4 if average_salary is not None else 3)
+    with columns[0]:
+        st.metric("Total Jobs Found", counts["jobs"])
+    with columns[1]:
+        st.metric("High Demand Jobs", counts["high_demand_jobs"])
+    with columns[2]:
+        st.metric("Avg Growth Rate", f"+{summary['avg_growth']:.0f}%")
+    if average_salary is not None:
+        # Extra metric the catalog adds; the three above are always shown
+        with columns[3]:
+            st.metric("Avg Starting Salary", f"{average_salary:,.0f}")
+    if rollup is not None and rollup_location is None:
+        st.caption(f"No {industry} jobs listed in {city}; showing all locations")
     
     # Results sections
     tab1, tab2, tab3 = st.tabs(["🎯 Demanding Jobs", "🛠️ Skills Needed", "🎓 Education Pathways"])
@@ -538,149 +703,41 @@ def display_results(industry, location):
             """, unsafe_allow_html=True)
         
         # Create a simple chart
-        job_data = pd.DataFrame(jobs)
-        demand_scores = {"High": 95, "Medium": 70, "Low": 40}
-        job_data['Demand Score'] = job_data['demand'].map(demand_scores)
-        
-        fig = px.bar(job_data, x='Demand Score', y='title', orientation='h',
-                    title='Job Demand Scores', color='Demand Score',
-                    color_continuous_scale='RdYlGn')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(demand_chart(industry, DATA_VERSION), use_container_width=True)
     
     with tab2:
         st.markdown("### Essential Skills in Demand")
         
-        # Collect all skills and their job associations
-        skill_job_map = {}
-        for job in jobs:
-            for skill in job["skills"]:
-                if skill not in skill_job_map:
-                    skill_job_map[skill] = []
-                skill_job_map[skill].append(job["title"])
-        
-        # Sort skills by frequency
-        sorted_skills = sorted(skill_job_map.items(), key=lambda x: len(x[1]), reverse=True)
-        
-        # Display skills with associated jobs
-        for skill, related_jobs in sorted_skills:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #1e293b, #334155);
-                      padding: 1rem;
-                      border-radius: 10px;
-                      border: 1px solid #3b82f6;
-                      margin: 0.5rem 0;
-                      color: white;'>
-                <h4 style='margin:0;color:#3b82f6;'>🔹 {skill}</h4>
-                <p style='margin:5px 0;color:#94a3b8;'>Required in {len(related_jobs)} jobs:</p>
-                <p style='margin:0;font-size:0.9em;color:#64748b;'>{', '.join(related_jobs)}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Create skills frequency chart
-        skill_freq = {skill: len(jobs) for skill, jobs in skill_job_map.items()}
-        fig_skills = px.bar(
-            x=list(skill_freq.values()),
-            y=list(skill_freq.keys()),
-            orientation='h',
-            title='Most In-Demand Skills',
-            labels={'x': 'Number of Jobs', 'y': 'Skill'},
-            color=list(skill_freq.values()),
-            color_continuous_scale='viridis'
-        )
-        fig_skills.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig_skills, use_container_width=True)
+        # Display skills with their job counts, most frequent first
+        if rollup is not None:
+            for skill, job_count in rollup["top_skills"]:
+                st.markdown(skill_card(skill, job_count), unsafe_allow_html=True)
+            st.plotly_chart(catalog_skills_chart(catalog_industry, rollup_location, CATALOG_VERSION),
+                            use_container_width=True)
+        else:
+            for skill, related_jobs in summary["skill_jobs"]:
+                st.markdown(skill_card(skill, len(related_jobs), related_jobs), unsafe_allow_html=True)
+            st.plotly_chart(skills_chart(industry, DATA_VERSION), use_container_width=True)
     
     with tab3:
         st.markdown("### 🎓 Recommended Education Pathways")
-        # Collect all skills from jobs - FIXED THIS PART
-        all_skills = []
-        for job in jobs:
-            if 'skills' in job:  # Changed from 'Skills_Required' to 'skills'
-                all_skills.extend(job['skills'])  # Direct access since it's already a list
-        
-        unique_skills = list(set(all_skills))
-        
-        # Define education pathways based on skills
-        education_pathways = {
-            'Degree Programs': {
-                'Python': 'BSc in Computer Science',
-                'Java': 'BSc in Software Engineering',
-                'Machine Learning': 'BSc in Data Science',
-                'SQL': 'BSc in Information Technology',
-                'Cloud': 'BSc in Cloud Computing'
-            },
-            'Professional Certifications': {
-                'AWS': 'AWS Certified Solutions Architect',
-                'Azure': 'Microsoft Azure Fundamentals',
-                'Python': 'Python Professional Certification',
-                'Java': 'Oracle Certified Professional',
-                'Security': 'CompTIA Security+'
-            },
-            'Short Courses': {
-                'Web Development': 'Full Stack Development Bootcamp',
-                'Data Science': 'Data Science Specialization',
-                'DevOps': 'DevOps Engineering Course',
-                'UI/UX': 'UI/UX Design Bootcamp',
-                'Agile': 'Agile Project Management'
-            }
-        }
+        recommendations = education_recommendations(industry, DATA_VERSION)
         
         # Display recommendations in tabs
         degree_tab, cert_tab, course_tab = st.tabs(['🎯 Degrees', '📜 Certifications', '📚 Short Courses'])
         
-        with degree_tab:
-            st.markdown("**Recommended Degree Programs:**")
-            for skill in unique_skills:
-                for key, value in education_pathways['Degree Programs'].items():
-                    if key.lower() in skill.lower():
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #1e293b, #334155);
-                                  padding: 1.5rem;
-                                  border-radius: 15px;
-                                  border: 1px solid #3b82f6;
-                                  margin: 1rem 0;
-                                  color: white;'>
-                            <h4 style='margin:0;color:#3b82f6;'>🎓 {value}</h4>
-                            <p style='margin:8px 0;color:#94a3b8;'>Related Skill: {skill}</p>
-                            <p style='margin:0;font-size:0.9em;color:#64748b;'>⏱️ Duration: 3-4 years</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-        
-        with cert_tab:
-            st.markdown("**Recommended Professional Certifications:**")
-            for skill in unique_skills:
-                for key, value in education_pathways['Professional Certifications'].items():
-                    if key.lower() in skill.lower():
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #1e293b, #334155);
-                                  padding: 1.5rem;
-                                  border-radius: 15px;
-                                  border: 1px solid #3b82f6;
-                                  margin: 1rem 0;
-                                  color: white;'>
-                            <h4 style='margin:0;color:#3b82f6;'>📜 {value}</h4>
-                            <p style='margin:8px 0;color:#94a3b8;'>Related Skill: {skill}</p>
-                            <p style='margin:0;font-size:0.9em;color:#64748b;'>⏱️ Duration: 3-6 months</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-        
-        with course_tab:
-            st.markdown("**Recommended Short Courses:**")
-            for skill in unique_skills:
-                for key, value in education_pathways['Short Courses'].items():
-                    if key.lower() in skill.lower():
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #1e293b, #334155);
-                                  padding: 1.5rem;
-                                  border-radius: 15px;
-                                  border: 1px solid #3b82f6;
-                                  margin: 1rem 0;
-                                  color: white;'>
-                            <h4 style='margin:0;color:#3b82f6;'>📚 {value}</h4>
-                            <p style='margin:8px 0;color:#94a3b8;'>Related Skill: {skill}</p>
-                            <p style='margin:0;font-size:0.9em;color:#64748b;'>⏱️ Duration: 2-4 months</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+        pathway_tabs = [
+            (degree_tab, 'Degree Programs', "**Recommended Degree Programs:**", "🎓", "3-4 years"),
+            (cert_tab, 'Professional Certifications', "**Recommended Professional Certifications:**", "📜", "3-6 months"),
+            (course_tab, 'Short Courses', "**Recommended Short Courses:**", "📚", "2-4 months"),
+        ]
+        for tab, category, heading, icon, duration in pathway_tabs:
+            with tab:
+                st.markdown(heading)
+                # One markdown block per tab instead of one per pathway
+                if recommendations[category]:
+                    st.markdown(pathway_cards(recommendations[category], icon, duration),
+                                unsafe_allow_html=True)
 
 def signup_page():
     st.title("📝 Create Your Account")
@@ -0,0 +1,36 @@
+"""WSGI entry point for multi-process deployment of the model API.
+
+With gunicorn's preload_app (see gunicorn.conf.py) this module is imported
+once in the master process: every model is loaded there and the workers
+share those pages copy-on-write after fork.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import gc
+import logging
+
+import ai_model_api
+from ai_model_api import app, load_models
+
+logger = logging.getLogger(__name__)
+
+
+def preload_models():
+    """Load every model component up front and freeze it for fork sharing"""
+    if not load_models():
+        raise RuntimeError("Failed to load models")
+
+    # Pull lazy bundle components in now, so workers inherit them instead
+    # of each loading its own copy on first use
+    for artifacts in (ai_model_api.models, ai_model_api.encoders):
+        for name in list(artifacts):
+            artifacts[name]
+
+    # Move everything allocated so far out of the garbage collector's
+    # generations; otherwise GC passes in the workers write to every
+    # object header and un-share the pages
+    gc.freeze()
+    logger.info(f"Preloaded {len(ai_model_api.models)} models and frozen {gc.get_freeze_count()} objects")
+
+
+preload_models()